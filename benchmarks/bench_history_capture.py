@@ -0,0 +1,62 @@
+"""Cost of the history duplicate checks as the text grows.
+
+Each size stores one entry in a ``HistoryPanel``, then replays what
+``CaesarController._capture_history`` does when the same text is captured
+again: compare against the last snapshot and ask the panel to add it. A
+plain string comparison of two equal copies of the text is shown for
+reference; it is what the checks cost when they compared full sources::
+
+    python benchmarks/bench_history_capture.py --repeat 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PyQt6 import QtWidgets
+
+from caesarcipher.core.fingerprint import text_fingerprint
+from caesarcipher.ui.widgets.history_panel import HistoryEntry, HistoryPanel
+
+SIZES = (64 * 1024, 1024 * 1024, 8 * 1024 * 1024)
+
+
+def _timed(action: Callable[[], object], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])  # noqa: F841
+    print(f"{'chars':>10} {'entry == last':>14} {'add duplicate':>14} {'str == str':>12}")
+    for size in SIZES:
+        text = ("the quick brown fox jumps over the lazy dog " * (size // 44 + 1))[:size]
+        copy = "".join(reversed(text))[::-1]  # equal content, separate object
+        panel = HistoryPanel()
+        last = HistoryEntry(mode="ENC", shift=3, letters=0, words=0, source=text)
+        panel.add_entry(last)
+        pending = HistoryEntry(mode="ENC", shift=3, letters=0, words=0, source=copy, fingerprint=text_fingerprint(copy))
+
+        compare = _timed(lambda last=last, pending=pending: last == pending, args.repeat)
+        duplicate = _timed(lambda panel=panel, pending=pending: panel.add_entry(pending), args.repeat)
+        full = _timed(lambda text=text, copy=copy: text == copy, max(1, args.repeat // 10))
+        assert panel.count() == 1
+        print(f"{size:>10} {compare * 1e6:>11.2f} us {duplicate * 1e6:>11.2f} us {full * 1e6:>9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Cost of adding entries to a large ``HistoryPanel``.
+
+Fills a visible panel up to its limit and beyond (so every further add also
+evicts the oldest entry), then measures painting and scrolling::
+
+    python benchmarks/bench_history_panel.py --entries 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PyQt6 import QtWidgets
+
+from caesarcipher.ui.widgets.history_panel import HistoryEntry, HistoryPanel
+
+
+def _entry(idx: int) -> HistoryEntry:
+    source = f"message number {idx} for the history benchmark"
+    return HistoryEntry(mode="ENC", shift=3, letters=len(source), words=6, source=source, result=source.upper())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    panel = HistoryPanel(max_entries=args.entries)
+    panel.resize(320, 600)
+    panel.show()
+
+    started = time.perf_counter()
+    for idx in range(args.entries):
+        panel.add_entry(_entry(idx))
+    app.processEvents()
+    fill = (time.perf_counter() - started) / args.entries
+
+    started = time.perf_counter()
+    for idx in range(args.entries, args.entries + 1000):
+        panel.add_entry(_entry(idx))
+        app.processEvents()
+    evict = (time.perf_counter() - started) / 1000
+
+    started = time.perf_counter()
+    for _ in range(100):
+        panel.scrollToBottom()
+        app.processEvents()
+        panel.scrollToTop()
+        app.processEvents()
+    scroll = (time.perf_counter() - started) / 200
+
+    print(f"entries kept:                 {panel.count():8d}")
+    print(f"add while filling:            {fill * 1e6:8.1f} us")
+    print(f"add + evict + repaint:        {evict * 1e6:8.1f} us")
+    print(f"scroll end to end + repaint:  {scroll * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Latency of the persistent history: queued adds, paging and search.
+
+Fills a throwaway ``HistoryStore`` with random phrases, then times what the
+GUI thread does: queueing an add (the history timer's cost), loading the
+next page while scrolling, and re-running a search from the search box::
+
+    python benchmarks/bench_history_store.py --entries 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PyQt6 import QtCore, QtWidgets
+
+from caesarcipher.logic.history_store import HistoryStore
+from caesarcipher.ui.widgets.history_panel import HistoryEntry, HistoryPanel
+
+WORDS = ("alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet", "kilo", "lima", "mike")
+QUERIES = ("char", "charlie delta", "n99", "zzz")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=10_000)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        store = HistoryStore(os.path.join(directory, "history.sqlite3"), max_entries=args.entries)
+        entries = [
+            HistoryEntry("ENC", 3, 0, 0, " ".join(rng.choice(WORDS) for _ in range(8)) + f" n{idx}")
+            for idx in range(args.entries)
+        ]
+        started = time.perf_counter()
+        for entry in entries:
+            store.add(entry)
+        queued = (time.perf_counter() - started) / args.entries
+        store.flush()
+        written = time.perf_counter() - started
+
+        panel = HistoryPanel(store=store, max_entries=args.entries)
+        panel.show()
+        model = panel.history_model()
+        started = time.perf_counter()
+        pages = 0
+        while model.canFetchMore(QtCore.QModelIndex()):
+            model.fetchMore(QtCore.QModelIndex())
+            pages += 1
+        page = (time.perf_counter() - started) / max(pages, 1)
+
+        print(f"queue one add (GUI thread):  {queued * 1e6:8.1f} us")
+        print(f"write {args.entries} entries:       {written * 1e3:8.1f} ms")
+        print(f"load one more page:          {page * 1e3:8.2f} ms")
+        search_box = panel.search_box
+        assert search_box is not None
+        for query in QUERIES:
+            started = time.perf_counter()
+            search_box.setText(query)
+            app.processEvents()
+            elapsed = time.perf_counter() - started
+            print(f"search {query!r:<16} {panel.count():5d} rows {elapsed * 1e3:8.2f} ms")
+            search_box.clear()
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
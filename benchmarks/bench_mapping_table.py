@@ -0,0 +1,62 @@
+"""Per-keystroke cost of ``MappingTableWidget`` updates.
+
+Runs on the same offscreen Qt platform as ``tests/conftest.py`` and replays
+what the controller does for each keystroke (new highlight set, then
+``update_mapping``) as well as a shift change, which repaints every cell::
+
+    python benchmarks/bench_mapping_table.py --keystrokes 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PyQt6 import QtWidgets
+
+from caesarcipher.core.crypto import LOWER
+from caesarcipher.ui.widgets.mapping_table import MappingTableWidget
+
+
+def _shifted(shift: int) -> str:
+    return LOWER[shift:] + LOWER[:shift]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keystrokes", type=int, default=5000)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    table = MappingTableWidget()
+    table.show()
+    shifted = _shifted(3)
+    table.update_mapping(shifted, encode_mode=True)
+
+    highlights: set[int] = set()
+    started = time.perf_counter()
+    for stroke in range(args.keystrokes):
+        highlights = highlights ^ {stroke % 26}
+        table.set_highlights(highlights)
+        table.update_mapping(shifted, encode_mode=True)
+    app.processEvents()
+    keystroke = (time.perf_counter() - started) / args.keystrokes
+
+    started = time.perf_counter()
+    for stroke in range(args.keystrokes):
+        table.update_mapping(_shifted(stroke % 25 + 1), encode_mode=True)
+    app.processEvents()
+    shift_change = (time.perf_counter() - started) / args.keystrokes
+
+    print(f"keystroke (one highlight changes): {keystroke * 1e6:8.1f} us")
+    print(f"shift change (all cells repaint):  {shift_change * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Throughput benchmark for ``caesar --jsonl``.
+
+Generates a synthetic JSON Lines file of the requested size and times
+``transform_jsonl`` single-process and with a worker pool::
+
+    python benchmarks/bench_jsonl.py --size-mb 256 --jobs 1 4 8
+
+The 10 GB figure quoted in the CLI docs comes from ``--size-mb 10240``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from caesarcipher.records import transform_jsonl
+
+
+def _generate(path: str, size_mb: int) -> int:
+    record = {
+        "ts": "2025-01-01T00:00:00Z",
+        "level": "info",
+        "message": "User logged in from the north gate with a valid badge",
+        "user": {"id": 12345, "note": "Prefers the quiet desk near the window"},
+    }
+    line = json.dumps(record) + "\n"
+    target = size_mb * 1024 * 1024
+    written = 0
+    with open(path, "w", encoding="utf-8") as handle:
+        while written < target:
+            handle.write(line * 1000)
+            written += len(line) * 1000
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, "events.jsonl")
+        size = _generate(source, args.size_mb)
+        for jobs in args.jobs:
+            started = time.perf_counter()
+            with open(source, encoding="utf-8", newline="") as reader, open(
+                os.devnull, "w", encoding="utf-8"
+            ) as writer:
+                report = transform_jsonl(reader, writer, 3, fields=["message", "user.note"], jobs=jobs)
+            elapsed = time.perf_counter() - started
+            print(
+                f"jobs={jobs:<3} records={report.records:<10} {elapsed:7.2f}s "
+                f"{size / 1024 / 1024 / elapsed:8.1f} MiB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,21 @@
 
 from importlib import metadata
 
-from .core import LOWER_ALPHABET, UPPER_ALPHABET, caesar, decode, encode, mapping_pairs
+from .codec import register as register_codec
+from .core import (
+    LOWER_ALPHABET,
+    UPPER_ALPHABET,
+    TransformStats,
+    byte_table,
+    caesar,
+    caesar_bytes,
+    decode,
+    encode,
+    mapping_pairs,
+    translation_table,
+)
+from .fileio import CaesarFile
+from .stream import caesar_iter_async, caesar_stream_async
 
 try:
     __version__ = metadata.version("caesar-cli")
@@ -11,9 +25,17 @@ except metadata.PackageNotFoundError:  # pragma: no cover - during local dev
 
 __all__ = [
     "caesar",
+    "caesar_bytes",
     "encode",
     "decode",
     "mapping_pairs",
+    "translation_table",
+    "byte_table",
+    "TransformStats",
+    "caesar_stream_async",
+    "caesar_iter_async",
+    "register_codec",
+    "CaesarFile",
     "LOWER_ALPHABET",
     "UPPER_ALPHABET",
     "__version__",
@@ -0,0 +1,183 @@
+"""Stream tar and zip archives member by member through the cipher."""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import posixpath
+import shutil
+import tarfile
+import zipfile
+from dataclasses import dataclass
+from typing import IO, Sequence
+
+from .core import byte_table
+from .stream import DEFAULT_CHUNK_SIZE, PathLike, same_file
+
+_TAR_WRITE_MODES = {
+    ".tar": "w|",
+    ".tgz": "w|gz",
+    ".tar.gz": "w|gz",
+    ".tbz2": "w|bz2",
+    ".tar.bz2": "w|bz2",
+    ".txz": "w|xz",
+    ".tar.xz": "w|xz",
+}
+
+
+@dataclass
+class ArchiveReport:
+    """Member counts for :func:`transform_archive`."""
+
+    transformed: int = 0
+    copied: int = 0
+    other: int = 0
+
+
+class _TranslatingReader:
+    """File-like adaptor applying a byte table to everything read."""
+
+    def __init__(self, source: IO[bytes], table: bytes) -> None:
+        self._source = source
+        self._table = table
+
+    def read(self, size: int = -1) -> bytes:
+        return self._source.read(size).translate(self._table)
+
+
+def archive_kind(path: PathLike) -> str | None:
+    """Return ``"zip"``, ``"tar"`` or ``None`` based on the file name."""
+
+    name = os.fspath(path).lower()
+    if name.endswith(".zip"):
+        return "zip"
+    if any(name.endswith(suffix) for suffix in _TAR_WRITE_MODES):
+        return "tar"
+    return None
+
+
+def should_copy(name: str, copy_globs: Sequence[str]) -> bool:
+    """Return ``True`` when member ``name`` matches one of ``copy_globs``.
+
+    Patterns containing ``/`` match the full member path; others match the
+    base name, so ``*.png`` covers images in every directory.
+    """
+
+    base = posixpath.basename(name)
+    for pattern in copy_globs:
+        candidate = name if "/" in pattern else base
+        if fnmatch.fnmatchcase(candidate, pattern):
+            return True
+    return False
+
+
+def transform_archive(
+    source: PathLike,
+    target: PathLike,
+    shift: int,
+    *,
+    encode: bool = True,
+    copy_globs: Sequence[str] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ArchiveReport:
+    """Write ``target`` with every regular member of ``source`` transformed.
+
+    Members are streamed with bounded buffers and never extracted to disk.
+    Names, permissions, timestamps and ownership are kept; members matching
+    ``copy_globs`` (e.g. ``*.png``) are copied through unchanged. The archive
+    format of each side is chosen from its file name, so a ``.tar.gz`` can be
+    rewritten as ``.tar.xz``; tar and zip cannot be mixed.
+
+    Raises:
+        ValueError: If either path is not a recognised archive name, the
+            formats differ, or both name the same file (the output would be
+            truncated before the input is read).
+    """
+
+    source_kind, target_kind = archive_kind(source), archive_kind(target)
+    if source_kind is None or target_kind is None:
+        raise ValueError("archives must end in .zip, .tar, .tar.gz/.tgz, .tar.bz2/.tbz2 or .tar.xz/.txz")
+    if source_kind != target_kind:
+        raise ValueError("cannot convert between tar and zip archives")
+    if same_file(source, target):
+        raise ValueError(f"cannot write {os.fspath(target)} over its own input")
+    table = byte_table(shift, encode=encode)
+    if source_kind == "zip":
+        return _transform_zip(source, target, table, copy_globs, chunk_size)
+    return _transform_tar(source, target, table, copy_globs, chunk_size)
+
+
+def _transform_tar(
+    source: PathLike,
+    target: PathLike,
+    table: bytes,
+    copy_globs: Sequence[str],
+    chunk_size: int,
+) -> ArchiveReport:
+    report = ArchiveReport()
+    write_mode = _tar_write_mode(target)
+    with tarfile.open(source, "r|*", bufsize=chunk_size) as reader, tarfile.open(
+        target, write_mode, bufsize=chunk_size  # type: ignore[call-overload]
+    ) as writer:
+        for member in reader:
+            if not member.isfile():
+                writer.addfile(member)
+                report.other += 1
+                continue
+            payload = reader.extractfile(member)
+            if payload is None:  # pragma: no cover - isfile() members always have data
+                writer.addfile(member)
+                report.other += 1
+            elif should_copy(member.name, copy_globs):
+                writer.addfile(member, payload)
+                report.copied += 1
+            else:
+                writer.addfile(member, _TranslatingReader(payload, table))
+                report.transformed += 1
+    return report
+
+
+def _tar_write_mode(path: PathLike) -> str:
+    name = os.fspath(path).lower()
+    for suffix in sorted(_TAR_WRITE_MODES, key=len, reverse=True):
+        if name.endswith(suffix):
+            return _TAR_WRITE_MODES[suffix]
+    raise ValueError(f"not a tar archive name: {path}")
+
+
+def _transform_zip(
+    source: PathLike,
+    target: PathLike,
+    table: bytes,
+    copy_globs: Sequence[str],
+    chunk_size: int,
+) -> ArchiveReport:
+    report = ArchiveReport()
+    with zipfile.ZipFile(source) as reader, zipfile.ZipFile(target, "w") as writer:
+        writer.comment = reader.comment
+        for info in reader.infolist():
+            clone = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+            clone.compress_type = info.compress_type
+            clone.external_attr = info.external_attr
+            clone.create_system = info.create_system
+            clone.comment = info.comment
+            if info.is_dir():
+                writer.writestr(clone, b"")
+                report.other += 1
+                continue
+            copy = should_copy(info.filename, copy_globs)
+            large = info.file_size >= zipfile.ZIP64_LIMIT
+            with reader.open(info) as src, writer.open(clone, "w", force_zip64=large) as dst:
+                if copy:
+                    shutil.copyfileobj(src, dst, chunk_size)
+                else:
+                    for chunk in iter(lambda: src.read(chunk_size), b""):
+                        dst.write(chunk.translate(table))
+            if copy:
+                report.copied += 1
+            else:
+                report.transformed += 1
+    return report
+
+
+__all__ = ["ArchiveReport", "archive_kind", "should_copy", "transform_archive"]
@@ -0,0 +1,155 @@
+"""Directory batch mode: mirror a source tree through the cipher with a worker pool."""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from .stream import DEFAULT_CHUNK_SIZE, PathLike, transform_file
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+@dataclass
+class BatchReport:
+    """Aggregate outcome of a batch run."""
+
+    files: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    failures: List[Tuple[Path, str]] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Processed MiB per second (0 when nothing was timed)."""
+        if self.seconds <= 0:
+            return 0.0
+        return self.bytes / (1024 * 1024) / self.seconds
+
+    def summary(self) -> str:
+        text = (
+            f"Processed {self.files} file(s), {self.bytes} bytes in {self.seconds:.2f}s "
+            f"({self.throughput:.1f} MiB/s)"
+        )
+        if self.failures:
+            text += f"; {len(self.failures)} failed"
+        return text
+
+
+def iter_source_files(source_dir: PathLike, *, exclude: Optional[PathLike] = None) -> Iterator[Path]:
+    """Yield regular files below ``source_dir`` in a stable order.
+
+    ``exclude`` prunes a directory (typically the output tree when it is nested
+    inside the source) from the walk.
+    """
+
+    excluded = Path(exclude).resolve() if exclude is not None else None
+    for root, dirs, files in os.walk(source_dir):
+        if excluded is not None:
+            dirs[:] = [name for name in dirs if (Path(root) / name).resolve() != excluded]
+        dirs.sort()
+        for name in sorted(files):
+            path = Path(root) / name
+            if path.is_file():
+                yield path
+
+
+def check_output_dir(source_dir: PathLike, output_dir: PathLike) -> None:
+    """Raise ``ValueError`` if outputs written below ``output_dir`` could land on sources.
+
+    An output tree nested inside the source is fine because the walk prunes
+    it. The source directory itself, or any directory containing it, would
+    have outputs truncate source files before they are read.
+    """
+
+    source = Path(source_dir).resolve()
+    output = Path(output_dir).resolve()
+    if output == source or output in source.parents:
+        raise ValueError(f"output directory {output_dir} overlaps the source tree {source_dir}")
+
+
+def run_pool(
+    func: Callable[[_T], _R],
+    items: Iterable[_T],
+    *,
+    jobs: int,
+    on_done: Callable[[_T, "Future[_R]"], None],
+) -> None:
+    """Run ``func`` over ``items`` with at most ``2 * jobs`` tasks in flight.
+
+    Submission is throttled so huge trees never materialise one future per
+    file; ``on_done`` is called on the submitting thread as tasks finish.
+    """
+
+    limit = max(1, jobs) * 2
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        pending: Dict["Future[_R]", _T] = {}
+        for item in items:
+            if len(pending) >= limit:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    on_done(pending.pop(future), future)
+            pending[pool.submit(func, item)] = item
+        finished, _ = wait(pending)
+        for future in finished:
+            on_done(pending.pop(future), future)
+
+
+def run_batch(
+    source_dir: PathLike,
+    output_dir: PathLike,
+    shift: int,
+    *,
+    encode: bool = True,
+    jobs: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_error: Optional[Callable[[Path, Exception], None]] = None,
+) -> BatchReport:
+    """Transform every file below ``source_dir`` into ``output_dir``.
+
+    The directory structure is mirrored and permission bits are preserved.
+    A failing file is recorded (and passed to ``on_error``) without aborting
+    the rest of the batch.
+
+    Raises:
+        ValueError: If ``output_dir`` is ``source_dir`` or one of its parents.
+    """
+
+    check_output_dir(source_dir, output_dir)
+    source_root = Path(source_dir)
+    output_root = Path(output_dir)
+    report = BatchReport()
+
+    def process(path: Path) -> int:
+        target = output_root / path.relative_to(source_root)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        return transform_file(path, target, shift, encode=encode, chunk_size=chunk_size)
+
+    def record(path: Path, future: "Future[int]") -> None:
+        try:
+            size = future.result()
+        except Exception as exc:  # noqa: BLE001 - reported per file
+            report.failures.append((path, str(exc)))
+            if on_error is not None:
+                on_error(path, exc)
+        else:
+            report.files += 1
+            report.bytes += size
+
+    started = time.perf_counter()
+    run_pool(
+        process,
+        iter_source_files(source_root, exclude=output_root),
+        jobs=jobs or os.cpu_count() or 1,
+        on_done=record,
+    )
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+__all__ = ["BatchReport", "check_output_dir", "iter_source_files", "run_batch", "run_pool"]
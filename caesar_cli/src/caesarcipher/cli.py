@@ -3,11 +3,37 @@
 from __future__ import annotations
 
 import argparse
+import csv
+import io
+import json
+import os
 import sys
-from typing import Callable, Iterable, Sequence, Tuple, cast
+import tarfile
+import zipfile
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Sequence, TextIO, Tuple, cast
 
 from . import __version__
-from .core import decode, encode, mapping_pairs
+from .archive import transform_archive
+from .batch import run_batch
+from .core import TransformStats, decode, encode, mapping_pairs
+from .follow import DEFAULT_FLUSH_MS, follow
+from .records import parse_columns, transform_csv, transform_jsonl
+from .resume import resumable_transform
+from .scoped import compile_pattern, transform_matches
+from .stream import (
+    COMPRESSION_ERRORS,
+    DEFAULT_CHUNK_SIZE,
+    ChunkObserver,
+    is_compressed,
+    open_binary,
+    same_file,
+    transform_path,
+)
+from .sync import sync_tree
+from .verify import RoundTripVerifier, write_sidecar
 
 Printer = Callable[[str], None]
 
@@ -16,9 +42,161 @@ def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="caesar",
         description="Encode or decode text using the classic Caesar cipher.",
-        epilog="Tip: omit TEXT and pipe input via stdin to work with files.",
+        epilog="Tip: omit TEXT and pipe input via stdin to work with files. "
+        "Run 'caesar sync --help' for incremental directory sync; "
+        "to encode the word 'sync' itself, put an option first ('caesar -s 3 sync').",
     )
+    _add_cipher_arguments(parser)
 
+    parser.add_argument(
+        "text",
+        nargs="?",
+        help="Source text. If omitted, data is read from stdin or you will be prompted.",
+    )
+    parser.add_argument("--show-mapping", action="store_true", help="Display the alphabet mapping table before output.")
+    parser.add_argument("--no-color", action="store_true", help="Disable colored output (auto-disabled when piping).")
+    parser.add_argument(
+        "--input",
+        type=str,
+        help="Read text from file instead of the TEXT argument or stdin (.gz/.bz2/.xz are decompressed).",
+    )
+    parser.add_argument(
+        "--output",
+        "--out",
+        type=str,
+        help="Write result to file instead of stdout (overwrites; .gz/.bz2/.xz are compressed).",
+    )
+    parser.add_argument(
+        "--archive",
+        metavar="ARCHIVE",
+        help="Transform every member of a tar/zip ARCHIVE into --out (same format family).",
+    )
+    parser.add_argument(
+        "--copy",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="With --archive: copy members matching GLOB (e.g. '*.png') unchanged. Repeatable.",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Read and decompress --input on a background thread while transforming.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Checkpoint --input → --output progress in a journal and continue an interrupted run.",
+    )
+    parser.add_argument(
+        "--recursive",
+        metavar="SRC_DIR",
+        help="Transform every file below SRC_DIR into --out-dir, mirroring the tree.",
+    )
+    parser.add_argument("--out-dir", metavar="DST_DIR", help="Destination directory for --recursive.")
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        metavar="N",
+        help="Workers for --recursive (default: CPU count) or --jsonl parsing (default: single process).",
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Treat input as JSON Lines and rotate only the --field values.",
+    )
+    parser.add_argument(
+        "--field",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="With --jsonl: dotted field path to rotate (e.g. user.note). Repeatable.",
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Treat input as CSV and rotate only the --columns values (dialect is sniffed).",
+    )
+    parser.add_argument("--tsv", action="store_true", help="Like --csv with a tab delimiter.")
+    parser.add_argument(
+        "--columns",
+        metavar="LIST",
+        help="With --csv/--tsv: comma-separated header names or zero-based indexes to rotate.",
+    )
+    parser.add_argument(
+        "--no-header",
+        action="store_true",
+        help="With --csv/--tsv: the first row is data, not a header (use indexes in --columns).",
+    )
+    parser.add_argument(
+        "--shift-field",
+        metavar="PATH",
+        help="With --jsonl: take each record's shift from this field, falling back to --shift.",
+    )
+    parser.add_argument(
+        "--match",
+        metavar="REGEX",
+        help="Rotate only the text matched by REGEX on each line; other lines are copied unchanged.",
+    )
+    parser.add_argument(
+        "--group",
+        type=int,
+        default=None,
+        metavar="N",
+        help="With --match: rotate only capture group N of each match (default: the whole match).",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Report bytes, lines, words and a letter histogram of the input, gathered in the same pass.",
+    )
+    parser.add_argument(
+        "--stats-json",
+        metavar="FILE",
+        help="Write the --stats counts as JSON to FILE (implies --stats).",
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Keep mirroring --input into --output as it grows, like tail -f (handles log rotation).",
+    )
+    parser.add_argument(
+        "--flush-ms",
+        type=_positive_int,
+        default=None,
+        metavar="MS",
+        help=f"With --follow: flush output at least this often while data arrives (default: {DEFAULT_FLUSH_MS}).",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Prove the output decodes back to the input: hash both in the same pass "
+        "and write the digests to OUTPUT.verify.json (exit 1 on mismatch).",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("--about", action="store_true", help="Show project information and exit.")
+    return parser
+
+
+def _build_sync_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="caesar sync",
+        description="Incrementally mirror SRC into DST, transforming only new or changed files.",
+    )
+    parser.add_argument("source", metavar="SRC", help="Source directory.")
+    parser.add_argument("destination", metavar="DST", help="Output directory (holds the manifest).")
+    _add_cipher_arguments(parser)
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        metavar="N",
+        help="Worker threads (default: CPU count).",
+    )
+    parser.add_argument("--no-color", action="store_true", help="Disable colored output.")
+    return parser
+
+
+def _add_cipher_arguments(parser: argparse.ArgumentParser) -> None:
     shift_group = parser.add_mutually_exclusive_group(required=False)
     shift_group.add_argument("-s", "--shift", type=int, help="Shift amount (1-25).")
     shift_group.add_argument(
@@ -32,23 +210,14 @@ def _build_parser() -> argparse.ArgumentParser:
     mode_group.add_argument("-e", "--encode", action="store_true", help="Force encode mode (default).")
     mode_group.add_argument("-d", "--decode", action="store_true", help="Decode text instead of encoding.")
 
-    parser.add_argument(
-        "text",
-        nargs="?",
-        help="Source text. If omitted, data is read from stdin or you will be prompted.",
-    )
-    parser.add_argument("--show-mapping", action="store_true", help="Display the alphabet mapping table before output.")
-    parser.add_argument("--no-color", action="store_true", help="Disable colored output (auto-disabled when piping).")
-    parser.add_argument("--input", type=str, help="Read text from file instead of the TEXT argument or stdin.")
-    parser.add_argument("--output", type=str, help="Write result to file instead of stdout (overwrites).")
-    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
-    parser.add_argument("--about", action="store_true", help="Show project information and exit.")
-    return parser
-
 
 def main(argv: Iterable[str] | None = None) -> int:
+    cli_args: Sequence[str] = list(argv) if argv is not None else sys.argv[1:]
+    # Only a leading "sync" selects the subcommand; "caesar -s 3 sync" encodes the word.
+    if cli_args and cli_args[0] == "sync":
+        return sync_main(cli_args[1:])
+
     parser = _build_parser()
-    cli_args: Sequence[str] | None = list(argv) if argv is not None else None
     args = parser.parse_args(cli_args)
 
     printer, color_enabled = _get_printer(not args.no_color and sys.stdout.isatty())
@@ -61,6 +230,116 @@ def main(argv: Iterable[str] | None = None) -> int:
 
     if args.input and args.text is not None:
         parser.error("Specify either TEXT or --input, not both.")
+    stats = TransformStats() if args.stats or args.stats_json else None
+    if stats is not None and (
+        args.recursive
+        or args.archive
+        or args.jsonl
+        or args.csv
+        or args.tsv
+        or args.match is not None
+        or args.resume
+        or args.follow
+    ):
+        parser.error("--stats/--stats-json only apply to plain TEXT, stdin or --input transforms.")
+    if args.verify and (
+        not (args.input and args.output)
+        or args.recursive
+        or args.archive
+        or args.jsonl
+        or args.csv
+        or args.tsv
+        or args.match is not None
+        or args.resume
+        or args.follow
+    ):
+        parser.error("--verify requires --input and --output and applies to plain transforms only.")
+
+    modes = [
+        flag
+        for flag, selected in (
+            ("--recursive", args.recursive),
+            ("--archive", args.archive),
+            ("--jsonl", args.jsonl),
+            ("--csv", args.csv),
+            ("--tsv", args.tsv),
+            ("--match", args.match is not None),
+            ("--follow", args.follow),
+            ("--resume", args.resume),
+        )
+        if selected
+    ]
+    if len(modes) > 1:  # each mode returns early, so the others would be silently ignored
+        parser.error(f"{modes[0]} cannot be combined with {modes[1]}.")
+
+    # Options of one mode are checked before any mode runs and returns.
+    if args.out_dir and not args.recursive:
+        parser.error("--out-dir requires --recursive.")
+    if args.copy and not args.archive:
+        parser.error("--copy requires --archive.")
+    if (args.field or args.shift_field) and not args.jsonl:
+        parser.error("--field/--shift-field require --jsonl.")
+    if (args.columns or args.no_header) and not (args.csv or args.tsv):
+        parser.error("--columns/--no-header require --csv or --tsv.")
+    if args.group is not None and args.match is None:
+        parser.error("--group requires --match.")
+    if args.flush_ms is not None and not args.follow:
+        parser.error("--flush-ms requires --follow.")
+    if args.prefetch and (modes or not (args.input and args.output)):
+        parser.error("--prefetch requires --input and --output and applies to plain transforms only.")
+    if args.recursive:
+        if args.text is not None or args.input or args.output:
+            parser.error("--recursive cannot be combined with TEXT, --input or --output.")
+        if not args.out_dir:
+            parser.error("--recursive requires --out-dir.")
+        shift = _coerce_shift(args, parser)
+        return _run_batch(args, shift, not args.decode, printer)
+
+    if args.archive:
+        if args.text is not None or args.input:
+            parser.error("--archive cannot be combined with TEXT or --input.")
+        if not args.output:
+            parser.error("--archive requires --out.")
+        shift = _coerce_shift(args, parser)
+        return _run_archive(args, shift, not args.decode, printer)
+
+    if args.jsonl:
+        if args.text is not None:
+            parser.error("--jsonl reads --input or stdin, not TEXT.")
+        if not args.field:
+            parser.error("--jsonl requires at least one --field.")
+        shift = _coerce_shift(args, parser)
+        return _run_jsonl(args, shift, not args.decode)
+
+    if args.csv or args.tsv:
+        if args.text is not None:
+            parser.error("--csv/--tsv read --input or stdin, not TEXT.")
+        if not args.columns:
+            parser.error("--csv/--tsv require --columns.")
+        shift = _coerce_shift(args, parser)
+        return _run_csv(args, shift, not args.decode)
+
+    if args.match is not None:
+        if args.text is not None:
+            parser.error("--match reads --input or stdin, not TEXT.")
+        shift = _coerce_shift(args, parser)
+        return _run_match(args, shift, not args.decode)
+
+    if args.follow:
+        if not (args.input and args.output):
+            parser.error("--follow requires both --input and --output.")
+        if is_compressed(args.input):
+            parser.error("--follow cannot read compressed input.")
+        shift = _coerce_shift(args, parser)
+        return _run_follow(args, shift, not args.decode)
+
+    if args.resume:
+        if not (args.input and args.output):
+            parser.error("--resume requires both --input and --output.")
+        if is_compressed(args.input) or is_compressed(args.output):
+            parser.error("--resume needs seekable files; it cannot be used with compressed paths.")
+        shift = _coerce_shift(args, parser)
+        return _run_resumable(args, shift, not args.decode)
 
     if (
         args.text is None
@@ -74,18 +353,43 @@ def main(argv: Iterable[str] | None = None) -> int:
     shift = _coerce_shift(args, parser)
     encode_mode = not args.decode
 
+    if args.show_mapping:
+        _print_mapping(shift, encode_mode, printer, color_enabled)
+
+    if args.input and args.output:
+        # File to file: stream in bounded chunks, never holding the whole text.
+        observers: List[ChunkObserver] = []
+        if stats is not None:
+            observers.append(stats.observe)
+        verifier = RoundTripVerifier(shift, encode=encode_mode) if args.verify else None
+        if verifier is not None:
+            observers.append(verifier.observe)
+        try:
+            transform_path(
+                args.input,
+                args.output,
+                shift,
+                encode=encode_mode,
+                observers=observers,
+                prefetch=args.prefetch,
+            )
+        except COMPRESSION_ERRORS as exc:
+            print(f"Error transforming {args.input}: {exc}", file=sys.stderr)
+            return 1
+        status = _report_stats(args, stats)
+        if verifier is not None:
+            status = _report_verification(args, verifier, shift, encode_mode) or status
+        return status
+
     if args.input:
         try:
-            with open(args.input, "r", encoding="utf-8") as handle:
-                text = handle.read()
-        except OSError as exc:  # pragma: no cover - filesystem errors
+            with open_binary(args.input) as handle:
+                text = _read_counted(handle, stats).decode("utf-8")
+        except (*COMPRESSION_ERRORS, UnicodeDecodeError) as exc:  # pragma: no cover - filesystem errors
             print(f"Error reading {args.input}: {exc}", file=sys.stderr)
             return 1
     else:
-        text = _resolve_text(args)
-
-    if args.show_mapping:
-        _print_mapping(shift, encode_mode, printer, color_enabled)
+        text = _resolve_text(args, stats)
 
     try:
         result = encode(text, shift) if encode_mode else decode(text, shift)
@@ -98,17 +402,270 @@ def main(argv: Iterable[str] | None = None) -> int:
 
     if args.output:
         try:
-            with open(args.output, "w", encoding="utf-8") as handle:
-                handle.write(result)
-        except OSError as exc:  # pragma: no cover - filesystem errors
+            with open_binary(args.output, "wb") as handle:
+                handle.write(result.encode("utf-8"))
+        except COMPRESSION_ERRORS as exc:  # pragma: no cover - filesystem errors
             print(f"Error writing {args.output}: {exc}", file=sys.stderr)
             return 1
     else:
         printer(result)
+    return _report_stats(args, stats)
+
 
+def sync_main(argv: Iterable[str] | None = None) -> int:
+    """Entry point for ``caesar sync SRC DST``."""
+
+    parser = _build_sync_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+    printer, _ = _get_printer(not args.no_color and sys.stdout.isatty())
+    shift = _coerce_shift(args, parser)
+    if not os.path.isdir(args.source):
+        print(f"Error: {args.source} is not a directory", file=sys.stderr)
+        return 1
+
+    try:
+        report = sync_tree(
+            args.source,
+            args.destination,
+            shift,
+            encode=not args.decode,
+            jobs=args.jobs,
+            on_error=_report_failure,
+        )
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    except OSError as exc:  # pragma: no cover - filesystem errors
+        print(f"Error syncing {args.destination}: {exc}", file=sys.stderr)
+        return 1
+    printer(report.summary())
+    return 1 if report.failures else 0
+
+
+def _report_stats(args: argparse.Namespace, stats: TransformStats | None) -> int:
+    if stats is None:
+        return 0
+    print(f"Stats: {stats.summary()}", file=sys.stderr)
+    top = sorted(stats.letters.items(), key=lambda item: (-item[1], item[0]))[:5]
+    if stats.letter_total:
+        print("Top letters: " + " ".join(f"{letter}={count}" for letter, count in top if count), file=sys.stderr)
+    if args.stats_json:
+        try:
+            with open(args.stats_json, "w", encoding="utf-8") as handle:
+                json.dump(stats.to_dict(), handle, indent=2)
+        except OSError as exc:
+            print(f"Error writing {args.stats_json}: {exc}", file=sys.stderr)
+            return 1
+    return 0
+
+
+def _report_verification(
+    args: argparse.Namespace, verifier: RoundTripVerifier, shift: int, encode_mode: bool
+) -> int:
+    written = None if is_compressed(args.output) else os.path.getsize(args.output)
+    report = verifier.report(written)
+    try:
+        sidecar = write_sidecar(
+            args.output,
+            report,
+            input=os.fspath(args.input),
+            output=os.fspath(args.output),
+            shift=shift,
+            encode=encode_mode,
+        )
+    except OSError as exc:
+        print(f"Error writing verification digests: {exc}", file=sys.stderr)
+        return 1
+    if not report.ok:
+        print(f"Verification FAILED for {args.output}; digests in {sidecar}", file=sys.stderr)
+        return 1
+    print(
+        f"Verified {report.bytes} bytes ({report.algorithm} {report.input_digest}); digests in {sidecar}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _report_failure(path: Path, exc: Exception) -> None:
+    print(f"Error processing {path}: {exc}", file=sys.stderr)
+
+
+def _check_distinct_output(args: argparse.Namespace) -> None:
+    if args.input and args.output and same_file(args.input, args.output):
+        raise ValueError(f"--output {args.output} would overwrite --input before it is read")
+
+
+@contextmanager
+def _text_streams(args: argparse.Namespace) -> Iterator[Tuple[TextIO, TextIO]]:
+    """Yield UTF-8 text streams for --input/--output, defaulting to stdin/stdout."""
+
+    _check_distinct_output(args)
+    with ExitStack() as stack:
+        if args.input:
+            source: TextIO = stack.enter_context(
+                io.TextIOWrapper(open_binary(args.input), encoding="utf-8", newline="")
+            )
+        else:
+            source = sys.stdin
+        if args.output:
+            target: TextIO = stack.enter_context(
+                io.TextIOWrapper(open_binary(args.output, "wb"), encoding="utf-8", newline="")
+            )
+        else:
+            target = sys.stdout
+        yield source, target
+
+
+@contextmanager
+def _binary_streams(args: argparse.Namespace) -> Iterator[Tuple[BinaryIO, BinaryIO]]:
+    """Yield binary streams for --input/--output, defaulting to stdin/stdout."""
+
+    _check_distinct_output(args)
+    with ExitStack() as stack:
+        source: BinaryIO = stack.enter_context(open_binary(args.input)) if args.input else sys.stdin.buffer
+        target: BinaryIO = stack.enter_context(open_binary(args.output, "wb")) if args.output else sys.stdout.buffer
+        yield source, target
+        target.flush()
+
+
+def _run_jsonl(args: argparse.Namespace, shift: int, encode_mode: bool) -> int:
+    try:
+        with _text_streams(args) as (source, target):
+            report = transform_jsonl(
+                source,
+                target,
+                shift,
+                fields=args.field,
+                encode=encode_mode,
+                shift_field=args.shift_field,
+                jobs=args.jobs,
+            )
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    except COMPRESSION_ERRORS as exc:
+        print(f"Error transforming records: {exc}", file=sys.stderr)
+        return 1
+    print(f"Rotated {report.fields} field value(s) in {report.records} record(s).", file=sys.stderr)
+    return 0
+
+
+def _run_csv(args: argparse.Namespace, shift: int, encode_mode: bool) -> int:
+    try:
+        columns = parse_columns(args.columns)
+        with _text_streams(args) as (source, target):
+            report = transform_csv(
+                source,
+                target,
+                shift,
+                columns=columns,
+                encode=encode_mode,
+                delimiter="\t" if args.tsv else None,
+                header=not args.no_header,
+            )
+    except (ValueError, csv.Error) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    except COMPRESSION_ERRORS as exc:
+        print(f"Error transforming rows: {exc}", file=sys.stderr)
+        return 1
+    print(f"Rotated {report.fields} cell(s) in {report.records} row(s).", file=sys.stderr)
+    return 0
+
+
+def _run_match(args: argparse.Namespace, shift: int, encode_mode: bool) -> int:
+    group = args.group or 0
+    try:
+        pattern = compile_pattern(args.match, group)
+        with _binary_streams(args) as (source, target):
+            report = transform_matches(source, target, pattern, shift, group=group, encode=encode_mode)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    except COMPRESSION_ERRORS as exc:
+        print(f"Error transforming lines: {exc}", file=sys.stderr)
+        return 1
+    print(
+        f"Rotated {report.spans} span(s) on {report.matched} of {report.lines} line(s).",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _run_archive(args: argparse.Namespace, shift: int, encode_mode: bool, printer: Printer) -> int:
+    try:
+        report = transform_archive(
+            args.archive,
+            args.output,
+            shift,
+            encode=encode_mode,
+            copy_globs=args.copy,
+        )
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    except (*COMPRESSION_ERRORS, tarfile.TarError, zipfile.BadZipFile) as exc:
+        print(f"Error transforming {args.archive}: {exc}", file=sys.stderr)
+        return 1
+    printer(
+        f"Archive written: {report.transformed} transformed, {report.copied} copied, "
+        f"{report.other} other member(s)"
+    )
+    return 0
+
+
+def _run_follow(args: argparse.Namespace, shift: int, encode_mode: bool) -> int:
+    flush_ms = args.flush_ms if args.flush_ms is not None else DEFAULT_FLUSH_MS
+    try:
+        report = follow(args.input, args.output, shift, encode=encode_mode, flush_ms=flush_ms)
+    except KeyboardInterrupt:
+        print("Stopped following.", file=sys.stderr)
+        return 0
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    except COMPRESSION_ERRORS as exc:
+        print(f"Error following {args.input}: {exc}", file=sys.stderr)
+        return 1
+    print(f"Followed {report.bytes} bytes across {report.rotations} rotation(s).", file=sys.stderr)
+    return 0
+
+
+def _run_resumable(args: argparse.Namespace, shift: int, encode_mode: bool) -> int:
+    try:
+        report = resumable_transform(args.input, args.output, shift, encode=encode_mode)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    except OSError as exc:
+        print(f"Error transforming {args.input}: {exc}", file=sys.stderr)
+        return 1
+    if report.resumed_from:
+        print(f"Resumed {args.output} from byte {report.resumed_from}.", file=sys.stderr)
     return 0
 
 
+def _run_batch(args: argparse.Namespace, shift: int, encode_mode: bool, printer: Printer) -> int:
+    if not os.path.isdir(args.recursive):
+        print(f"Error: {args.recursive} is not a directory", file=sys.stderr)
+        return 1
+
+    try:
+        report = run_batch(
+            args.recursive,
+            args.out_dir,
+            shift,
+            encode=encode_mode,
+            jobs=args.jobs,
+            on_error=_report_failure,
+        )
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    printer(report.summary())
+    return 1 if report.failures else 0
+
+
 def repl(
     default_shift: int = 3,
     show_mapping: bool = False,
@@ -200,6 +757,13 @@ def _get_printer(wants_color: bool) -> Tuple[Printer, bool]:
     return plain_print, False
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+
 def _coerce_shift(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
     if args.rot13:
         return 13
@@ -212,17 +776,47 @@ def _coerce_shift(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
     return shift
 
 
-def _resolve_text(args: argparse.Namespace) -> str:
-    if args.text is not None:
-        return cast(str, args.text)
+def _resolve_text(args: argparse.Namespace, stats: TransformStats | None = None) -> str:
+    """Return TEXT, piped stdin (trailing newlines stripped) or a prompted line.
 
-    if not sys.stdin.isatty():
-        return sys.stdin.read().rstrip("\n")
+    ``stats`` counts the text as it is read; piped stdin is counted as the
+    raw bytes received, before newline translation and stripping.
+    """
 
-    try:
-        return input("Text: ")
-    except EOFError:  # pragma: no cover - interactive edge case
-        return ""
+    if args.text is not None:
+        text = cast(str, args.text)
+    elif not sys.stdin.isatty():
+        return _read_stdin(stats).rstrip("\n")
+    else:
+        try:
+            text = input("Text: ")
+        except EOFError:  # pragma: no cover - interactive edge case
+            text = ""
+    if stats is not None:
+        stats.update(text.encode("utf-8"))
+    return text
+
+
+def _read_stdin(stats: TransformStats | None) -> str:
+    buffer = getattr(sys.stdin, "buffer", None)
+    if buffer is None:  # stdin replaced by a text-only stream
+        text = sys.stdin.read()
+        if stats is not None:
+            stats.update(text.encode("utf-8"))
+        return text
+    text = _read_counted(buffer, stats).decode(sys.stdin.encoding or "utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")  # as text-mode stdin would
+
+
+def _read_counted(handle: BinaryIO, stats: TransformStats | None) -> bytes:
+    """Read ``handle`` to the end, feeding each chunk to ``stats`` as it arrives."""
+
+    chunks = []
+    for chunk in iter(partial(handle.read, DEFAULT_CHUNK_SIZE), b""):
+        if stats is not None:
+            stats.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks)
 
 
 def _format_mapping(lines: Iterable[tuple[str, str]]) -> str:
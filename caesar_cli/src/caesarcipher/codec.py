@@ -0,0 +1,125 @@
+"""``codecs`` integration so Caesar text can be read and written like any encoding.
+
+Importing this module registers a search function for ``caesar-N`` and
+``rot-N`` style names (``N`` in 1-25). The codec stores text as UTF-8 with the
+ASCII letters rotated by ``N``, so ``open(path, "w", encoding="caesar-3")``
+writes cipher-text and ``open(path, encoding="caesar-3")`` reads it back as
+plain-text::
+
+    import caesarcipher.codec  # noqa: F401 - registers the codec
+
+    with open("secret.txt", "w", encoding="caesar-3") as handle:
+        handle.write("hello")
+
+The standard library's own ``rot13``/``rot_13`` codec is a ``str``-to-``str``
+transform and is found before this one; use ``caesar-13`` for a text encoding.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from functools import lru_cache
+from typing import Optional, Tuple, Type, TypeVar
+
+from .core import byte_table
+
+_T = TypeVar("_T")
+
+_NAME_PATTERN = re.compile(r"^(?:caesar|rot)_?(\d{1,2})$")
+
+
+class _CaesarCodec(codecs.Codec):
+    shift = 0
+
+    def encode(self, input: str, errors: str = "strict") -> Tuple[bytes, int]:
+        data = input.encode("utf-8", errors)
+        return data.translate(byte_table(self.shift)), len(input)
+
+    def decode(self, input: bytes, errors: str = "strict") -> Tuple[str, int]:
+        data = bytes(input).translate(byte_table(self.shift, encode=False))
+        return data.decode("utf-8", errors), len(input)
+
+
+class _IncrementalEncoder(codecs.IncrementalEncoder):
+    shift = 0
+
+    def encode(self, input: str, final: bool = False) -> bytes:
+        return input.encode("utf-8", self.errors).translate(byte_table(self.shift))
+
+
+class _IncrementalDecoder(codecs.BufferedIncrementalDecoder):
+    shift = 0
+
+    def _buffer_decode(self, input: bytes, errors: str, final: bool) -> Tuple[str, int]:  # type: ignore[override]
+        # The rotation maps bytes one-to-one, so the UTF-8 decoder's consumed
+        # count is also the number of cipher bytes consumed.
+        data = bytes(input).translate(byte_table(self.shift, encode=False))
+        return codecs.utf_8_decode(data, errors, final)
+
+
+class _StreamWriter(_CaesarCodec, codecs.StreamWriter):
+    pass
+
+
+class _StreamReader(_CaesarCodec, codecs.StreamReader):
+    def decode(self, input: bytes, errors: str = "strict") -> Tuple[str, int]:
+        # Chunks may end mid-character; leave the tail for the next read.
+        data = bytes(input).translate(byte_table(self.shift, encode=False))
+        return codecs.utf_8_decode(data, errors, False)
+
+
+@lru_cache(maxsize=None)
+def codec_info(shift: int) -> codecs.CodecInfo:
+    """Return the :class:`codecs.CodecInfo` for a Caesar shift of 1-25."""
+
+    byte_table(shift)  # validate the shift before building classes
+    name = f"caesar-{shift}"
+    codec = _bind(_CaesarCodec, shift)()
+    return codecs.CodecInfo(
+        name=name,
+        encode=codec.encode,
+        decode=codec.decode,  # type: ignore[arg-type]
+        incrementalencoder=_bind(_IncrementalEncoder, shift),
+        incrementaldecoder=_bind(_IncrementalDecoder, shift),
+        streamwriter=_bind(_StreamWriter, shift),
+        streamreader=_bind(_StreamReader, shift),
+    )
+
+
+def _bind(base: Type[_T], shift: int) -> Type[_T]:
+    """Return a subclass of ``base`` fixed to ``shift``."""
+
+    name = base.__name__.lstrip("_")
+    return type(name, (base,), {"shift": shift})
+
+
+def search(name: str) -> Optional[codecs.CodecInfo]:
+    """Codec search function resolving ``caesar-N`` / ``rot-N`` names."""
+
+    normalised = name.lower().replace("-", "_").replace(" ", "_")
+    match = _NAME_PATTERN.match(normalised)
+    if match is None:
+        return None
+    shift = int(match.group(1))
+    if not 1 <= shift <= 25:
+        return None
+    return codec_info(shift)
+
+
+_registered = False
+
+
+def register() -> None:
+    """Register :func:`search` with :mod:`codecs` (idempotent)."""
+
+    global _registered
+    if not _registered:
+        codecs.register(search)
+        _registered = True
+
+
+register()
+
+
+__all__ = ["codec_info", "register", "search"]
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from typing import List, Tuple
+import builtins
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 LOWER_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
 UPPER_ALPHABET = LOWER_ALPHABET.upper()
 _ALPHABET_SIZE = len(LOWER_ALPHABET)
+_LETTER_BYTES = [(letter, ord(letter), ord(letter.upper())) for letter in LOWER_ALPHABET]
+_WHITESPACE = b" \t\n\r\x0b\x0c"
 
 
 def _normalise_shift(shift: int) -> int:
@@ -29,21 +34,64 @@ def _normalise_shift(shift: int) -> int:
     return normalised
 
 
-def caesar(text: str, shift: int, *, encode: bool = True) -> str:
-    """Apply a Caesar cipher rotation to ``text``."""
+def _rotation(shift: int, encode: bool) -> int:
+    """Return the forward rotation (1-25) that implements ``shift`` in the given mode."""
 
     normalised = _normalise_shift(shift)
     if not encode:
         normalised = (-normalised) % _ALPHABET_SIZE
+    return normalised
+
+
+@lru_cache(maxsize=None)
+def _rotated_alphabets(rotation: int) -> Tuple[str, str]:
+    shifted_lower = LOWER_ALPHABET[rotation:] + LOWER_ALPHABET[:rotation]
+    shifted_upper = UPPER_ALPHABET[rotation:] + UPPER_ALPHABET[:rotation]
+    return LOWER_ALPHABET + UPPER_ALPHABET, shifted_lower + shifted_upper
+
+
+@lru_cache(maxsize=None)
+def _str_table(rotation: int) -> Dict[int, int]:
+    return str.maketrans(*_rotated_alphabets(rotation))
+
+
+@lru_cache(maxsize=None)
+def _bytes_table(rotation: int) -> bytes:
+    source, target = _rotated_alphabets(rotation)
+    return bytes.maketrans(source.encode("ascii"), target.encode("ascii"))
+
+
+def translation_table(shift: int, *, encode: bool = True) -> Dict[int, int]:
+    """Return the cached ``str.translate`` table for ``shift``.
+
+    Tables are built once per rotation and shared by every caller, so hot loops
+    can look them up freely.
+    """
+
+    return _str_table(_rotation(shift, encode))
+
 
-    shifted_lower = LOWER_ALPHABET[normalised:] + LOWER_ALPHABET[:normalised]
-    shifted_upper = UPPER_ALPHABET[normalised:] + UPPER_ALPHABET[:normalised]
+def byte_table(shift: int, *, encode: bool = True) -> bytes:
+    """Return the cached 256-byte ``bytes.translate`` table for ``shift``.
+
+    Only ASCII letters are rotated, so the table is safe to apply to UTF-8 (or
+    any ASCII-compatible) data chunk by chunk: multi-byte sequences never
+    contain bytes in the ASCII range and therefore pass through untouched.
+    """
+
+    return _bytes_table(_rotation(shift, encode))
+
+
+def caesar(text: str, shift: int, *, encode: bool = True) -> str:
+    """Apply a Caesar cipher rotation to ``text``."""
+
+    return text.translate(translation_table(shift, encode=encode))
 
-    translation_table = str.maketrans(
-        LOWER_ALPHABET + UPPER_ALPHABET,
-        shifted_lower + shifted_upper,
-    )
-    return text.translate(translation_table)
+
+def caesar_bytes(data: bytes, shift: int, *, encode: bool = True) -> bytes:
+    """Apply a Caesar cipher rotation to ASCII-compatible ``data``."""
+
+    return data.translate(byte_table(shift, encode=encode))
 
 
 def encode(text: str, shift: int) -> str:
@@ -75,11 +123,80 @@ def mapping_pairs(shift: int, *, encode: bool = True) -> Tuple[List[Tuple[str, s
     return list(zip(src_lower, dst_lower)), list(zip(src_upper, dst_upper))
 
 
+@dataclass
+class TransformStats:
+    """Accumulate byte, line, word and letter counts chunk by chunk.
+
+    Feed it every chunk of a stream (or use :meth:`observe` as a
+    ``transform_stream`` observer) and the totals match a single scan of the
+    whole data: words and lines split across chunk boundaries are counted once.
+    Letters are counted case-insensitively; words are runs of bytes between
+    ASCII whitespace (space, ``\t``, ``\n``, ``\r``, ``\v``, ``\f``), as with
+    ``bytes.split()``, so non-ASCII spaces do not separate words. (``bytes``
+    is a field, hence ``builtins.bytes`` in the signatures below.)
+    """
+
+    bytes: int = 0
+    words: int = 0
+    newlines: int = 0
+    letters: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(LOWER_ALPHABET, 0))
+    _in_word: bool = field(default=False, repr=False)
+    _last: int = field(default=0x0A, repr=False)
+
+    def update(self, data: builtins.bytes) -> None:
+        """Add one chunk of ASCII-compatible (e.g. UTF-8) data."""
+
+        if not data:
+            return
+        self.bytes += len(data)
+        self.newlines += data.count(b"\n")
+        words = len(data.split())
+        if words and self._in_word and data[0] not in _WHITESPACE:
+            words -= 1  # the first word continues the previous chunk's last one
+        self.words += words
+        self._last = data[-1]
+        self._in_word = self._last not in _WHITESPACE
+        letters = self.letters
+        for letter, lower, upper in _LETTER_BYTES:
+            letters[letter] += data.count(lower) + data.count(upper)
+
+    def observe(self, raw: builtins.bytes, transformed: builtins.bytes) -> None:
+        """Stream observer that counts the untransformed input chunk."""
+
+        self.update(raw)
+
+    @property
+    def lines(self) -> int:
+        """Number of lines, counting a final line without a newline."""
+
+        return self.newlines + (1 if self._last != 0x0A else 0)
+
+    @property
+    def letter_total(self) -> int:
+        return sum(self.letters.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bytes": self.bytes,
+            "lines": self.lines,
+            "words": self.words,
+            "letters": self.letter_total,
+            "histogram": dict(self.letters),
+        }
+
+    def summary(self) -> str:
+        return f"{self.bytes} bytes, {self.lines} line(s), {self.words} word(s), {self.letter_total} letter(s)"
+
+
 __all__ = [
     "LOWER_ALPHABET",
     "UPPER_ALPHABET",
+    "TransformStats",
     "caesar",
+    "caesar_bytes",
     "encode",
     "decode",
     "mapping_pairs",
+    "translation_table",
+    "byte_table",
 ]
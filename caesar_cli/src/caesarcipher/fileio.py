@@ -0,0 +1,81 @@
+"""Random-access file wrapper that decodes on read and encodes on write."""
+
+from __future__ import annotations
+
+import io
+import os
+from typing import Any
+
+from .core import byte_table
+from .stream import PathLike
+
+_VALID_MODES = {"r", "w", "a", "x", "r+", "w+", "a+", "x+"}
+
+
+class CaesarFile(io.RawIOBase):
+    """Unbuffered binary file whose on-disk bytes are Caesar encoded.
+
+    Reads return plain bytes and writes store cipher bytes. Because the
+    rotation is position independent, :meth:`seek` works exactly like on a
+    regular file: any byte range can be decoded without touching the prefix.
+    Wrap it in :class:`io.BufferedReader`/:class:`io.TextIOWrapper` for
+    buffered or text access.
+
+    Args:
+        path: File to open.
+        shift: Shift (1-25) the file content is encoded with.
+        mode: ``"r"``, ``"w"``, ``"a"``, ``"x"`` optionally with ``"+"``; a
+            trailing ``"b"`` is accepted and ignored.
+    """
+
+    def __init__(self, path: PathLike, shift: int, mode: str = "r") -> None:
+        super().__init__()
+        normalised = mode.replace("b", "")
+        if normalised not in _VALID_MODES:
+            raise ValueError(f"invalid mode: {mode!r}")
+        self._encode_table = byte_table(shift)
+        self._decode_table = byte_table(shift, encode=False)
+        self._raw = io.FileIO(os.fspath(path), normalised)
+        self.name = self._raw.name
+        self.mode = normalised + "b"
+
+    def readable(self) -> bool:
+        return self._raw.readable()
+
+    def writable(self) -> bool:
+        return self._raw.writable()
+
+    def seekable(self) -> bool:
+        return self._raw.seekable()
+
+    def fileno(self) -> int:
+        return self._raw.fileno()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._raw.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._raw.tell()
+
+    def truncate(self, size: int | None = None) -> int:
+        return self._raw.truncate(size)
+
+    def readinto(self, buffer: Any) -> int | None:
+        view = memoryview(buffer).cast("B")
+        count = self._raw.readinto(view)
+        if count:
+            view[:count] = view[:count].tobytes().translate(self._decode_table)
+        return count
+
+    def write(self, data: Any) -> int | None:
+        return self._raw.write(bytes(data).translate(self._encode_table))
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._raw.close()
+            finally:
+                super().close()
+
+
+__all__ = ["CaesarFile"]
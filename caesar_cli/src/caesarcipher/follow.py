@@ -0,0 +1,180 @@
+"""Follow a growing file (``tail -f`` style) and mirror it through the cipher."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import partial
+from typing import BinaryIO, Callable, Optional, Tuple, Union
+
+from .core import byte_table
+from .stream import DEFAULT_CHUNK_SIZE, PathLike, open_binary, same_file
+
+DEFAULT_FLUSH_MS = 200
+POLL_INTERVAL = 0.25
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000  # Linux values; os.O_NONBLOCK does not exist on Windows
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+)
+
+
+@dataclass
+class FollowReport:
+    """Totals for a :func:`follow` session."""
+
+    bytes: int = 0
+    rotations: int = 0
+
+
+class _PollWatcher:
+    """Fallback watcher that simply sleeps between checks."""
+
+    def __init__(self, interval: float = POLL_INTERVAL) -> None:
+        self.interval = interval
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(min(timeout, self.interval))
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyWatcher:
+    """Block until something changes in a directory, using Linux inotify."""
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    @classmethod
+    def create(cls, directory: str) -> Optional["_InotifyWatcher"]:
+        """Return a watcher for ``directory`` or ``None`` when inotify is unavailable."""
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            init, add_watch = libc.inotify_init1, libc.inotify_add_watch
+        except (OSError, AttributeError, TypeError):
+            return None
+        add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = init(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def wait(self, timeout: float) -> None:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if ready:
+            try:
+                while os.read(self._fd, 64 * 1024):  # drain; the events themselves are not needed
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def follow(
+    source: PathLike,
+    target: PathLike,
+    shift: int,
+    *,
+    encode: bool = True,
+    flush_ms: int = DEFAULT_FLUSH_MS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_inotify: bool = True,
+    poll_interval: float = POLL_INTERVAL,
+    stop: Callable[[], bool] = lambda: False,
+) -> FollowReport:
+    """Mirror ``source`` into ``target`` and keep appending as ``source`` grows.
+
+    Existing content is transformed first, then new bytes are picked up as
+    they are written. Output is flushed whenever the reader catches up and at
+    least every ``flush_ms`` milliseconds while data keeps arriving. When the
+    file is rotated (a new inode appears at ``source``) the old file is drained
+    before switching; a truncated file is re-read from the start. While idle,
+    the loop blocks on inotify events for the parent directory (or sleeps
+    where inotify is unavailable), waking at least every ``poll_interval``
+    seconds to check ``stop``, so CPU use stays near zero. Runs until
+    ``stop()`` returns true or the caller interrupts it.
+
+    Raises:
+        ValueError: If ``source`` and ``target`` are the same file, which
+            opening the output would empty.
+    """
+
+    if same_file(source, target):
+        raise ValueError(f"cannot write {os.fspath(target)} over the file it follows")
+    table = byte_table(shift, encode=encode)
+    flush_after = max(flush_ms, 0) / 1000.0
+    directory = os.path.dirname(os.path.abspath(source))
+    report = FollowReport()
+    with ExitStack() as stack:
+        current_reader = stack.enter_context(ExitStack())  # closed and reused at each rotation
+        reader: BinaryIO = current_reader.enter_context(open(source, "rb"))
+        watcher: Union[_InotifyWatcher, _PollWatcher] = (
+            _InotifyWatcher.create(directory) if use_inotify else None
+        ) or _PollWatcher(poll_interval)
+        stack.callback(watcher.close)
+        with open_binary(target, "wb") as writer:
+            identity = _identity(os.fstat(reader.fileno()))
+            last_flush = time.monotonic()
+            pending = False
+            while not stop():
+                chunk = reader.read(chunk_size)
+                if chunk:
+                    writer.write(chunk.translate(table))
+                    report.bytes += len(chunk)
+                    pending = True
+                    if time.monotonic() - last_flush >= flush_after:
+                        writer.flush()
+                        last_flush, pending = time.monotonic(), False
+                    continue
+                if pending:  # caught up: make everything read so far visible
+                    writer.flush()
+                    last_flush, pending = time.monotonic(), False
+                try:
+                    current = os.stat(source)
+                except FileNotFoundError:  # mid-rotation: the new file is not there yet
+                    watcher.wait(poll_interval)
+                    continue
+                if _identity(current) != identity:
+                    # Writers may still append to the old file until they reopen.
+                    for chunk in iter(partial(reader.read, chunk_size), b""):
+                        writer.write(chunk.translate(table))
+                        report.bytes += len(chunk)
+                        pending = True  # flushed once the new file is caught up, even if it stays empty
+                    current_reader.close()
+                    reader = current_reader.enter_context(open(source, "rb"))
+                    identity = _identity(os.fstat(reader.fileno()))
+                    report.rotations += 1
+                    continue
+                if current.st_size < reader.tell():  # truncated in place (copytruncate)
+                    reader.seek(0)
+                    report.rotations += 1
+                    continue
+                watcher.wait(poll_interval)
+    return report
+
+
+def _identity(stat: os.stat_result) -> Tuple[int, int]:
+    return stat.st_dev, stat.st_ino
+
+
+__all__ = ["DEFAULT_FLUSH_MS", "FollowReport", "follow"]
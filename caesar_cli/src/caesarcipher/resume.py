@@ -0,0 +1,151 @@
+"""Crash-resumable file transforms backed by a small checkpoint journal."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .core import byte_table
+from .stream import DEFAULT_CHUNK_SIZE, PathLike, same_file
+
+JOURNAL_SUFFIX = ".caesar-journal"
+JOURNAL_VERSION = 1
+CHECKPOINT_BYTES = 16 * 1024 * 1024
+
+
+@dataclass
+class ResumeReport:
+    """Outcome of :func:`resumable_transform`."""
+
+    resumed_from: int
+    bytes: int
+
+
+def journal_path(target: PathLike) -> str:
+    """Return the journal path used for ``target``."""
+
+    return os.fspath(target) + JOURNAL_SUFFIX
+
+
+def resumable_transform(
+    source: PathLike,
+    target: PathLike,
+    shift: int,
+    *,
+    encode: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint_bytes: int = CHECKPOINT_BYTES,
+) -> ResumeReport:
+    """Transform ``source`` into ``target`` so an interrupted run can continue.
+
+    The output is preallocated to the input size and every
+    ``checkpoint_bytes`` the data is fsynced before the completed offset is
+    recorded in ``<target>.caesar-journal``. Because the rotation is position
+    independent, a rerun with the same arguments seeks both files to the last
+    checkpoint and carries on; the journal is removed once the copy finishes.
+    A journal that does not match the source (size, mtime, shift or mode) is
+    ignored and the transform starts from scratch.
+
+    Raises:
+        ValueError: If ``source`` and ``target`` are the same file, which the
+            preallocation would truncate before it is read.
+    """
+
+    if same_file(source, target):
+        raise ValueError(f"--resume cannot write {os.fspath(target)} over its own input")
+    stat = os.stat(source)
+    identity: Dict[str, Any] = {
+        "version": JOURNAL_VERSION,
+        "source": os.path.abspath(source),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "shift": shift,
+        "encode": encode,
+    }
+    journal = journal_path(target)
+    offset = _load_offset(journal, identity, target)
+    table = byte_table(shift, encode=encode)
+
+    if offset == 0:
+        with open(target, "wb") as handle:
+            _preallocate(handle.fileno(), stat.st_size)
+
+    position = offset
+    since_checkpoint = 0
+    with open(source, "rb") as reader, open(target, "r+b") as writer:
+        reader.seek(position)
+        writer.seek(position)
+        while True:
+            chunk = reader.read(chunk_size)
+            if not chunk:
+                break
+            writer.write(chunk.translate(table))
+            position += len(chunk)
+            since_checkpoint += len(chunk)
+            if since_checkpoint >= checkpoint_bytes:
+                _checkpoint(writer, journal, identity, position)
+                since_checkpoint = 0
+        writer.truncate(position)
+        writer.flush()
+        os.fsync(writer.fileno())
+
+    try:
+        os.unlink(journal)
+    except FileNotFoundError:
+        pass
+    return ResumeReport(resumed_from=offset, bytes=position - offset)
+
+
+def _load_offset(journal: str, identity: Dict[str, Any], target: PathLike) -> int:
+    try:
+        with open(journal, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return 0
+    if not isinstance(data, dict) or any(data.get(key) != value for key, value in identity.items()):
+        return 0
+    offset = data.get("offset")
+    if not isinstance(offset, int) or not 0 <= offset <= identity["size"]:
+        return 0
+    try:
+        if os.path.getsize(target) < offset:
+            return 0
+    except OSError:
+        return 0
+    return offset
+
+
+def _checkpoint(writer: Any, journal: str, identity: Dict[str, Any], offset: int) -> None:
+    writer.flush()
+    os.fsync(writer.fileno())
+    directory = os.path.dirname(os.path.abspath(journal))
+    fd, temp_path = tempfile.mkstemp(prefix=".caesar-journal.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(dict(identity, offset=offset), handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, journal)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _preallocate(fd: int, size: int) -> None:
+    fallocate: Optional[Any] = getattr(os, "posix_fallocate", None)
+    if fallocate is not None and size > 0:
+        try:
+            fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass
+    os.ftruncate(fd, size)
+
+
+__all__ = ["CHECKPOINT_BYTES", "JOURNAL_SUFFIX", "ResumeReport", "journal_path", "resumable_transform"]
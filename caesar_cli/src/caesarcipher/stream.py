@@ -0,0 +1,324 @@
+"""Chunked streaming helpers built on the cached rotation tables."""
+
+from __future__ import annotations
+
+import asyncio
+import bz2
+import gzip
+import lzma
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Sequence,
+    Union,
+    cast,
+)
+
+from .core import byte_table
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+PathLike = Union[str, "os.PathLike[str]"]
+ChunkObserver = Callable[[bytes, bytes], None]
+
+_COMPRESSED_OPENERS: dict[str, Callable[..., Any]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+COMPRESSION_ERRORS = (OSError, EOFError, lzma.LZMAError)
+
+
+def is_compressed(path: PathLike) -> bool:
+    """Return ``True`` when ``path`` has a ``.gz``, ``.bz2`` or ``.xz`` suffix."""
+
+    return os.path.splitext(os.fspath(path))[1].lower() in _COMPRESSED_OPENERS
+
+
+def same_file(first: PathLike, second: PathLike) -> bool:
+    """Return ``True`` when both paths name the same file, hard links and symlinks included."""
+
+    try:
+        return os.path.samefile(first, second)
+    except OSError:  # one of them does not exist (yet)
+        return os.path.realpath(first) == os.path.realpath(second)
+
+
+def open_binary(path: PathLike, mode: str = "rb") -> BinaryIO:
+    """Open ``path`` in binary ``mode``, (de)compressing by file suffix.
+
+    ``.gz``, ``.bz2`` and ``.xz`` files go through :mod:`gzip`, :mod:`bz2` and
+    :mod:`lzma` respectively, which stream in small blocks; anything else is a
+    plain :func:`open`.
+    """
+
+    opener = _COMPRESSED_OPENERS.get(os.path.splitext(os.fspath(path))[1].lower())
+    if opener is None:
+        return cast(BinaryIO, open(path, mode))
+    return cast(BinaryIO, opener(path, mode))
+
+
+class PrefetchReader:
+    """Read-ahead wrapper that pulls chunks from ``source`` on a worker thread.
+
+    Decompression (or slow I/O) then overlaps with the transform running on
+    the caller's thread. At most ``depth`` chunks are buffered, so memory stays
+    bounded by ``depth * chunk_size``.
+    """
+
+    def __init__(self, source: BinaryIO, *, chunk_size: int = DEFAULT_CHUNK_SIZE, depth: int = 4) -> None:
+        self._source = source
+        self._chunk_size = chunk_size
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, depth))
+        self._stop = threading.Event()
+        self._pending = b""
+        self._done = False
+        self._thread = threading.Thread(target=self._pump, name="caesar-prefetch", daemon=True)
+        self._thread.start()
+
+    def _pump(self) -> None:
+        try:
+            while not self._stop.is_set():
+                chunk = self._source.read(self._chunk_size)
+                self._put(chunk)
+                if not chunk:
+                    return
+        except BaseException as exc:  # noqa: BLE001 - re-raised on the reading thread
+            self._put(exc)
+
+    def _put(self, item: Any) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def read(self, size: int = -1) -> bytes:
+        parts = [self._pending]
+        have = len(self._pending)
+        while not self._done and (size < 0 or have < size):
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._done = True
+                raise item
+            if not item:
+                self._done = True
+                break
+            parts.append(item)
+            have += len(item)
+        data = b"".join(parts)
+        if size < 0 or len(data) <= size:
+            self._pending = b""
+            return data
+        self._pending = data[size:]
+        return data[:size]
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._source.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+def transform_path(
+    source: PathLike,
+    target: PathLike,
+    shift: int,
+    *,
+    encode: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    observers: Sequence[ChunkObserver] = (),
+    prefetch: bool = False,
+) -> int:
+    """Stream ``source`` into ``target``, transparently handling compression.
+
+    When both paths name the same file the output goes to a temporary file
+    next to it, which then replaces the original, so the source is never
+    truncated before it has been read.
+
+    Args:
+        prefetch: Read (and decompress) ``source`` on a background thread.
+
+    Returns:
+        Number of (uncompressed) bytes transformed.
+    """
+
+    if same_file(source, target):
+        directory, name = os.path.split(os.fspath(target))
+        suffix = os.path.splitext(name)[1]  # keeps open_binary's compression choice
+        fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=f".tmp{suffix}", dir=directory or None)
+        os.close(fd)
+        try:
+            total = transform_path(
+                source, temp_path, shift, encode=encode, chunk_size=chunk_size, observers=observers, prefetch=prefetch
+            )
+            shutil.copymode(target, temp_path)
+            os.replace(temp_path, target)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        return total
+
+    reader: Any = open_binary(source)
+    if prefetch:
+        reader = PrefetchReader(reader, chunk_size=chunk_size)
+    with reader, open_binary(target, "wb") as writer:
+        return transform_stream(
+            reader, writer, shift, encode=encode, chunk_size=chunk_size, observers=observers
+        )
+
+
+def transform_stream(
+    source: BinaryIO,
+    target: BinaryIO,
+    shift: int,
+    *,
+    encode: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    observers: Sequence[ChunkObserver] = (),
+) -> int:
+    """Copy ``source`` to ``target`` applying the rotation chunk by chunk.
+
+    Memory use is bounded by ``chunk_size`` regardless of the stream length.
+    Each observer is called with ``(raw_chunk, transformed_chunk)`` so hashes
+    or statistics can be collected in the same pass.
+
+    Returns:
+        Number of bytes transformed.
+    """
+
+    table = byte_table(shift, encode=encode)
+    total = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        transformed = chunk.translate(table)
+        target.write(transformed)
+        for observer in observers:
+            observer(chunk, transformed)
+        total += len(chunk)
+    return total
+
+
+def transform_file(
+    source: PathLike,
+    target: PathLike,
+    shift: int,
+    *,
+    encode: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    observers: Sequence[ChunkObserver] = (),
+    atomic: bool = False,
+) -> int:
+    """Stream ``source`` into ``target`` and copy the source's permission bits.
+
+    With ``atomic=True`` the output is written to a temporary file next to
+    ``target`` and renamed into place, so readers never see a partial file.
+
+    Returns:
+        Number of bytes transformed.
+    """
+
+    if not atomic:
+        with open(source, "rb") as reader, open(target, "wb") as writer:
+            total = transform_stream(
+                reader, writer, shift, encode=encode, chunk_size=chunk_size, observers=observers
+            )
+        shutil.copymode(source, target)
+        return total
+
+    directory, name = os.path.split(os.fspath(target))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory or None)
+    try:
+        with open(source, "rb") as reader, os.fdopen(fd, "wb") as writer:
+            total = transform_stream(
+                reader, writer, shift, encode=encode, chunk_size=chunk_size, observers=observers
+            )
+        shutil.copymode(source, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return total
+
+
+async def caesar_stream_async(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    shift: int,
+    encode: bool = True,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Copy ``reader`` to ``writer`` applying the rotation chunk by chunk.
+
+    ``writer.drain()`` is awaited after every chunk so a slow consumer applies
+    backpressure instead of growing the transport buffer. The writer is left
+    open; closing it is the caller's responsibility.
+
+    Returns:
+        Number of bytes transformed.
+    """
+
+    table = byte_table(shift, encode=encode)
+    total = 0
+    while True:
+        chunk = await reader.read(chunk_size)
+        if not chunk:
+            break
+        writer.write(chunk.translate(table))
+        await writer.drain()
+        total += len(chunk)
+    return total
+
+
+async def caesar_iter_async(
+    chunks: AsyncIterable[bytes],
+    shift: int,
+    encode: bool = True,
+) -> AsyncIterator[bytes]:
+    """Yield each chunk of ``chunks`` with the rotation applied."""
+
+    table = byte_table(shift, encode=encode)
+    async for chunk in chunks:
+        yield chunk.translate(table)
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "PrefetchReader",
+    "caesar_iter_async",
+    "caesar_stream_async",
+    "is_compressed",
+    "open_binary",
+    "same_file",
+    "transform_file",
+    "transform_path",
+    "transform_stream",
+]
@@ -0,0 +1,219 @@
+"""Incremental directory sync driven by a size/mtime/hash manifest."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .batch import check_output_dir, iter_source_files, run_pool
+from .stream import DEFAULT_CHUNK_SIZE, PathLike, transform_file
+
+MANIFEST_NAME = ".caesar-manifest.json"
+MANIFEST_VERSION = 1
+
+Entry = Dict[str, Any]
+_Candidate = Tuple[Path, str, os.stat_result]
+
+
+@dataclass
+class SyncReport:
+    """Outcome of a sync run."""
+
+    transformed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    failures: List[Tuple[Path, str]] = field(default_factory=list)
+
+    def summary(self) -> str:
+        text = (
+            f"Synced: {self.transformed} transformed, {self.unchanged} unchanged, "
+            f"{self.removed} removed ({self.bytes} bytes in {self.seconds:.2f}s)"
+        )
+        if self.failures:
+            text += f"; {len(self.failures)} failed"
+        return text
+
+
+def load_manifest(output_dir: PathLike, shift: int, encode: bool) -> Dict[str, Entry]:
+    """Return the manifest entries of ``output_dir`` if they match ``shift``/mode.
+
+    A missing, unreadable or mismatching manifest yields an empty mapping, which
+    makes the next sync rebuild every output.
+    """
+
+    path = Path(output_dir) / MANIFEST_NAME
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != MANIFEST_VERSION
+        or data.get("shift") != shift
+        or data.get("encode") != encode
+        or not isinstance(data.get("files"), dict)
+    ):
+        return {}
+    return dict(data["files"])
+
+
+def save_manifest(output_dir: PathLike, shift: int, encode: bool, files: Dict[str, Entry]) -> None:
+    """Atomically write the manifest for ``output_dir``."""
+
+    payload = {
+        "version": MANIFEST_VERSION,
+        "shift": shift,
+        "encode": encode,
+        "files": dict(sorted(files.items())),
+    }
+    fd, temp_path = tempfile.mkstemp(prefix=".caesar-manifest.", suffix=".tmp", dir=output_dir)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=1)
+        os.replace(temp_path, Path(output_dir) / MANIFEST_NAME)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def sync_tree(
+    source_dir: PathLike,
+    output_dir: PathLike,
+    shift: int,
+    *,
+    encode: bool = True,
+    jobs: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_error: Optional[Callable[[Path, Exception], None]] = None,
+) -> SyncReport:
+    """Bring ``output_dir`` up to date with ``source_dir``.
+
+    Files whose size and mtime match the manifest are skipped without being
+    read. Files whose metadata changed but whose SHA-256 did not are only
+    re-stamped. Everything else is transformed (hashing in the same pass) and
+    renamed into place atomically. Outputs of deleted sources are removed.
+
+    Raises:
+        ValueError: If ``output_dir`` is ``source_dir`` or one of its parents.
+    """
+
+    check_output_dir(source_dir, output_dir)
+    source_root = Path(source_dir)
+    output_root = Path(output_dir)
+    output_root.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(output_root, shift, encode)
+    current: Dict[str, Entry] = {}
+    seen: Set[str] = set()
+    report = SyncReport()
+    started = time.perf_counter()
+
+    def candidates() -> Iterator[_Candidate]:
+        for path in iter_source_files(source_root, exclude=output_root):
+            rel = path.relative_to(source_root).as_posix()
+            seen.add(rel)
+            stat = path.stat()
+            entry = previous.get(rel)
+            target = output_root / rel
+            if (
+                entry is not None
+                and entry.get("size") == stat.st_size
+                and entry.get("mtime_ns") == stat.st_mtime_ns
+                and target.exists()
+            ):
+                current[rel] = entry
+                report.unchanged += 1
+                continue
+            yield path, rel, stat
+
+    def process(item: _Candidate) -> Tuple[Entry, int]:
+        path, rel, stat = item
+        target = output_root / rel
+        entry = previous.get(rel)
+        fresh: Entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        if entry is not None and entry.get("size") == stat.st_size and target.exists():
+            digest = _hash_file(path, chunk_size)
+            if digest == entry.get("sha256"):
+                fresh["sha256"] = digest
+                return fresh, -1
+        hasher = hashlib.sha256()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        size = transform_file(
+            path,
+            target,
+            shift,
+            encode=encode,
+            chunk_size=chunk_size,
+            observers=[lambda raw, _: hasher.update(raw)],
+            atomic=True,
+        )
+        fresh["sha256"] = hasher.hexdigest()
+        return fresh, size
+
+    def record(item: _Candidate, future: "Future[Tuple[Entry, int]]") -> None:
+        path, rel, _ = item
+        try:
+            entry, size = future.result()
+        except Exception as exc:  # noqa: BLE001 - reported per file
+            report.failures.append((path, str(exc)))
+            if on_error is not None:
+                on_error(path, exc)
+            return
+        current[rel] = entry
+        if size < 0:
+            report.unchanged += 1
+        else:
+            report.transformed += 1
+            report.bytes += size
+
+    run_pool(process, candidates(), jobs=jobs or os.cpu_count() or 1, on_done=record)
+
+    for rel in sorted(set(previous) - seen):
+        target = output_root / rel
+        try:
+            target.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            report.failures.append((target, str(exc)))
+            if on_error is not None:
+                on_error(target, exc)
+            continue
+        report.removed += 1
+        _prune_empty_dirs(target.parent, output_root)
+
+    save_manifest(output_root, shift, encode, current)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def _hash_file(path: Path, chunk_size: int) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _prune_empty_dirs(directory: Path, stop: Path) -> None:
+    while directory != stop and stop in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
+__all__ = ["MANIFEST_NAME", "SyncReport", "load_manifest", "save_manifest", "sync_tree"]
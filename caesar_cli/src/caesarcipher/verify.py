@@ -0,0 +1,80 @@
+"""Round-trip verification computed during the transform itself."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from .core import byte_table
+from .stream import PathLike
+
+SIDECAR_SUFFIX = ".verify.json"
+
+
+@dataclass
+class VerifyReport:
+    """Digests of the input and of the decoded output."""
+
+    algorithm: str
+    input_digest: str
+    roundtrip_digest: str
+    bytes: int
+    written: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.input_digest == self.roundtrip_digest and self.written in (None, self.bytes)
+
+
+class RoundTripVerifier:
+    """Stream observer proving that a transform can be reversed.
+
+    Each transformed chunk is decoded again in memory with the inverse table
+    and hashed next to the raw input chunk, so the comparison needs no second
+    read of either file.
+    """
+
+    def __init__(self, shift: int, *, encode: bool = True, algorithm: str = "sha256") -> None:
+        self._inverse = byte_table(shift, encode=not encode)
+        self._algorithm = algorithm
+        self._input = hashlib.new(algorithm)
+        self._roundtrip = hashlib.new(algorithm)
+        self._bytes = 0
+
+    def observe(self, raw: bytes, transformed: bytes) -> None:
+        self._input.update(raw)
+        self._roundtrip.update(transformed.translate(self._inverse))
+        self._bytes += len(raw)
+
+    def report(self, written: Optional[int] = None) -> VerifyReport:
+        """Return the digests; ``written`` is the output size to check for truncation."""
+
+        return VerifyReport(
+            algorithm=self._algorithm,
+            input_digest=self._input.hexdigest(),
+            roundtrip_digest=self._roundtrip.hexdigest(),
+            bytes=self._bytes,
+            written=written,
+        )
+
+
+def sidecar_path(target: PathLike) -> str:
+    """Return the digest file written next to ``target``."""
+
+    return os.fspath(target) + SIDECAR_SUFFIX
+
+
+def write_sidecar(target: PathLike, report: VerifyReport, **details: Any) -> str:
+    """Write ``report`` (plus ``details`` such as the shift) next to ``target``."""
+
+    payload: Dict[str, Any] = dict(details, **asdict(report), ok=report.ok)
+    path = sidecar_path(target)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2)
+    return path
+
+
+__all__ = ["SIDECAR_SUFFIX", "RoundTripVerifier", "VerifyReport", "sidecar_path", "write_sidecar"]
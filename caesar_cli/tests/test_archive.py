@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from caesarcipher import cli
+from caesarcipher.archive import should_copy, transform_archive
+
+PNG = b"\x89PNG\r\n\x1a\nbinary-bytes"
+
+
+def _build_tar(path: Path) -> None:
+    with tarfile.open(path, "w:gz") as archive:
+        for name, data, mode in [("docs/a.txt", b"hello", 0o640), ("img/logo.png", PNG, 0o644)]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = mode
+            info.mtime = 1_700_000_000
+            info.uname = "alice"
+            archive.addfile(info, io.BytesIO(data))
+        folder = tarfile.TarInfo("empty")
+        folder.type = tarfile.DIRTYPE
+        archive.addfile(folder)
+
+
+def test_tar_members_are_streamed_and_metadata_kept(tmp_path: Path) -> None:
+    source, target = tmp_path / "in.tar.gz", tmp_path / "out.tar.xz"
+    _build_tar(source)
+
+    report = transform_archive(source, target, 3, copy_globs=["*.png"], chunk_size=2)
+
+    assert (report.transformed, report.copied, report.other) == (1, 1, 1)
+    with tarfile.open(target) as archive:
+        text = archive.getmember("docs/a.txt")
+        assert (text.mode, text.mtime, text.uname) == (0o640, 1_700_000_000, "alice")
+        assert archive.extractfile(text).read() == b"khoor"  # type: ignore[union-attr]
+        assert archive.extractfile("img/logo.png").read() == PNG  # type: ignore[union-attr]
+        assert archive.getmember("empty").isdir()
+
+
+def test_zip_members_round_trip(tmp_path: Path) -> None:
+    source, encoded, decoded = tmp_path / "in.zip", tmp_path / "enc.zip", tmp_path / "dec.zip"
+    with zipfile.ZipFile(source, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("notes/readme.md", "Attack at dawn\n" * 100)
+        archive.writestr("notes/", b"")
+        archive.writestr("logo.png", PNG)
+
+    transform_archive(source, encoded, 5, copy_globs=["*.png"])
+    transform_archive(encoded, decoded, 5, encode=False, copy_globs=["*.png"])
+
+    with zipfile.ZipFile(encoded) as archive:
+        info = archive.getinfo("notes/readme.md")
+        assert info.compress_type == zipfile.ZIP_DEFLATED
+        assert archive.read(info).startswith(b"Fyyfhp fy ifbs")
+    with zipfile.ZipFile(decoded) as archive:
+        assert archive.read("notes/readme.md") == b"Attack at dawn\n" * 100
+        assert archive.read("logo.png") == PNG
+
+
+def test_should_copy_matches_basename_or_path() -> None:
+    assert should_copy("a/b/c.png", ["*.png"])
+    assert should_copy("assets/x.bin", ["assets/*"])
+    assert not should_copy("docs/x.txt", ["assets/*", "*.png"])
+
+
+def test_mixed_formats_are_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        transform_archive(tmp_path / "a.zip", tmp_path / "b.tar", 3)
+
+
+@pytest.mark.parametrize("name", ["x.zip", "y.tar.gz"])
+def test_cli_archive_refuses_to_overwrite_its_input(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], name: str
+) -> None:
+    source = tmp_path / name
+    if name.endswith(".zip"):
+        with zipfile.ZipFile(source, "w") as archive:
+            archive.writestr("a.txt", "hello")
+    else:
+        _build_tar(source)
+    before = source.read_bytes()
+
+    exit_code = cli.main(["--archive", str(source), "--out", str(source), "-s", "3"])
+
+    assert exit_code == 2
+    assert "over its own input" in capsys.readouterr().err
+    assert source.read_bytes() == before
+
+
+def test_cli_archive_mode(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    source, target = tmp_path / "in.tar.gz", tmp_path / "out.tar.gz"
+    _build_tar(source)
+    exit_code = cli.main(["--archive", str(source), "--out", str(target), "-s", "3", "--copy", "*.png"])
+    assert exit_code == 0
+    assert "1 transformed, 1 copied" in capsys.readouterr().out
+
+
+def test_cli_copy_requires_archive() -> None:
+    with pytest.raises(SystemExit):
+        cli.main(["--copy", "*.png", "-s", "3", "abc"])
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from caesarcipher import cli
+from caesarcipher.batch import iter_source_files, run_batch
+
+
+def _make_tree(root: Path) -> dict[str, bytes]:
+    files = {
+        "a.txt": b"hello",
+        "nested/b.txt": b"Attack at dawn",
+        "nested/deeper/c.log": b"xyz\n" * 1000,
+    }
+    for name, payload in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+    return files
+
+
+def test_run_batch_mirrors_tree_and_modes(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    files = _make_tree(src)
+    os.chmod(src / "a.txt", 0o640)
+
+    report = run_batch(src, dst, 3, jobs=2, chunk_size=7)
+
+    assert report.files == 3
+    assert report.bytes == sum(len(payload) for payload in files.values())
+    assert not report.failures
+    assert (dst / "a.txt").read_bytes() == b"khoor"
+    assert (dst / "nested/deeper/c.log").read_bytes() == b"abc\n" * 1000
+    assert stat.S_IMODE((dst / "a.txt").stat().st_mode) == 0o640
+
+
+def test_run_batch_reports_failures_without_aborting(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    _make_tree(src)
+    (dst / "a.txt").mkdir(parents=True)  # collides with the output file
+    failed: list[Path] = []
+
+    report = run_batch(src, dst, 3, jobs=1, on_error=lambda path, exc: failed.append(path))
+
+    assert report.files == 2
+    assert [path for path, _ in report.failures] == failed == [src / "a.txt"]
+    assert (dst / "nested/b.txt").read_bytes() == b"Dwwdfn dw gdzq"
+
+
+@pytest.mark.parametrize("out", [".", "..", "nested/.."])
+def test_cli_recursive_rejects_output_overlapping_source(
+    tmp_path: Path, out: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    src = tmp_path / "src"
+    files = _make_tree(src)
+    exit_code = cli.main(["--recursive", str(src), "--out-dir", str(src / out), "-s", "3"])
+    assert exit_code == 1
+    assert "overlaps the source tree" in capsys.readouterr().err
+    assert {name: (src / name).read_bytes() for name in files} == files
+
+
+def test_iter_source_files_skips_nested_output_dir(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "old.txt").write_text("stale", encoding="utf-8")
+    found = [path.relative_to(tmp_path).as_posix() for path in iter_source_files(tmp_path, exclude=tmp_path / "out")]
+    assert found == ["a.txt", "nested/b.txt", "nested/deeper/c.log"]
+
+
+def test_cli_recursive_prints_summary(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    src = tmp_path / "src"
+    _make_tree(src)
+    exit_code = cli.main(["--recursive", str(src), "--out-dir", str(tmp_path / "dst"), "-d", "-s", "3", "--jobs", "4"])
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert "Processed 3 file(s)" in captured.out
+    assert (tmp_path / "dst" / "a.txt").read_bytes() == b"ebiil"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--recursive", "src", "-s", "3"],
+        ["--out-dir", "dst", "-s", "3", "abc"],
+        ["--recursive", "src", "--out-dir", "dst", "--jobs", "0", "-s", "3"],
+    ],
+)
+def test_cli_recursive_argument_errors(argv: list[str]) -> None:
+    with pytest.raises(SystemExit) as exc:
+        cli.main(argv)
+    assert exc.value.code == 2
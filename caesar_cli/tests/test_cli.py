@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
 import sys
 
@@ -200,3 +200,106 @@ def test_main_auto_repl(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureF
     captured = capsys.readouterr()
     assert exit_code == 0
     assert "khoor" in captured.out
+
+
+def test_cli_streams_compressed_files(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    import gzip
+
+    source = tmp_path / "plain.txt.gz"
+    dest = tmp_path / "cipher.txt.xz"
+    with gzip.open(source, "wt", encoding="utf-8") as handle:
+        handle.write("hello\n")
+
+    assert cli.main(["--input", str(source), "--output", str(dest), "-s", "3", "--prefetch"]) == 0
+    assert cli.main(["--input", str(dest), "-d", "-s", "3"]) == 0
+    assert capsys.readouterr().out.strip() == "hello"
+
+
+def test_cli_transforms_a_file_in_place(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    import gzip
+
+    plain = tmp_path / "note.txt"
+    plain.write_bytes(b"hello\r\nworld\n")  # streamed byte for byte, so line endings are kept
+    plain.chmod(0o640)
+    assert cli.main(["-s", "3", "--input", str(plain), "--output", str(tmp_path / "." / "note.txt")]) == 0
+    assert plain.read_bytes() == b"khoor\r\nzruog\n"
+    assert plain.stat().st_mode & 0o777 == 0o640
+
+    packed = tmp_path / "note.txt.gz"
+    packed.write_bytes(gzip.compress(b"hello"))
+    assert cli.main(["-s", "3", "--prefetch", "--input", str(packed), "--output", str(packed)]) == 0
+    assert gzip.decompress(packed.read_bytes()) == b"khoor"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["note.txt", "note.txt.gz"]
+
+    assert cli.main(["--match", "o", "-s", "3", "--input", str(plain), "--output", str(plain)]) == 2
+    assert "would overwrite --input" in capsys.readouterr().err
+    assert plain.read_bytes() == b"khoor\r\nzruog\n"
+
+
+def test_cli_resume_rejects_compressed_paths(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["--resume", "--input", "a.gz", "--output", "b", "-s", "3"])
+    assert exc.value.code == 2
+
+
+def test_cli_stats_json_collected_during_stream(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    import json
+
+    source = tmp_path / "plain.txt"
+    stats_file = tmp_path / "stats.json"
+    source.write_text("Attack at dawn\nhold\n", encoding="utf-8")
+
+    args = ["--input", str(source), "--output", str(tmp_path / "out.txt"), "-s", "3", "--stats-json", str(stats_file)]
+    assert cli.main(args) == 0
+
+    stats = json.loads(stats_file.read_text(encoding="utf-8"))
+    assert (stats["bytes"], stats["lines"], stats["words"], stats["letters"]) == (20, 2, 4, 16)
+    assert stats["histogram"]["a"] == 4
+    assert "Stats: 20 bytes" in capsys.readouterr().err
+
+
+def test_cli_stats_count_raw_stdin(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    stdin = TextIOWrapper(BytesIO(b"hello world\nfoo\n"), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", stdin)
+
+    assert cli.main(["-s", "3", "--stats"]) == 0
+
+    captured = capsys.readouterr()
+    assert captured.out == "khoor zruog\nirr\n"
+    assert "Stats: 16 bytes, 2 line(s), 3 word(s), 13 letter(s)" in captured.err
+
+
+@pytest.mark.parametrize(
+    ("argv", "message"),
+    [
+        (["--csv", "--columns", "name", "--match", "x"], "--csv cannot be combined with --match"),
+        (["--jsonl", "--field", "a", "--csv", "--columns", "name"], "--jsonl cannot be combined with --csv"),
+        (["--recursive", "src", "--out-dir", "dst", "--resume"], "--recursive cannot be combined with --resume"),
+    ],
+)
+def test_cli_rejects_conflicting_modes(
+    argv: list[str], message: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.chdir(tmp_path)  # nothing may be written even if a mode ran anyway
+    with pytest.raises(SystemExit) as exc:
+        cli.main([*argv, "-s", "3"])
+    assert exc.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ("argv", "message"),
+    [
+        (["--prefetch", "abc"], "--prefetch requires --input and --output"),
+        (["--prefetch", "--input", "a.txt"], "--prefetch requires --input and --output"),
+        (["--recursive", "src", "--out-dir", "dst", "--copy", "*.png"], "--copy requires --archive"),
+    ],
+)
+def test_cli_rejects_options_of_another_mode(
+    argv: list[str], message: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit) as exc:
+        cli.main([*argv, "-s", "3"])
+    assert exc.value.code == 2
+    assert message in capsys.readouterr().err
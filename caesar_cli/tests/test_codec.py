@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import codecs
+import io
+from pathlib import Path
+
+import pytest
+
+import caesarcipher  # noqa: F401 - registers the codec
+from caesarcipher.core import encode
+
+
+def test_open_with_caesar_encoding_round_trips(tmp_path: Path) -> None:
+    target = tmp_path / "secret.txt"
+    text = "Hello, Wörld!\nSecond line 🙂\n"
+    with open(target, "w", encoding="caesar-3") as handle:
+        handle.write(text)
+
+    assert target.read_bytes() == encode(text, 3).encode("utf-8")
+    with open(target, encoding="caesar-3") as handle:
+        assert handle.read() == text
+
+
+@pytest.mark.parametrize("name", ["caesar-5", "Caesar_5", "caesar5", "rot-5", "ROT5"])
+def test_lookup_accepts_name_variants(name: str) -> None:
+    assert codecs.lookup(name).name == "caesar-5"
+
+
+@pytest.mark.parametrize("name", ["caesar-0", "caesar-26", "caesar-x"])
+def test_lookup_rejects_invalid_names(name: str) -> None:
+    with pytest.raises(LookupError):
+        codecs.lookup(name)
+
+
+def test_incremental_decoder_handles_split_multibyte_sequences() -> None:
+    data = codecs.encode("abc é xyz", "caesar-4")
+    decoder = codecs.getincrementaldecoder("caesar-4")()
+    pieces = [decoder.decode(data[idx : idx + 1]) for idx in range(len(data))]
+    pieces.append(decoder.decode(b"", final=True))
+    assert "".join(pieces) == "abc é xyz"
+
+
+def test_iterencode_and_stream_reader() -> None:
+    chunks = ["attack ", "at ", "dawn ✓"]
+    encoded = b"".join(codecs.iterencode(chunks, "caesar-13"))
+    assert encoded == encode("".join(chunks), 13).encode("utf-8")
+
+    reader = codecs.getreader("caesar-13")(io.BytesIO(encoded))
+    assert reader.read(size=3) + reader.read() == "attack at dawn ✓"
@@ -2,7 +2,16 @@ import string
 
 import pytest
 
-from caesarcipher.core import caesar, decode, encode, mapping_pairs
+from caesarcipher.core import (
+    TransformStats,
+    byte_table,
+    caesar,
+    caesar_bytes,
+    decode,
+    encode,
+    mapping_pairs,
+    translation_table,
+)
 
 SAMPLE_TEXTS = [
     "hello world",
@@ -42,3 +51,33 @@ def test_mapping_pairs_matches_encode_mode() -> None:
 def test_invalid_shift_raises(bad_shift: int) -> None:
     with pytest.raises((TypeError, ValueError)):
         encode("abc", bad_shift)
+
+
+@pytest.mark.parametrize("shift", [1, 3, 13, 25])
+def test_caesar_bytes_matches_text_transform(shift: int) -> None:
+    text = "Héllo, Wörld! ünïcode stays 🙂"
+    encoded = caesar_bytes(text.encode("utf-8"), shift)
+    assert encoded.decode("utf-8") == encode(text, shift)
+    assert caesar_bytes(encoded, shift, encode=False).decode("utf-8") == text
+
+
+def test_rotation_tables_are_cached() -> None:
+    assert byte_table(3) is byte_table(3)
+    assert byte_table(3, encode=False) is byte_table(23)
+    assert translation_table(5) is translation_table(5)
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 7, 1024])
+def test_transform_stats_match_a_single_scan(chunk: int) -> None:
+    data = "Hello  World\nsecond line\twith tabs\n\nno newline at end é".encode("utf-8")
+    stats = TransformStats()
+
+    for start in range(0, len(data), chunk):
+        stats.update(data[start : start + chunk])
+
+    text = data.decode("utf-8")
+    assert stats.bytes == len(data)
+    assert stats.words == len(text.split())
+    assert stats.lines == len(text.splitlines())
+    assert stats.letters["l"] == text.lower().count("l")
+    assert stats.letter_total == sum(ch in string.ascii_letters for ch in text)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from caesarcipher.core import caesar_bytes
+from caesarcipher.fileio import CaesarFile
+
+PLAIN = b"The quick brown fox jumps over the lazy dog.\n" * 100
+
+
+def test_write_encodes_and_read_decodes(tmp_path: Path) -> None:
+    target = tmp_path / "log.enc"
+    with CaesarFile(target, 5, "w") as handle:
+        assert handle.write(PLAIN) == len(PLAIN)
+
+    assert target.read_bytes() == caesar_bytes(PLAIN, 5)
+    with CaesarFile(target, 5) as handle:
+        assert handle.read() == PLAIN
+
+
+def test_seek_decodes_arbitrary_ranges(tmp_path: Path) -> None:
+    target = tmp_path / "log.enc"
+    target.write_bytes(caesar_bytes(PLAIN, 11))
+
+    with CaesarFile(target, 11, "rb") as handle:
+        handle.seek(1234)
+        assert handle.read(50) == PLAIN[1234:1284]
+        handle.seek(-10, io.SEEK_END)
+        assert handle.read() == PLAIN[-10:]
+
+        buffer = bytearray(16)
+        handle.seek(45)
+        assert handle.readinto(buffer) == 16
+        assert bytes(buffer) == PLAIN[45:61]
+
+
+def test_buffered_and_text_wrappers(tmp_path: Path) -> None:
+    target = tmp_path / "log.enc"
+    target.write_bytes(caesar_bytes(PLAIN, 3))
+
+    with io.TextIOWrapper(io.BufferedReader(CaesarFile(target, 3)), encoding="utf-8") as text:
+        assert text.readline() == PLAIN.decode().splitlines(keepends=True)[0]
+
+
+def test_in_place_update_with_read_write_mode(tmp_path: Path) -> None:
+    target = tmp_path / "log.enc"
+    target.write_bytes(caesar_bytes(b"hello world", 7))
+
+    with CaesarFile(target, 7, "r+") as handle:
+        handle.seek(6)
+        handle.write(b"There")
+        handle.seek(0)
+        assert handle.read() == b"hello There"
+
+
+def test_invalid_mode_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        CaesarFile(tmp_path / "x", 3, "rt")
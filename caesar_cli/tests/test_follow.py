@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from caesarcipher import cli
+from caesarcipher.follow import FollowReport, follow
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for follow()"
+        time.sleep(0.01)
+
+
+def _start(source: Path, target: Path, use_inotify: bool) -> tuple[threading.Event, threading.Thread, list[FollowReport]]:
+    stop = threading.Event()
+    reports: list[FollowReport] = []
+
+    def run() -> None:
+        reports.append(
+            follow(source, target, 1, flush_ms=10, use_inotify=use_inotify, poll_interval=0.02, stop=stop.is_set)
+        )
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return stop, thread, reports
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_follow_mirrors_appends_and_rotation(tmp_path: Path, use_inotify: bool) -> None:
+    source, target = tmp_path / "app.log", tmp_path / "app.enc"
+    source.write_bytes(b"abc\n")
+    stop, thread, reports = _start(source, target, use_inotify)
+
+    _wait_for(lambda: target.exists() and target.read_bytes() == b"bcd\n")
+    with open(source, "ab") as handle:
+        handle.write(b"xyz\n")
+        handle.flush()
+        _wait_for(lambda: target.read_bytes() == b"bcd\nyza\n")
+        os.rename(source, tmp_path / "app.log.1")
+        handle.write(b"late\n")  # still written to the rotated file
+    source.write_bytes(b"new\n")
+    _wait_for(lambda: target.read_bytes() == b"bcd\nyza\nmbuf\nofx\n")
+
+    stop.set()
+    thread.join(timeout=5)
+    assert reports[0].rotations == 1
+    assert reports[0].bytes == 17
+
+
+def test_follow_restarts_truncated_file(tmp_path: Path) -> None:
+    source, target = tmp_path / "app.log", tmp_path / "app.enc"
+    source.write_bytes(b"hello\n")
+    stop, thread, _ = _start(source, target, use_inotify=False)
+
+    _wait_for(lambda: target.exists() and target.read_bytes() == b"ifmmp\n")
+    source.write_bytes(b"ab\n")  # copytruncate-style rotation
+    _wait_for(lambda: target.read_bytes() == b"ifmmp\nbc\n")
+
+    stop.set()
+    thread.join(timeout=5)
+
+
+def test_follow_flushes_bytes_drained_at_rotation(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source, target = tmp_path / "app.log", tmp_path / "app.enc"
+    rotated = tmp_path / "app.log.1"
+    source.write_bytes(b"abc\n")
+    armed = threading.Event()
+    real_stat = os.stat
+
+    def stat(path: Any, *args: Any, **kwargs: Any) -> os.stat_result:
+        if armed.is_set() and os.fspath(path) == str(source):
+            armed.clear()
+            with open(rotated, "ab") as handle:  # a last write lands between the read and the rotation check
+                handle.write(b"late\n")
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", stat)
+    stop, thread, _ = _start(source, target, use_inotify=False)
+    _wait_for(lambda: target.exists() and target.read_bytes() == b"bcd\n")
+    os.rename(source, rotated)
+    source.write_bytes(b"")  # the new file stays empty
+    armed.set()
+    _wait_for(lambda: target.read_bytes() == b"bcd\nmbuf\n")
+
+    stop.set()
+    thread.join(timeout=5)
+
+
+def test_follow_imports_without_o_nonblock(monkeypatch: pytest.MonkeyPatch) -> None:
+    import importlib
+
+    from caesarcipher import follow as follow_module
+
+    monkeypatch.delattr(os, "O_NONBLOCK")  # as on Windows
+    try:
+        assert importlib.reload(follow_module)._IN_NONBLOCK == 0o4000
+    finally:
+        monkeypatch.undo()
+        importlib.reload(follow_module)
+
+
+def test_cli_follow_refuses_to_overwrite_the_followed_file(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    source = tmp_path / "app.log"
+    source.write_bytes(b"keep me\n")
+
+    assert cli.main(["--follow", "--input", str(source), "--output", str(source), "-s", "3"]) == 2
+    assert "over the file it follows" in capsys.readouterr().err
+    assert source.read_bytes() == b"keep me\n"
+
+
+def test_cli_follow_requires_output() -> None:
+    with pytest.raises(SystemExit):
+        cli.main(["--follow", "--input", "app.log", "-s", "1"])
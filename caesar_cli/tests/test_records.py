@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from caesarcipher import cli
+from caesarcipher.records import transform_csv, transform_jsonl
+
+RECORDS = [
+    {"message": "hello", "user": {"note": "Attack", "id": 7}, "level": "info"},
+    {"message": ["abc", "xyz"], "shift": 1},
+    {"level": "debug"},
+]
+
+
+def _jsonl(records: list[dict[str, object]]) -> str:
+    return "".join(json.dumps(record) + "\n" for record in records)
+
+
+@pytest.mark.parametrize("jobs", [None, 2])
+def test_transform_jsonl_rotates_selected_fields(jobs: int | None) -> None:
+    source = io.StringIO("\n" + _jsonl(RECORDS))
+    target = io.StringIO()
+
+    report = transform_jsonl(source, target, 3, fields=["message", "user.note"], jobs=jobs, batch_lines=1)
+
+    lines = target.getvalue().splitlines()
+    assert lines[0] == ""
+    first, second, _third = (json.loads(line) for line in lines[1:])
+    assert first == {"message": "khoor", "user": {"note": "Dwwdfn", "id": 7}, "level": "info"}
+    assert second["message"] == ["def", "abc"]
+    assert lines[3] == json.dumps(RECORDS[2])  # untouched record copied verbatim
+    assert (report.records, report.fields) == (3, 4)
+
+
+def test_transform_jsonl_uses_per_record_shift() -> None:
+    source = io.StringIO(_jsonl(RECORDS[:2]))
+    target = io.StringIO()
+
+    transform_jsonl(source, target, 3, fields=["message"], shift_field="shift")
+
+    first, second = (json.loads(line) for line in target.getvalue().splitlines())
+    assert first["message"] == "khoor"
+    assert second["message"] == ["bcd", "yza"]
+
+
+@pytest.mark.parametrize("payload", ['{"message": "x", "shift": 40}\n', "not json\n"])
+def test_transform_jsonl_reports_bad_lines(payload: str) -> None:
+    with pytest.raises(ValueError, match="line 1"):
+        transform_jsonl(io.StringIO(payload), io.StringIO(), 3, fields=["message"], shift_field="shift")
+
+
+def test_cli_jsonl_file_round_trip(tmp_path: Path) -> None:
+    source, encoded, decoded = tmp_path / "in.jsonl", tmp_path / "enc.jsonl.gz", tmp_path / "dec.jsonl"
+    source.write_text(_jsonl(RECORDS), encoding="utf-8")
+
+    assert cli.main(["--jsonl", "--field", "message", "--input", str(source), "--output", str(encoded), "-s", "4"]) == 0
+    assert cli.main(["--jsonl", "--field", "message", "--input", str(encoded), "--output", str(decoded), "-d", "-s", "4"]) == 0
+    assert [json.loads(line) for line in decoded.read_text(encoding="utf-8").splitlines()] == RECORDS
+
+
+def test_cli_jsonl_stdin_to_stdout(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setattr(sys, "stdin", io.StringIO('{"message": "abc"}\n'))
+    assert cli.main(["--jsonl", "--field", "message", "-s", "1"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"message": "bcd"}
+
+
+def test_cli_field_requires_jsonl() -> None:
+    with pytest.raises(SystemExit):
+        cli.main(["--field", "message", "-s", "1", "abc"])
+
+
+CSV_TEXT = 'id;name;notes\r\n1;alice;"hello; world"\r\n2;bob;plain\r\n'
+
+
+def test_transform_csv_rotates_selected_columns_and_keeps_dialect() -> None:
+    target = io.StringIO()
+
+    report = transform_csv(io.StringIO(CSV_TEXT, newline=""), target, 1, columns=["name", "notes"])
+
+    assert target.getvalue() == 'id;name;notes\r\n1;bmjdf;"ifmmp; xpsme"\r\n2;cpc;qmbjo\r\n'
+    assert (report.records, report.fields) == (2, 4)
+
+
+def test_transform_csv_round_trips_tsv_by_index_in_small_batches() -> None:
+    text = "".join(f"{n}\tword{n}\n" for n in range(25))
+    encoded, decoded = io.StringIO(), io.StringIO()
+
+    transform_csv(io.StringIO(text), encoded, 7, columns=[1], delimiter="\t", header=False, batch_rows=4)
+    transform_csv(io.StringIO(encoded.getvalue()), decoded, 7, columns=[1], delimiter="\t", header=False, encode=False)
+
+    assert encoded.getvalue().splitlines()[0] == "0\tdvyk0"
+    assert decoded.getvalue() == text
+
+
+def test_transform_csv_keeps_quoting_every_field() -> None:
+    target = io.StringIO()
+
+    transform_csv(io.StringIO('"id","notes"\n"1","hi there"\n', newline=""), target, 3, columns=["notes"])
+
+    assert target.getvalue() == '"id","notes"\n"1","kl wkhuh"\n'
+
+
+def test_transform_csv_rejects_unknown_column_before_writing() -> None:
+    target = io.StringIO()
+    with pytest.raises(ValueError, match="missing"):
+        transform_csv(io.StringIO(CSV_TEXT), target, 1, columns=["missing"])
+    assert target.getvalue() == ""
+
+
+def test_cli_csv_stdin_to_stdout(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setattr(sys, "stdin", io.StringIO("name,age\nabc,3\n"))
+    assert cli.main(["--csv", "--columns", "name", "-s", "1"]) == 0
+    assert capsys.readouterr().out == "name,age\nbcd,3\n"
+
+
+def test_cli_columns_requires_csv() -> None:
+    with pytest.raises(SystemExit):
+        cli.main(["--columns", "name", "-s", "1", "abc"])
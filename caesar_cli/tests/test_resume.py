@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from caesarcipher import cli
+from caesarcipher.core import caesar_bytes
+from caesarcipher.resume import journal_path, resumable_transform
+
+PLAIN = bytes(range(256)) * 64
+
+
+def test_resumable_transform_completes_and_removes_journal(tmp_path: Path) -> None:
+    source, target = tmp_path / "in.bin", tmp_path / "out.bin"
+    source.write_bytes(PLAIN)
+
+    report = resumable_transform(source, target, 5, chunk_size=1000, checkpoint_bytes=4000)
+
+    assert (report.resumed_from, report.bytes) == (0, len(PLAIN))
+    assert target.read_bytes() == caesar_bytes(PLAIN, 5)
+    assert not os.path.exists(journal_path(target))
+
+
+def test_resumable_transform_continues_from_checkpoint(tmp_path: Path) -> None:
+    source, target = tmp_path / "in.bin", tmp_path / "out.bin"
+    source.write_bytes(PLAIN)
+
+    class Crash(Exception):
+        pass
+
+    real_fsync = os.fsync
+    calls = {"count": 0}
+
+    def crashing_fsync(fd: int) -> None:
+        real_fsync(fd)
+        calls["count"] += 1
+        if calls["count"] == 4:  # die while recording the second checkpoint
+            raise Crash()
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(os, "fsync", crashing_fsync)
+        with pytest.raises(Crash):
+            resumable_transform(source, target, 5, chunk_size=1000, checkpoint_bytes=4000)
+
+    journal = json.loads(Path(journal_path(target)).read_text(encoding="utf-8"))
+    assert journal["offset"] == 4000
+    assert not list(tmp_path.glob("*.tmp"))
+    # Corrupt the already-checkpointed prefix: a resume must not rewrite it.
+    with open(target, "r+b") as handle:
+        handle.write(b"\0" * 10)
+
+    report = resumable_transform(source, target, 5, chunk_size=1000, checkpoint_bytes=4000)
+
+    assert report.resumed_from == 4000
+    data = target.read_bytes()
+    assert data[:10] == b"\0" * 10
+    assert data[10:] == caesar_bytes(PLAIN, 5)[10:]
+
+
+def test_stale_journal_is_ignored(tmp_path: Path) -> None:
+    source, target = tmp_path / "in.bin", tmp_path / "out.bin"
+    source.write_bytes(PLAIN)
+    Path(journal_path(target)).write_text(json.dumps({"offset": 100, "shift": 9}), encoding="utf-8")
+
+    report = resumable_transform(source, target, 5)
+
+    assert report.resumed_from == 0
+    assert target.read_bytes() == caesar_bytes(PLAIN, 5)
+
+
+def test_cli_resume_requires_files() -> None:
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["--resume", "-s", "3", "abc"])
+    assert exc.value.code == 2
+
+
+def test_cli_resume_round_trip(tmp_path: Path) -> None:
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    source.write_text("hello\n", encoding="utf-8")
+    assert cli.main(["--resume", "--input", str(source), "--output", str(target), "-s", "3"]) == 0
+    assert target.read_text(encoding="utf-8") == "khoor\n"
+
+
+def test_resume_refuses_to_overwrite_its_input(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    source = tmp_path / "in.txt"
+    source.write_bytes(b"hello")
+    os.link(source, tmp_path / "alias.txt")
+    for target in (source, tmp_path / "alias.txt", tmp_path / "." / "in.txt"):
+        assert cli.main(["--resume", "--input", str(source), "--output", str(target), "-s", "3"]) == 1
+        assert "over its own input" in capsys.readouterr().err
+    assert source.read_bytes() == b"hello"
+    assert not os.path.exists(journal_path(source))
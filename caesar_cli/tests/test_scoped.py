@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import io
+import sys
+
+import pytest
+
+from caesarcipher import cli
+from caesarcipher.scoped import compile_pattern, transform_matches
+
+LOG = (
+    b'2024-01-01 INFO user=alice msg="hello world"\n'
+    b"2024-01-01 DEBUG heartbeat\n"
+    b'2024-01-02 WARN user=bob msg="caf\xc3\xa9 open"\r\n'
+)
+
+
+def test_transform_matches_rotates_only_the_group() -> None:
+    target = io.BytesIO()
+
+    report = transform_matches(io.BytesIO(LOG), target, r'msg="([^"]*)"', 1, group=1)
+
+    assert target.getvalue() == (
+        b'2024-01-01 INFO user=alice msg="ifmmp xpsme"\n'
+        b"2024-01-01 DEBUG heartbeat\n"
+        b'2024-01-02 WARN user=bob msg="dbg\xc3\xa9 pqfo"\r\n'
+    )
+    assert (report.lines, report.matched, report.spans) == (3, 2, 2)
+
+
+def test_transform_matches_round_trips_every_match_across_buffer_boundaries() -> None:
+    data = b"".join(b"id=%d key=value%d tail\n" % (n, n) for n in range(500))
+    source = io.BufferedReader(io.BytesIO(data), buffer_size=16)  # lines straddle reads
+    encoded, decoded = io.BytesIO(), io.BytesIO()
+
+    transform_matches(source, encoded, rb"key=(\w+)", 5, group=1, batch_lines=7)
+    transform_matches(io.BytesIO(encoded.getvalue()), decoded, rb"key=(\w+)", 5, group=1, encode=False)
+
+    assert encoded.getvalue().splitlines()[0] == b"id=0 key=afqzj0 tail"
+    assert decoded.getvalue() == data
+
+
+def test_compile_pattern_rejects_missing_group() -> None:
+    with pytest.raises(ValueError, match="group 2"):
+        compile_pattern(r"(a)", 2)
+    with pytest.raises(ValueError, match="invalid pattern"):
+        compile_pattern(r"(", 0)
+
+
+def test_cli_match_stdin_to_stdout(monkeypatch: pytest.MonkeyPatch, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"token=abc rest\nplain\n")))
+    assert cli.main(["--match", r"token=(\S+)", "--group", "1", "-s", "1"]) == 0
+    assert capsysbinary.readouterr().out == b"token=bcd rest\nplain\n"
+
+
+def test_cli_group_requires_match() -> None:
+    with pytest.raises(SystemExit):
+        cli.main(["--group", "1", "-s", "1", "abc"])
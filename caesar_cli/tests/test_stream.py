@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import socket
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+
+from caesarcipher.core import caesar_bytes
+from caesarcipher.stream import (
+    PrefetchReader,
+    caesar_iter_async,
+    caesar_stream_async,
+    open_binary,
+    transform_path,
+)
+
+
+class _RecordingWriter:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.drains = 0
+
+    def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+    async def drain(self) -> None:
+        self.drains += 1
+
+
+def test_stream_async_transforms_each_chunk_and_drains() -> None:
+    async def scenario() -> tuple[int, _RecordingWriter]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"hello world")
+        reader.feed_eof()
+        writer = _RecordingWriter()
+        total = await caesar_stream_async(reader, writer, 3, chunk_size=4)  # type: ignore[arg-type]
+        return total, writer
+
+    total, writer = asyncio.run(scenario())
+    assert total == 11
+    assert b"".join(writer.chunks) == b"khoor zruog"
+    assert writer.drains == len(writer.chunks) == 3
+
+
+def test_stream_async_runs_many_sockets_concurrently() -> None:
+    payloads = [f"stream {idx}: Attack at dawn".encode() * 500 for idx in range(8)]
+
+    async def pump(payload: bytes) -> bytes:
+        left, right = socket.socketpair()
+        src_reader, src_writer = await asyncio.open_connection(sock=left)
+        dst_reader, dst_writer = await asyncio.open_connection(sock=right)
+
+        async def produce() -> None:
+            src_writer.write(payload)
+            await src_writer.drain()
+            src_writer.write_eof()
+
+        async def transform() -> None:
+            await caesar_stream_async(dst_reader, dst_writer, 7, encode=False)
+            dst_writer.close()
+
+        producer = asyncio.ensure_future(produce())
+        transformer = asyncio.ensure_future(transform())
+        received = await src_reader.read()
+        await asyncio.gather(producer, transformer)
+        src_writer.close()
+        return received
+
+    async def scenario() -> list[bytes]:
+        return list(await asyncio.gather(*(pump(payload) for payload in payloads)))
+
+    results = asyncio.run(scenario())
+    for payload, result in zip(payloads, results):
+        assert caesar_bytes(result, 7) == payload
+
+
+def test_iter_async_yields_rotated_chunks() -> None:
+    async def source() -> AsyncIterator[bytes]:
+        for chunk in (b"abc", b"XYZ", b"123"):
+            yield chunk
+
+    async def scenario() -> list[bytes]:
+        return [chunk async for chunk in caesar_iter_async(source(), 1)]
+
+    assert asyncio.run(scenario()) == [b"bcd", b"YZA", b"123"]
+
+
+@pytest.mark.parametrize("suffix", ["", ".gz", ".bz2", ".xz"])
+def test_transform_path_handles_compression(tmp_path: Path, suffix: str) -> None:
+    payload = b"Attack at dawn!\n" * 5000
+    source = tmp_path / f"plain.txt{suffix}"
+    target = tmp_path / f"cipher.txt{suffix}"
+    with open_binary(source, "wb") as handle:
+        handle.write(payload)
+
+    total = transform_path(source, target, 3, chunk_size=1024, prefetch=bool(suffix))
+
+    assert total == len(payload)
+    with open_binary(target) as handle:
+        assert handle.read() == caesar_bytes(payload, 3)
+    if suffix:
+        assert target.stat().st_size < len(payload)
+
+
+def test_prefetch_reader_honours_read_sizes_and_errors() -> None:
+    reader = PrefetchReader(io.BytesIO(b"abcdefghij"), chunk_size=3, depth=1)
+    assert reader.read(4) == b"abcd"
+    assert reader.read(1) == b"e"
+    assert reader.read() == b"fghij"
+    assert reader.read(5) == b""
+    reader.close()
+
+    class Broken(io.BytesIO):
+        def read(self, size: int | None = -1) -> bytes:
+            raise OSError("disk gone")
+
+    broken = PrefetchReader(Broken(), chunk_size=3)
+    with pytest.raises(OSError, match="disk gone"):
+        broken.read(1)
+    broken.close()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from caesarcipher import cli
+from caesarcipher.sync import MANIFEST_NAME, sync_tree
+
+
+def _write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def test_sync_only_touches_changed_files(tmp_path: Path) -> None:
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    _write(src / "a.txt", b"hello")
+    _write(src / "sub" / "b.txt", b"world")
+
+    first = sync_tree(src, dst, 3, jobs=2)
+    assert (first.transformed, first.unchanged, first.removed) == (2, 0, 0)
+    assert (dst / "sub" / "b.txt").read_bytes() == b"zruog"
+    manifest = json.loads((dst / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert set(manifest["files"]) == {"a.txt", "sub/b.txt"}
+
+    second = sync_tree(src, dst, 3)
+    assert (second.transformed, second.unchanged, second.removed) == (0, 2, 0)
+
+    _write(src / "a.txt", b"HELLO")
+    (src / "sub" / "b.txt").unlink()
+    _write(src / "c.txt", b"abc")
+    third = sync_tree(src, dst, 3)
+    assert (third.transformed, third.unchanged, third.removed) == (2, 0, 1)
+    assert (dst / "a.txt").read_bytes() == b"KHOOR"
+    assert not (dst / "sub").exists()
+    assert not list(dst.glob("**/*.tmp"))
+
+
+def test_sync_skips_rewrite_when_only_mtime_changed(tmp_path: Path) -> None:
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    _write(src / "a.txt", b"hello")
+    sync_tree(src, dst, 3)
+    output_stat = (dst / "a.txt").stat()
+
+    stat = (src / "a.txt").stat()
+    os.utime(src / "a.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    report = sync_tree(src, dst, 3)
+
+    assert (report.transformed, report.unchanged) == (0, 1)
+    assert (dst / "a.txt").stat().st_ino == output_stat.st_ino
+
+
+def test_sync_rebuilds_when_shift_changes(tmp_path: Path) -> None:
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    _write(src / "a.txt", b"hello")
+    sync_tree(src, dst, 3)
+    report = sync_tree(src, dst, 4)
+    assert report.transformed == 1
+    assert (dst / "a.txt").read_bytes() == b"lipps"
+
+
+def test_cli_sync_subcommand(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    _write(src / "a.txt", b"khoor")
+    exit_code = cli.main(["sync", str(src), str(dst), "-d", "-s", "3"])
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert "1 transformed" in captured.out
+    assert (dst / "a.txt").read_bytes() == b"hello"
+
+
+def test_sync_reports_outputs_it_cannot_remove(tmp_path: Path) -> None:
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    _write(src / "a.txt", b"hello")
+    sync_tree(src, dst, 3)
+    (src / "a.txt").unlink()
+    (dst / "a.txt").unlink()
+    _write(dst / "a.txt" / "kept", b"")  # a directory cannot be unlinked
+    failed: list[Path] = []
+
+    report = sync_tree(src, dst, 3, on_error=lambda path, exc: failed.append(path))
+
+    assert [path for path, _ in report.failures] == failed == [dst / "a.txt"]
+    assert report.removed == 0
+
+
+def test_cli_sync_word_and_overlapping_output(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert cli.main(["-s", "3", "--", "sync"]) == 0
+    assert cli.main(["-s", "3", "sync"]) == 0
+    assert capsys.readouterr().out.split() == ["vbqf", "vbqf"]
+
+    _write(tmp_path / "a.txt", b"hello")
+    assert cli.main(["sync", str(tmp_path), str(tmp_path), "-s", "3"]) == 1
+    assert "overlaps the source tree" in capsys.readouterr().err
+    assert (tmp_path / "a.txt").read_bytes() == b"hello"
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from caesarcipher import cli
+from caesarcipher.core import caesar_bytes
+from caesarcipher.verify import RoundTripVerifier, sidecar_path
+
+
+def test_verifier_accepts_a_correct_transform() -> None:
+    verifier = RoundTripVerifier(5)
+    for chunk in (b"Hello, ", b"World \xc3\xa9\n"):
+        verifier.observe(chunk, caesar_bytes(chunk, 5))
+
+    report = verifier.report(written=16)
+
+    assert report.ok
+    assert report.input_digest == hashlib.sha256(b"Hello, World \xc3\xa9\n").hexdigest()
+
+
+def test_verifier_flags_corruption_and_truncation() -> None:
+    verifier = RoundTripVerifier(1, encode=False)
+    verifier.observe(b"abc", b"zab")
+    assert verifier.report().ok
+    assert not verifier.report(written=2).ok
+
+    verifier.observe(b"d", b"d")  # wrong: should be "c"
+    assert not verifier.report().ok
+
+
+def test_cli_verify_writes_sidecar(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    source, output = tmp_path / "plain.txt", tmp_path / "cipher.txt"
+    source.write_bytes(b"attack at dawn\n" * 1000)
+
+    assert cli.main(["--input", str(source), "--output", str(output), "-s", "7", "--verify"]) == 0
+
+    digests = json.loads(Path(sidecar_path(output)).read_text(encoding="utf-8"))
+    assert digests["ok"] is True
+    assert digests["input_digest"] == hashlib.sha256(source.read_bytes()).hexdigest()
+    assert digests["roundtrip_digest"] == digests["input_digest"]
+    assert (digests["bytes"], digests["written"], digests["shift"]) == (15000, 15000, 7)
+    assert "Verified 15000 bytes" in capsys.readouterr().err
+
+
+def test_cli_verify_requires_output() -> None:
+    with pytest.raises(SystemExit):
+        cli.main(["--verify", "-s", "3", "abc"])
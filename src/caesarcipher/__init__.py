@@ -3,7 +3,7 @@
 from importlib import metadata
 
 from .app import run
-from .core import LOWER, UPPER, caesar, decode, encode, mapping_pairs
+from .core import LOWER, UPPER, CipherView, caesar, decode, encode, mapping_pairs
 
 try:
     __version__ = metadata.version("caesar-cli")
@@ -23,6 +23,7 @@ __all__ = [
     "encode",
     "decode",
     "mapping_pairs",
+    "CipherView",
     "LOWER",
     "UPPER",
     "__version__",
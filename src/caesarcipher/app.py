@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from PyQt6 import QtWidgets
+import os
+import sqlite3
 
+from PyQt6 import QtCore, QtWidgets
+
+from caesarcipher.config import defaults
+from caesarcipher.logic.history_store import HistoryStore
 from caesarcipher.ui.main_window import CaesarWindow
 from caesarcipher.ui.theme import apply_theme
 
@@ -11,10 +16,29 @@ from caesarcipher.ui.theme import apply_theme
 def run() -> None:
     """Launch the Caesar cipher GUI."""
     app = QtWidgets.QApplication([])
+    app.setApplicationName("caesarcipher")
     apply_theme(app)
-    window = CaesarWindow()
+    store = _open_history_store()
+    window = CaesarWindow(history_store=store)
+    app.aboutToQuit.connect(window.controller.force_history_capture)
     window.show()
-    app.exec()
+    try:
+        app.exec()
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _open_history_store() -> HistoryStore | None:
+    """Open the per-user history database, or ``None`` to keep history in memory."""
+    location = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.StandardLocation.AppDataLocation)
+    if not location:
+        return None
+    try:
+        os.makedirs(location, exist_ok=True)
+        return HistoryStore(os.path.join(location, defaults.HISTORY_DB_NAME))
+    except (OSError, sqlite3.Error):
+        return None
 
 
 __all__ = ["run"]
@@ -5,8 +5,18 @@ from __future__ import annotations
 DEFAULT_SHIFT = 3
 MIN_SHIFT = 1
 MAX_SHIFT = 25
-HISTORY_LIMIT = 20
+HISTORY_LIMIT = 10_000
 HISTORY_PREVIEW_LENGTH = 45
+HISTORY_TOOLTIP_LENGTH = 400
+HISTORY_COMPRESS_THRESHOLD = 64 * 1024  # characters; larger history sources are stored zlib-compressed
+HISTORY_BYTES_BUDGET = 64 * 1024 * 1024  # total bytes of stored sources; oldest entries are evicted first
+HISTORY_PAGE_SIZE = 200  # rows loaded per page from the persistent history
+HISTORY_DB_NAME = "history.sqlite3"
+BACKGROUND_THRESHOLD = 256 * 1024  # characters; larger inputs are processed off the GUI thread
+BACKGROUND_CHUNK = 256 * 1024  # characters scanned between cancellation checks
+PRECOMPUTE_THRESHOLD = 64 * 1024  # characters; larger inputs get every shift cached
+PRECOMPUTE_DELAY_MS = 400  # idle time before the other shifts are precomputed
+SHIFT_CACHE_CHARS = 64 * 1024 * 1024  # total characters kept in the shift cache
 
 ACCENT_COLOR = "#00d2ff"
 MUTED_COLOR = "#1f2933"
@@ -22,6 +32,16 @@ __all__ = [
     "MAX_SHIFT",
     "HISTORY_LIMIT",
     "HISTORY_PREVIEW_LENGTH",
+    "HISTORY_TOOLTIP_LENGTH",
+    "HISTORY_COMPRESS_THRESHOLD",
+    "HISTORY_BYTES_BUDGET",
+    "HISTORY_PAGE_SIZE",
+    "HISTORY_DB_NAME",
+    "BACKGROUND_THRESHOLD",
+    "BACKGROUND_CHUNK",
+    "PRECOMPUTE_THRESHOLD",
+    "PRECOMPUTE_DELAY_MS",
+    "SHIFT_CACHE_CHARS",
     "ACCENT_COLOR",
     "MUTED_COLOR",
     "TEXT_COLOR",
@@ -1,5 +1,15 @@
 """Public core API."""
 
-from .crypto import LOWER, UPPER, caesar, decode, encode, mapping_pairs
+from .crypto import LOWER, UPPER, caesar, decode, encode, mapping_pairs, translation_table
+from .view import CipherView
 
-__all__ = ["caesar", "encode", "decode", "mapping_pairs", "LOWER", "UPPER"]
+__all__ = [
+    "caesar",
+    "encode",
+    "decode",
+    "mapping_pairs",
+    "translation_table",
+    "CipherView",
+    "LOWER",
+    "UPPER",
+]
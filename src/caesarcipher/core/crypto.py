@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import cache
+
 LOWER = "abcdefghijklmnopqrstuvwxyz"
 UPPER = LOWER.upper()
 _ALPHABET_SIZE = len(LOWER)
@@ -23,14 +25,23 @@ def caesar(text: str, shift: int, *, encode: bool = True) -> str:
         TypeError: If ``shift`` is not an ``int``.
     """
 
+    return text.translate(translation_table(shift, encode=encode))
+
+
+def translation_table(shift: int, *, encode: bool = True) -> dict[int, int]:
+    """Return the cached ``str.translate`` table for ``shift`` and mode."""
+
     normalised = _normalise_shift(shift)
     if not encode:
         normalised = (-normalised) % _ALPHABET_SIZE
+    return _rotation_table(normalised)
+
 
-    shifted_lower = LOWER[normalised:] + LOWER[:normalised]
-    shifted_upper = UPPER[normalised:] + UPPER[:normalised]
-    table = str.maketrans(LOWER + UPPER, shifted_lower + shifted_upper)
-    return text.translate(table)
+@cache
+def _rotation_table(rotation: int) -> dict[int, int]:
+    shifted_lower = LOWER[rotation:] + LOWER[:rotation]
+    shifted_upper = UPPER[rotation:] + UPPER[:rotation]
+    return str.maketrans(LOWER + UPPER, shifted_lower + shifted_upper)
 
 
 def encode(text: str, shift: int) -> str:
@@ -69,4 +80,4 @@ def _normalise_shift(shift: int) -> int:
     return shift % _ALPHABET_SIZE
 
 
-__all__ = ["caesar", "encode", "decode", "mapping_pairs", "LOWER", "UPPER"]
+__all__ = ["caesar", "encode", "decode", "mapping_pairs", "translation_table", "LOWER", "UPPER"]
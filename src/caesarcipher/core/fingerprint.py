@@ -0,0 +1,18 @@
+"""Cheap content identity for texts of any size."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Tuple
+
+Fingerprint = Tuple[int, bytes]
+
+
+def text_fingerprint(text: str) -> Fingerprint:
+    """Return a cheap identity for ``text``: its length plus a BLAKE2b digest."""
+
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return len(text), digest
+
+
+__all__ = ["Fingerprint", "text_fingerprint"]
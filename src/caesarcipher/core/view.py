@@ -0,0 +1,125 @@
+"""Lazy, slice-on-demand view over a Caesar transformed string."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Iterator, overload
+
+from .crypto import translation_table
+
+BLOCK_SIZE = 16 * 1024
+CACHED_BLOCKS = 16
+
+
+class CipherView:
+    """Sequence-like result that transforms ``source`` only where it is read.
+
+    Indexing, slicing and iteration translate fixed-size blocks on demand and
+    keep the most recently used ones in a small LRU cache, so previews of a
+    huge input never pay for the whole string. ``str(view)`` materialises the
+    full result.
+
+    Args:
+        source: Text to transform.
+        shift: Amount to rotate the alphabet (`1`-`25` inclusive).
+        encode: Set ``False`` to perform decoding.
+        block_size: Characters translated per cached block.
+        cached_blocks: Maximum number of blocks kept in the cache.
+
+    Raises:
+        ValueError: If ``shift`` is outside the valid range.
+        TypeError: If ``shift`` is not an ``int``.
+    """
+
+    __slots__ = ("_block_size", "_blocks", "_cached_blocks", "_table", "encode", "shift", "source")
+
+    def __init__(
+        self,
+        source: str,
+        shift: int,
+        *,
+        encode: bool = True,
+        block_size: int = BLOCK_SIZE,
+        cached_blocks: int = CACHED_BLOCKS,
+    ) -> None:
+        if block_size <= 0 or cached_blocks <= 0:
+            raise ValueError("block_size and cached_blocks must be positive")
+        self.source = source
+        self.shift = shift
+        self.encode = encode
+        self._table = translation_table(shift, encode=encode)
+        self._block_size = block_size
+        self._cached_blocks = cached_blocks
+        self._blocks: OrderedDict[int, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def __bool__(self) -> bool:
+        return bool(self.source)
+
+    @overload
+    def __getitem__(self, key: int) -> str: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> str: ...
+
+    def __getitem__(self, key: int | slice) -> str:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self.source))
+            if step != 1:
+                return self.source[key].translate(self._table)
+            return self._range(start, stop)
+        index = key + len(self.source) if key < 0 else key
+        if not 0 <= index < len(self.source):
+            raise IndexError("CipherView index out of range")
+        block = self._block(index // self._block_size)
+        return block[index % self._block_size]
+
+    def __iter__(self) -> Iterator[str]:
+        for number in range(-(-len(self.source) // self._block_size)):
+            yield from self._block(number)
+
+    def __str__(self) -> str:
+        return self.source.translate(self._table)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CipherView):
+            return len(self) == len(other) and str(self) == str(other)
+        if isinstance(other, str):
+            return len(self) == len(other) and str(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        mode = "encode" if self.encode else "decode"
+        return f"CipherView(len={len(self)}, shift={self.shift}, mode={mode})"
+
+    def _range(self, start: int, stop: int) -> str:
+        if stop <= start:
+            return ""
+        size = self._block_size
+        first, last = start // size, (stop - 1) // size
+        if last - first >= self._cached_blocks:
+            # Wider than the cache: translate directly instead of thrashing it.
+            return self.source[start:stop].translate(self._table)
+        parts = [self._block(number) for number in range(first, last + 1)]
+        offset = first * size
+        return "".join(parts)[start - offset : stop - offset]
+
+    def _block(self, number: int) -> str:
+        blocks = self._blocks
+        block = blocks.get(number)
+        if block is not None:
+            blocks.move_to_end(number)
+            return block
+        start = number * self._block_size
+        block = self.source[start : start + self._block_size].translate(self._table)
+        blocks[number] = block
+        if len(blocks) > self._cached_blocks:
+            blocks.popitem(last=False)
+        return block
+
+
+__all__ = ["BLOCK_SIZE", "CACHED_BLOCKS", "CipherView"]
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Callable, Iterator
 
-from PyQt6 import QtCore
+from PyQt6 import QtCore, QtGui
 
 from caesarcipher.config import defaults
-from caesarcipher.core.crypto import LOWER, caesar
+from caesarcipher.core.crypto import LOWER, translation_table
+from caesarcipher.core.view import CipherView
+from caesarcipher.logic.shift_cache import Fingerprint, ShiftCache, TextProfile, rotation, text_fingerprint
+from caesarcipher.logic.text_index import TextIndex
+from caesarcipher.logic.worker import CipherJob, JobSignals
 from caesarcipher.ui.widgets.history_panel import HistoryEntry, HistoryPanel
 from caesarcipher.ui.widgets.mapping_focus_card import MappingFocusCard
 from caesarcipher.ui.widgets.mapping_table import MappingTableWidget
@@ -35,46 +41,175 @@ class CaesarController(QtCore.QObject):
     def __init__(self, deps: ControllerDependencies) -> None:
         super().__init__()
         self.deps = deps
-        self._pending_history: HistoryEntry | None = None
+        # The pending entry is built on capture, so typing never copies or
+        # hashes the input just to keep a history entry ready.
+        self._pending_history: Callable[[], HistoryEntry] | None = None
         self._last_snapshot: HistoryEntry | None = None
         self._highlight_indices: set[int] = set()
+        self._result_view: CipherView | None = None
+        self._result_mode: tuple[int, bool] | None = None  # view still to build from the input
+        # (shift, encode) the output document currently reflects, and whether
+        # the latest input edit was already mirrored onto it.
+        self._rendered: tuple[int, bool] | None = None
+        self._output_patched = False
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._generation = 0
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._job_signals = JobSignals(self)
+        self._job_signals.finished.connect(self._finish_job)
+        self._job_in_sync = False
+        self._job_fingerprint: Fingerprint | None = None
+        self._job_revision = -1
+        # Letter counts of the input document, valid while the document is
+        # still at ``_index_revision``; kept current by ``apply_input_edit``.
+        self._text_index: TextIndex | None = None
+        self._index_revision = -1
+        self._shift_cache = ShiftCache(defaults.SHIFT_CACHE_CHARS)
+        self._precompute_request: tuple[int, str | None, Fingerprint | None, int] | None = None
+        self._precompute_timer = QtCore.QTimer(self)
+        self._precompute_timer.setSingleShot(True)
+        self._precompute_timer.timeout.connect(self._start_precompute)
+        # Output is regenerated from the input, so its undo stack is dead weight.
+        deps.output_widget.document().setUndoRedoEnabled(False)  # type: ignore[attr-defined]
 
         # Connect signals
         deps.timer.setSingleShot(True)
         deps.timer.timeout.connect(self._capture_history)
 
     # Public API ---------------------------------------------------------
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce every ``run_cipher`` request made inside the block.
+
+        Widget setters fire their own signals into ``run_cipher``; within a
+        batch those calls only mark the state dirty and a single recompute
+        runs when the outermost block exits. Blocks may be nested.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self.run_cipher()
+
     def reset(self) -> None:
         """Restore default state."""
-        self._pending_history = None
-        self._last_snapshot = None
-        self.deps.history_panel.clear()
-        self.deps.shift_spin.setValue(defaults.DEFAULT_SHIFT)  # type: ignore[attr-defined]
-        self.deps.encode_button.setChecked(True)  # type: ignore[attr-defined]
-        self.deps.input_widget.clear()  # type: ignore[attr-defined]
-        self.deps.output_widget.setPlainText("")  # type: ignore[attr-defined]
-        self.run_cipher()
+        with self.batch():
+            self._pending_history = None
+            self._last_snapshot = None
+            self.deps.history_panel.clear()
+            self.deps.shift_spin.setValue(defaults.DEFAULT_SHIFT)  # type: ignore[attr-defined]
+            self.deps.encode_button.setChecked(True)  # type: ignore[attr-defined]
+            self.deps.input_widget.clear()  # type: ignore[attr-defined]
+            self.run_cipher()
 
     def apply_rot13(self) -> None:
         """Set shift to 13 and use encode mode."""
-        self.deps.shift_spin.setValue(13)  # type: ignore[attr-defined]
-        self.deps.encode_button.setChecked(True)  # type: ignore[attr-defined]
-        self.run_cipher()
+        with self.batch():
+            self.deps.shift_spin.setValue(13)  # type: ignore[attr-defined]
+            self.deps.encode_button.setChecked(True)  # type: ignore[attr-defined]
+            self.run_cipher()
+
+    @property
+    def result_view(self) -> CipherView | None:
+        """Lazy view of the latest output for callers that only render a slice."""
+        if self._result_view is None and self._result_mode is not None:
+            shift, encode = self._result_mode
+            text = self.deps.input_widget.toPlainText()  # type: ignore[attr-defined]
+            self._result_view = CipherView(text, shift, encode=encode)
+            self._result_mode = None
+        return self._result_view
+
+    def apply_input_edit(self, position: int, removed: int, added: int) -> None:
+        """Mirror one ``contentsChange`` of the input document onto the output.
+
+        Only the edited span is translated and spliced in through a
+        ``QTextCursor``, so typing costs O(edit size) instead of re-rendering
+        the whole output. The letter index is updated from the same delta
+        (the removed text is read back from the output), so highlights and
+        the focus letter need no rescan either. If the output is not an exact
+        mirror of the input (different shift or mode, or lengths disagree)
+        nothing is patched and the following ``run_cipher`` does a full render.
+        """
+        shift = self.deps.shift_spin.value()  # type: ignore[attr-defined]
+        encode = self.deps.encode_button.isChecked()  # type: ignore[attr-defined]
+        self._output_patched = self._rendered == (shift, encode) and self._patch_output(
+            position, removed, added, shift, encode
+        )
+        if not self._output_patched:
+            self._rendered = None  # the output no longer mirrors anything
+            self._text_index = None
+
+    def _patch_output(self, position: int, removed: int, added: int, shift: int, encode: bool) -> bool:
+        source = self.deps.input_widget.document()  # type: ignore[attr-defined]
+        target = self.deps.output_widget.document()  # type: ignore[attr-defined]
+        length = source.characterCount() - 1  # without the trailing paragraph separator
+        if position < 0 or position + added > length:
+            return False  # Qt over-reports whole-document replacements
+        if target.characterCount() - 1 != length - added + removed:
+            return False
+
+        cursor = QtGui.QTextCursor(source)
+        cursor.setPosition(position)
+        cursor.setPosition(position + added, QtGui.QTextCursor.MoveMode.KeepAnchor)
+        inserted = cursor.selectedText().replace("\u2029", "\n")
+
+        patch = QtGui.QTextCursor(target)
+        patch.beginEditBlock()
+        patch.setPosition(position)
+        patch.setPosition(position + removed, QtGui.QTextCursor.MoveMode.KeepAnchor)
+        replaced = patch.selectedText().replace("\u2029", "\n")
+        patch.insertText(inserted.translate(translation_table(shift, encode=encode)))
+        patch.endEditBlock()
+        if target.characterCount() != source.characterCount():
+            return False
+
+        index = self._text_index
+        if index is not None:
+            if len(replaced) == removed and len(inserted) == added:  # no surrogate pairs
+                original = replaced.translate(translation_table(shift, encode=not encode))
+                index.apply_edit(position, original, inserted, lambda start, end: _document_text(source, start, end))
+                self._index_revision = source.revision()
+            else:
+                self._text_index = None
+        return True
 
     def run_cipher(self) -> None:
-        """Execute the Caesar cipher using current UI state."""
-        text = self.deps.input_widget.toPlainText()  # type: ignore[attr-defined]
+        """Execute the Caesar cipher using current UI state.
+
+        Inputs of at least ``defaults.BACKGROUND_THRESHOLD`` characters are
+        processed on a worker thread; the banner shows a busy state meanwhile
+        and only the newest job's result is applied. While the letter index
+        is current no scan of the text is needed, so that path stays on the
+        GUI thread whatever the size; when the output was also patched in
+        sync, the input text is not even read.
+        """
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
         shift = self.deps.shift_spin.value()  # type: ignore[attr-defined]
         encode = self.deps.encode_button.isChecked()  # type: ignore[attr-defined]
 
         shifted_lower = LOWER[shift:] + LOWER[:shift]
-        indexes = _collect_indices(text, shifted_lower, encode)
-        self._highlight_indices = indexes
-        self.deps.mapping_table.set_highlights(indexes)
         self.deps.mapping_table.update_mapping(shifted_lower, encode_mode=encode)
 
-        if not text:
-            self.deps.output_widget.setPlainText("")  # type: ignore[attr-defined]
+        patched, self._output_patched = self._output_patched, False
+        in_sync = patched and self._rendered == (shift, encode)
+        self._generation += 1  # any job still running is now stale
+
+        document = self.deps.input_widget.document()  # type: ignore[attr-defined]
+        revision = document.revision()
+        if document.isEmpty():
+            self._rendered = (shift, encode)
+            self._text_index, self._index_revision = TextIndex(), revision
+            self._set_highlights(set())
+            if not in_sync:
+                self.deps.output_widget.setPlainText("")  # type: ignore[attr-defined]
+            self._result_view = self._result_mode = None
             self._pending_history = None
             self._last_snapshot = None
             self.deps.status_banner.set_mode(
@@ -83,32 +218,192 @@ class CaesarController(QtCore.QObject):
                 source_char=LOWER[0] if encode else shifted_lower[0],
                 target_char=shifted_lower[0] if encode else LOWER[0],
             )
+            self.deps.status_banner.set_busy(False)
             self.deps.focus_card.reset_to_default(shift, encode)
             return
 
-        result = caesar(text, shift, encode=encode)
-        self.deps.output_widget.setPlainText(result)  # type: ignore[attr-defined]
+        index = self._text_index if self._index_revision == revision else None
+        profile = index.profile() if index is not None else None
+        if in_sync and profile is not None:
+            # O(edit size): the output is patched and the index is current, so
+            # nothing needs the text until a view, history entry or precompute
+            # actually asks for it.
+            self._apply_snapshot(
+                _snapshot_from_profile(None, shift, encode, None, profile),
+                in_sync,
+                length=document.characterCount() - 1,
+            )
+            return
+
+        text = self.deps.input_widget.toPlainText()  # type: ignore[attr-defined]
+        fingerprint = text_fingerprint(text) if len(text) >= defaults.PRECOMPUTE_THRESHOLD else None
+        cached = fingerprint is not None and self._is_cached(fingerprint, rotation(shift, encode))
+        if not cached and profile is None and len(text) >= defaults.BACKGROUND_THRESHOLD:
+            # Until the job lands the output only mirrors the input if it was
+            # patched in sync; otherwise block further incremental patches.
+            self._rendered = (shift, encode) if in_sync else None
+            self._start_job(text, shift, encode, in_sync, fingerprint, revision)
+            return
+
+        snapshot = _compute_snapshot(
+            text,
+            shift,
+            encode,
+            cache=self._shift_cache,
+            fingerprint=fingerprint,
+            profile=profile,
+            materialize=not in_sync,
+        )
+        if snapshot is not None:
+            self._adopt_index(snapshot, revision)
+            self._apply_snapshot(snapshot, in_sync, fingerprint)
+
+    @property
+    def shift_cache(self) -> ShiftCache:
+        """Outputs of the current text for other shifts, filled in the background."""
+        return self._shift_cache
+
+    def _adopt_index(self, snapshot: CipherSnapshot, revision: int) -> None:
+        """Keep the index built while scanning ``snapshot.text`` if it is still current."""
+        document = self.deps.input_widget.document()  # type: ignore[attr-defined]
+        if snapshot.index is None or document.revision() != revision:
+            return
+        if snapshot.text is not None and len(snapshot.text) == document.characterCount() - 1:  # Qt positions
+            self._text_index, self._index_revision = snapshot.index, revision
+
+    def _is_cached(self, fingerprint: Fingerprint, key: int) -> bool:
+        cache = self._shift_cache
+        return cache.get_profile(fingerprint) is not None and cache.get(fingerprint, key) is not None
+
+    def wait_for_background(self, msecs: int = -1) -> bool:
+        """Block until background jobs finish and deliver their results."""
+        done = bool(self._pool.waitForDone(msecs))
+        QtCore.QCoreApplication.sendPostedEvents()
+        return done
+
+    def _start_job(
+        self,
+        text: str,
+        shift: int,
+        encode: bool,
+        in_sync: bool,
+        fingerprint: Fingerprint | None,
+        revision: int,
+    ) -> None:
+        generation = self._generation
+
+        def task() -> CipherSnapshot | None:
+            return _compute_snapshot(
+                text,
+                shift,
+                encode,
+                cancelled=lambda: self._generation != generation,
+                cache=self._shift_cache,
+                fingerprint=fingerprint,
+                materialize=not in_sync,
+            )
+
+        self._pool.clear()  # queued jobs are stale by definition
+        self._job_in_sync = in_sync
+        self._job_fingerprint = fingerprint
+        self._job_revision = revision
+        self.deps.status_banner.set_busy(True)
+        self._pool.start(CipherJob(generation, task, self._job_signals))
+
+    def _finish_job(self, generation: int, snapshot: CipherSnapshot) -> None:
+        if generation != self._generation:
+            return
+        self._adopt_index(snapshot, self._job_revision)
+        self._apply_snapshot(snapshot, self._job_in_sync, self._job_fingerprint)
+
+    def _start_precompute(self) -> None:
+        """Fill the shift cache for the current text, nearest shifts first.
+
+        A request made while typing carries neither text nor fingerprint;
+        the text is read here, once the input is idle, and hashed on the
+        worker.
+        """
+        request, self._precompute_request = self._precompute_request, None
+        if request is None or request[0] != self._generation:
+            return
+        generation, text, known, current = request
+        if text is None:
+            text = self.deps.input_widget.toPlainText()  # type: ignore[attr-defined]
+        source = text
+        cache = self._shift_cache
+        # Never precompute more than fits, or later shifts would evict earlier ones.
+        room = max(0, cache.budget // max(len(source), 1) - 1)
+
+        def task() -> None:
+            fingerprint = known if known is not None else text_fingerprint(source)
+            pending = sorted(
+                cache.missing(fingerprint),
+                key=lambda value: min((value - current) % 26, (current - value) % 26),
+            )[:room]
+            for value in pending:
+                if self._generation != generation:
+                    return
+                cache.put(fingerprint, value, source.translate(translation_table(value)))
+
+        if room:
+            self._pool.start(CipherJob(generation, task, self._job_signals))
+
+    def _apply_snapshot(
+        self,
+        snapshot: CipherSnapshot,
+        in_sync: bool,
+        fingerprint: Fingerprint | None = None,
+        *,
+        length: int | None = None,
+    ) -> None:
+        """Show ``snapshot``; one without text stands for the current input of ``length`` characters."""
+        text, shift, encode = snapshot.text, snapshot.shift, snapshot.encode
+        shifted_lower = LOWER[shift:] + LOWER[:shift]
+        self._set_highlights(snapshot.indexes)
+        result = snapshot.result
+        if isinstance(result, CipherView):
+            self._result_view, self._result_mode = result, None
+        elif text is not None:
+            self._result_view, self._result_mode = CipherView(text, shift, encode=encode), None
+        else:
+            self._result_view, self._result_mode = None, (shift, encode)
+        if not in_sync:
+            self.deps.output_widget.setPlainText(str(result))  # type: ignore[attr-defined]
+        self._rendered = (shift, encode)
         self.deps.status_banner.set_mode(
             encode=encode,
             shift=shift,
             source_char=LOWER[0] if encode else shifted_lower[0],
             target_char=shifted_lower[0] if encode else LOWER[0],
         )
-        focus_index = _resolve_focus_index(text, encode, shifted_lower, indexes)
-        plain_char = LOWER[focus_index]
-        cipher_char = shifted_lower[focus_index]
+        self.deps.status_banner.set_busy(False)
+        plain_char = LOWER[snapshot.focus_index]
+        cipher_char = shifted_lower[snapshot.focus_index]
         self.deps.focus_card.update_focus(plain_char, cipher_char, shift, encode=encode)
 
-        entry = HistoryEntry(
-            mode="ENC" if encode else "DEC",
-            shift=shift,
-            letters=sum(1 for ch in text if ch.isalpha()),
-            words=len(text.split()),
-            source=text,
-            result=result,
-        )
-        self._pending_history = entry
+        letters, words = snapshot.letters, snapshot.words
+
+        def pending_entry() -> HistoryEntry:
+            source = text if text is not None else self.deps.input_widget.toPlainText()  # type: ignore[attr-defined]
+            return HistoryEntry(
+                mode="ENC" if encode else "DEC",
+                shift=shift,
+                letters=letters,
+                words=words,
+                source=source,
+                fingerprint=fingerprint,
+            )
+
+        self._pending_history = pending_entry
         self._schedule_history_capture()
+        size = len(text) if text is not None else length or 0
+        if fingerprint is not None or size >= defaults.PRECOMPUTE_THRESHOLD:
+            self._precompute_request = (self._generation, text, fingerprint, rotation(shift, encode))
+            self._precompute_timer.start(defaults.PRECOMPUTE_DELAY_MS)
+
+    def _set_highlights(self, indexes: set[int]) -> None:
+        self._highlight_indices = indexes
+        self.deps.mapping_table.set_highlights(indexes)
 
     # History handling ---------------------------------------------------
     def _schedule_history_capture(self) -> None:
@@ -122,17 +417,133 @@ class CaesarController(QtCore.QObject):
             self._capture_history(force=True)
 
     def _capture_history(self, force: bool = False) -> None:
-        entry = self._pending_history
-        if not entry:
+        pending = self._pending_history
+        if not pending:
             return
         if not force and self.deps.input_widget.hasFocus():  # type: ignore[attr-defined]
             return
+        entry = pending()
+        self._pending_history = lambda: entry  # timer re-fires must not rebuild it
         if self._last_snapshot == entry:
             return
         self.deps.history_panel.add_entry(entry)
         self._last_snapshot = entry
 
 
+@dataclass(frozen=True)
+class CipherSnapshot:
+    """Everything the window shows for one text, shift and mode.
+
+    ``text`` and ``result`` are ``None`` for a snapshot derived from the
+    letter index alone, which stands for the current input document.
+    """
+
+    text: str | None
+    shift: int
+    encode: bool
+    result: str | CipherView | None
+    indexes: set[int]
+    focus_index: int
+    letters: int
+    words: int
+    index: TextIndex | None = field(default=None, compare=False, repr=False)
+
+
+def _compute_snapshot(
+    text: str,
+    shift: int,
+    encode: bool,
+    cancelled: Callable[[], bool] = lambda: False,
+    *,
+    cache: ShiftCache | None = None,
+    fingerprint: Fingerprint | None = None,
+    profile: TextProfile | None = None,
+    materialize: bool = True,
+) -> CipherSnapshot | None:
+    """Derive a snapshot, returning ``None`` as soon as ``cancelled()`` is true.
+
+    ``profile`` skips the scan when the caller already knows it. With a
+    ``cache`` and the text's ``fingerprint``, a cached profile and output
+    are reused and freshly computed ones are stored. A snapshot that had to
+    scan the text carries the resulting ``TextIndex``. With ``materialize``
+    false an uncached output stays a lazy ``CipherView``, for callers whose
+    output widget already shows it.
+    """
+    index = None
+    if profile is None and cache is not None and fingerprint is not None:
+        profile = cache.get_profile(fingerprint)
+    if profile is None:
+        index = _index_text(text, cancelled)
+        if index is None:
+            return None
+        profile = index.profile()
+    if cache is not None and fingerprint is not None:
+        cache.put_profile(fingerprint, profile)
+
+    key = rotation(shift, encode)
+    result: str | CipherView | None = None
+    if cache is not None and fingerprint is not None:
+        result = cache.get(fingerprint, key)
+    if result is None and not materialize:
+        result = CipherView(text, shift, encode=encode)
+    elif result is None:
+        result = text.translate(translation_table(shift, encode=encode))
+        if cache is not None and fingerprint is not None:
+            cache.put(fingerprint, key, result)
+    snapshot = _snapshot_from_profile(text, shift, encode, result, profile)
+    return replace(snapshot, index=index) if index is not None else snapshot
+
+
+def _index_text(text: str, cancelled: Callable[[], bool] = lambda: False) -> TextIndex | None:
+    """Build the letter index of ``text`` from scratch.
+
+    The text is fed in ``defaults.BACKGROUND_CHUNK`` slices so a stale
+    background job notices cancellation quickly.
+    """
+    index = TextIndex()
+    step = defaults.BACKGROUND_CHUNK
+    for start in range(0, len(text), step):
+        if cancelled():
+            return None
+        end = min(start + step, len(text))
+
+        def fetch(low: int, high: int, end: int = end) -> str:  # the text fed so far
+            return text[low : min(high, end)]
+
+        index.apply_edit(start, "", text[start:end], fetch)
+    if cancelled():
+        return None
+    return index
+
+
+def _document_text(document: QtGui.QTextDocument, start: int, end: int) -> str:
+    end = min(end, document.characterCount() - 1)
+    if start >= end:
+        return ""
+    cursor = QtGui.QTextCursor(document)
+    cursor.setPosition(start)
+    cursor.setPosition(end, QtGui.QTextCursor.MoveMode.KeepAnchor)
+    return cursor.selectedText().replace("\u2029", "\n")
+
+
+def _snapshot_from_profile(
+    text: str | None, shift: int, encode: bool, result: str | CipherView | None, profile: TextProfile
+) -> CipherSnapshot:
+    # In decode mode a letter's row is its plain index moved back by ``shift``.
+    offset = 0 if encode else shift
+    last = profile.last_letter
+    return CipherSnapshot(
+        text=text,
+        shift=shift,
+        encode=encode,
+        result=result,
+        indexes={(index - offset) % 26 for index in profile.present},
+        focus_index=0 if last is None else (last - offset) % 26,
+        letters=profile.letters,
+        words=profile.words,
+    )
+
+
 def _collect_indices(text: str, shifted_lower: str, encode: bool) -> set[int]:
     indices: set[int] = set()
     lookup = {char: idx for idx, char in enumerate(LOWER if encode else shifted_lower)}
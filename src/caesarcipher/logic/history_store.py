@@ -0,0 +1,267 @@
+"""SQLite-backed history that survives restarts and can be searched."""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Callable
+
+from caesarcipher.config import defaults
+from caesarcipher.core.fingerprint import Fingerprint
+from caesarcipher.ui.widgets.history_panel import HistoryEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    mode TEXT NOT NULL,
+    shift INTEGER NOT NULL,
+    letters INTEGER NOT NULL,
+    words INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    source BLOB NOT NULL,
+    label TEXT NOT NULL,
+    tooltip TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(source_preview, result_preview);
+"""
+_ROW_COLUMNS = "h.id, h.mode, h.shift, h.letters, h.words, h.length, h.digest, h.label, h.tooltip"
+_NEWEST = 2**63 - 1
+_BATCH_LIMIT = 256
+_CLEAR = object()
+_STOP = object()
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StoredEntry:
+    """A history row as listed from the store: everything but the source text."""
+
+    id: int
+    mode: str
+    shift: int
+    letters: int
+    words: int
+    fingerprint: Fingerprint
+    preview: str
+    details: str
+
+    def label(self) -> str:
+        return self.preview
+
+    def tooltip(self) -> str:
+        return self.details
+
+
+class HistoryStore:
+    """History entries in a local SQLite database.
+
+    The database runs in WAL mode so the GUI thread can page through and
+    search entries while a background thread writes. ``add`` only queues
+    the entry; the writer commits whatever has queued up in one transaction
+    (compressing sources there, off the GUI thread) and keeps the newest
+    ``max_entries`` rows. An FTS5 index over the source and result previews
+    backs ``page(query=...)``.
+
+    ``on_commit``, when set, is called on the writer thread after every
+    batch with the ``(entry, stored row)`` pairs it wrote and whether the
+    batch handled a ``clear``. A failed batch reports no rows; its error is
+    logged and kept in ``last_error``.
+
+    Reads on a store must come from the thread that created it.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, max_entries: int = defaults.HISTORY_LIMIT) -> None:
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.last_error: sqlite3.Error | None = None
+        self.on_commit: Callable[[list[tuple[HistoryEntry, StoredEntry]], bool], None] | None = None
+        self._reader = self._connect()
+        self._reader.executescript(_SCHEMA)
+        self._queue: queue.Queue[object] = queue.Queue()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="caesar-history-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    # Writes (queued) ------------------------------------------------------
+    def add(self, entry: HistoryEntry) -> None:
+        """Queue ``entry`` for the background writer."""
+        self._queue.put(entry)
+
+    def clear(self) -> None:
+        """Queue deleting every entry, after the writes queued before it."""
+        self._queue.put(_CLEAR)
+
+    def flush(self) -> None:
+        """Block until every queued write is committed."""
+        if not self._closed:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Commit pending writes and stop the writer; safe to call twice."""
+        if self._closed:
+            return
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._closed = True
+        self._reader.close()
+
+    def _write_loop(self) -> None:
+        connection = self._connect()
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < _BATCH_LIMIT and batch[-1] is not _STOP:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                written: list[tuple[HistoryEntry, StoredEntry]] = []
+                try:
+                    written = self._write_batch(connection, batch)
+                except sqlite3.Error as exc:
+                    self.last_error = exc
+                    _log.warning("could not write %d history change(s) to %s: %s", len(batch), self.path, exc)
+                callback = self.on_commit
+                if callback is not None:
+                    try:
+                        callback(written, _CLEAR in batch)
+                    except RuntimeError:  # the listening model was deleted
+                        self.on_commit = None
+                for _ in batch:
+                    self._queue.task_done()
+                if batch[-1] is _STOP:
+                    return
+        finally:
+            connection.close()
+
+    def _write_batch(
+        self, connection: sqlite3.Connection, batch: list[object]
+    ) -> list[tuple[HistoryEntry, StoredEntry]]:
+        written: list[tuple[HistoryEntry, StoredEntry]] = []
+        with connection:  # one transaction per batch
+            connection.execute("BEGIN")
+            for item in batch:
+                if item is _CLEAR:
+                    connection.execute("DELETE FROM history")
+                    connection.execute("DELETE FROM history_fts")
+                    written.clear()
+                elif isinstance(item, HistoryEntry):
+                    written.append((item, self._insert(connection, item)))
+            cutoff = connection.execute(
+                "SELECT id FROM history ORDER BY id DESC LIMIT 1 OFFSET ?", (self.max_entries,)
+            ).fetchone()
+            if cutoff is not None:
+                connection.execute("DELETE FROM history WHERE id <= ?", cutoff)
+                connection.execute("DELETE FROM history_fts WHERE rowid <= ?", cutoff)
+        return written
+
+    @staticmethod
+    def _insert(connection: sqlite3.Connection, entry: HistoryEntry) -> StoredEntry:
+        length, digest = entry.fingerprint
+        label, tooltip = entry.label(), entry.tooltip()
+        cursor = connection.execute(
+            "INSERT INTO history (mode, shift, letters, words, length, digest, source, label, tooltip)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.mode,
+                entry.shift,
+                entry.letters,
+                entry.words,
+                length,
+                digest,
+                entry.compressed_source(),
+                label,
+                tooltip,
+            ),
+        )
+        entry_id = cursor.lastrowid or 0
+        connection.execute(
+            "INSERT INTO history_fts (rowid, source_preview, result_preview) VALUES (?, ?, ?)",
+            (entry_id, *entry.preview_texts()),
+        )
+        return StoredEntry(
+            id=entry_id,
+            mode=entry.mode,
+            shift=entry.shift,
+            letters=entry.letters,
+            words=entry.words,
+            fingerprint=entry.fingerprint,
+            preview=label,
+            details=tooltip,
+        )
+
+    # Reads ------------------------------------------------------------------
+    def page(
+        self, before: int | None = None, limit: int = defaults.HISTORY_PAGE_SIZE, query: str = ""
+    ) -> list[StoredEntry]:
+        """Up to ``limit`` entries older than id ``before``, newest first.
+
+        ``query`` keeps only entries whose previews contain every word of it
+        as a prefix (an FTS5 match); a query without words matches nothing.
+        """
+        newest = _NEWEST if before is None else before
+        if not query.strip():
+            sql = f"SELECT {_ROW_COLUMNS} FROM history AS h WHERE h.id < ? ORDER BY h.id DESC LIMIT ?"
+            rows = self._reader.execute(sql, (newest, limit)).fetchall()
+        else:
+            expression = _match_expression(query)
+            if not expression:
+                return []
+            # FTS5 walks its rowids in descending order natively, so only one
+            # page of matches is ever read.
+            sql = (
+                f"SELECT {_ROW_COLUMNS} FROM history AS h JOIN ("
+                "SELECT rowid FROM history_fts WHERE history_fts MATCH ? AND rowid < ?"
+                " ORDER BY rowid DESC LIMIT ?) AS hit ON h.id = hit.rowid ORDER BY h.id DESC"
+            )
+            rows = self._reader.execute(sql, (expression, newest, limit)).fetchall()
+        return [
+            StoredEntry(
+                id=row[0],
+                mode=row[1],
+                shift=row[2],
+                letters=row[3],
+                words=row[4],
+                fingerprint=(row[5], row[6]),
+                preview=row[7],
+                details=row[8],
+            )
+            for row in rows
+        ]
+
+    def load(self, entry_id: int) -> HistoryEntry | None:
+        """The full entry (source included) for ``entry_id``."""
+        row = self._reader.execute(
+            "SELECT mode, shift, letters, words, length, digest, source, label, tooltip FROM history WHERE id = ?",
+            (entry_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        mode, shift, letters, words, length, digest, source, label, tooltip = row
+        return HistoryEntry.from_compressed(
+            mode, shift, letters, words, source, (length, digest), label=label, tooltip=tooltip
+        )
+
+    def count(self) -> int:
+        return int(self._reader.execute("SELECT count(*) FROM history").fetchone()[0])
+
+
+def _match_expression(query: str) -> str:
+    """Turn free text into an FTS5 expression: every word, as a quoted prefix."""
+    words = [word for word in query.split() if any(ch.isalnum() for ch in word)]
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+
+
+__all__ = ["HistoryStore", "StoredEntry"]
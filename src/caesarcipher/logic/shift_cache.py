@@ -0,0 +1,106 @@
+"""Bounded cache of cipher outputs for every shift of the current text."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from caesarcipher.core.fingerprint import Fingerprint, text_fingerprint
+
+
+def rotation(shift: int, encode: bool) -> int:
+    """Return the forward rotation (1-25) applied by ``shift`` in the given mode.
+
+    Encoding with ``n`` and decoding with ``26 - n`` give identical output, so
+    cached results are shared between the two.
+    """
+
+    return shift % 26 if encode else (-shift) % 26
+
+
+@dataclass(frozen=True)
+class TextProfile:
+    """Shift-independent facts about a text, enough to rebuild any snapshot."""
+
+    present: frozenset[int]
+    last_letter: int | None
+    letters: int
+    words: int
+
+
+class ShiftCache:
+    """LRU of translated outputs keyed by text fingerprint and rotation.
+
+    The total number of cached characters stays within ``budget`` (the least
+    recently used outputs are evicted first). A handful of ``TextProfile``
+    objects are kept alongside. All methods are thread-safe so background
+    jobs can fill the cache while the GUI thread reads it.
+    """
+
+    def __init__(self, budget: int, *, profiles: int = 8) -> None:
+        self.budget = budget
+        self._results: OrderedDict[tuple[Fingerprint, int], str] = OrderedDict()
+        self._profiles: OrderedDict[Fingerprint, TextProfile] = OrderedDict()
+        self._profile_limit = profiles
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of characters currently cached."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, fingerprint: Fingerprint, rotation: int) -> str | None:
+        with self._lock:
+            result = self._results.get((fingerprint, rotation))
+            if result is not None:
+                self._results.move_to_end((fingerprint, rotation))
+            return result
+
+    def put(self, fingerprint: Fingerprint, rotation: int, result: str) -> bool:
+        """Cache ``result``; returns ``False`` if it is larger than the whole budget."""
+        if len(result) > self.budget:
+            return False
+        key = (fingerprint, rotation)
+        with self._lock:
+            previous = self._results.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._results[key] = result
+            self._size += len(result)
+            while self._size > self.budget:
+                _, evicted = self._results.popitem(last=False)
+                self._size -= len(evicted)
+        return True
+
+    def missing(self, fingerprint: Fingerprint) -> list[int]:
+        """Rotations (1-25) of ``fingerprint`` that are not cached yet."""
+        with self._lock:
+            return [value for value in range(1, 26) if (fingerprint, value) not in self._results]
+
+    def get_profile(self, fingerprint: Fingerprint) -> TextProfile | None:
+        with self._lock:
+            profile = self._profiles.get(fingerprint)
+            if profile is not None:
+                self._profiles.move_to_end(fingerprint)
+            return profile
+
+    def put_profile(self, fingerprint: Fingerprint, profile: TextProfile) -> None:
+        with self._lock:
+            self._profiles[fingerprint] = profile
+            self._profiles.move_to_end(fingerprint)
+            while len(self._profiles) > self._profile_limit:
+                self._profiles.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._profiles.clear()
+            self._size = 0
+
+
+__all__ = ["Fingerprint", "ShiftCache", "TextProfile", "rotation", "text_fingerprint"]
@@ -0,0 +1,151 @@
+"""Letter counts and last-letter tracking maintained from document edits."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from caesarcipher.core.crypto import LOWER
+from caesarcipher.logic.shift_cache import TextProfile
+
+Fetch = Callable[[int, int], str]
+_LETTERS = frozenset(LOWER)
+_CONTEXT_BLOCK = 64
+_ASCII_LETTERS_DELETED = dict.fromkeys(map(ord, LOWER + LOWER.upper()))
+
+
+class TextIndex:
+    """Per-letter counts, letter/word totals and the last letter of a document.
+
+    ``apply_edit`` updates everything from one edit (the removed and added
+    text plus a ``fetch(start, end)`` reader for the document after the
+    edit), so the cost depends on the edit size rather than the document
+    size. Letters are counted the way ``_collect_indices`` and
+    ``_resolve_focus_index`` see them: ASCII letters of the lower-cased text.
+
+    Positions only have to agree with ``fetch``; Qt documents count
+    characters outside the Basic Multilingual Plane as two positions, so
+    callers feeding Qt edits must drop the index when such text appears.
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(LOWER)
+        self.letters = 0
+        self.words = 0
+        self.last_position: int | None = None
+        self.last_letter: int | None = None
+
+    @classmethod
+    def from_text(cls, text: str) -> "TextIndex":
+        index = cls()
+        index.apply_edit(0, "", text, lambda start, end: text[start:end])
+        return index
+
+    def apply_edit(self, position: int, removed: str, added: str, fetch: Fetch) -> None:
+        """Account for ``removed`` being replaced by ``added`` at ``position``."""
+        for slot, (gone, new) in enumerate(zip(_letter_counts(removed), _letter_counts(added))):
+            self.counts[slot] += new - gone
+        self.letters += _alpha_count(added) - _alpha_count(removed)
+
+        left = _left_context(fetch, position)
+        right = _right_context(fetch, position + len(added))
+        self.words += len((left + added + right).split()) - len((left + removed + right).split())
+
+        self._move_last_letter(position, removed, added, fetch)
+
+    def present(self) -> set[int]:
+        """Indexes (0-25) of letters that occur at least once."""
+        return {slot for slot, count in enumerate(self.counts) if count}
+
+    def profile(self) -> TextProfile:
+        """Snapshot the counters as a shift-independent ``TextProfile``."""
+        return TextProfile(
+            present=frozenset(self.present()),
+            last_letter=self.last_letter,
+            letters=self.letters,
+            words=self.words,
+        )
+
+    def _move_last_letter(self, position: int, removed: str, added: str, fetch: Fetch) -> None:
+        last = self.last_position
+        end = position + len(removed)
+        if last is not None and last >= end:
+            self.last_position = last + len(added) - len(removed)
+            return
+        found = _last_letter(added)
+        if found is not None:
+            self.last_position, self.last_letter = position + found[0], found[1]
+        elif last is not None and last >= position:
+            # The last letter was deleted; look further back.
+            self.last_position, self.last_letter = _scan_back_for_letter(fetch, position)
+
+
+def _letter_counts(text: str) -> list[int]:
+    if not text:
+        return [0] * len(LOWER)
+    lowered = text.lower()
+    return [lowered.count(letter) for letter in LOWER]
+
+
+def _alpha_count(text: str) -> int:
+    if text.isascii():
+        return len(text) - len(text.translate(_ASCII_LETTERS_DELETED))
+    return sum(map(str.isalpha, text))
+
+
+def _letter_of(ch: str) -> int | None:
+    for low in reversed(ch.lower()):
+        if low in _LETTERS:
+            return LOWER.index(low)
+    return None
+
+
+def _last_letter(text: str) -> tuple[int, int] | None:
+    for offset in range(len(text) - 1, -1, -1):
+        letter = _letter_of(text[offset])
+        if letter is not None:
+            return offset, letter
+    return None
+
+
+def _scan_back_for_letter(fetch: Fetch, position: int) -> tuple[int | None, int | None]:
+    end = position
+    while end > 0:
+        start = max(0, end - _CONTEXT_BLOCK)
+        found = _last_letter(fetch(start, end))
+        if found is not None:
+            return start + found[0], found[1]
+        end = start
+    return None, None
+
+
+def _left_context(fetch: Fetch, position: int) -> str:
+    parts: list[str] = []
+    end = position
+    while end > 0:
+        start = max(0, end - _CONTEXT_BLOCK)
+        block = fetch(start, end)
+        for offset in range(len(block) - 1, -1, -1):
+            if block[offset].isspace():
+                parts.append(block[offset + 1 :])
+                return "".join(reversed(parts))
+        parts.append(block)
+        end = start
+    return "".join(reversed(parts))
+
+
+def _right_context(fetch: Fetch, position: int) -> str:
+    parts: list[str] = []
+    start = position
+    while True:
+        block = fetch(start, start + _CONTEXT_BLOCK)
+        for offset, ch in enumerate(block):
+            if ch.isspace():
+                parts.append(block[:offset])
+                return "".join(parts)
+        parts.append(block)
+        if len(block) < _CONTEXT_BLOCK:
+            return "".join(parts)
+        start += len(block)
+
+
+__all__ = ["TextIndex"]
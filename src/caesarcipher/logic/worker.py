@@ -0,0 +1,41 @@
+"""Thread-pool job used to keep large cipher runs off the GUI thread."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from PyQt6 import QtCore
+
+
+class JobSignals(QtCore.QObject):
+    """Signals shared by every :class:`CipherJob` of one owner.
+
+    Create it once on the GUI thread and keep it for the owner's lifetime;
+    jobs may still be running after their owner stopped caring about them.
+    """
+
+    finished = QtCore.pyqtSignal(int, object)
+
+
+class CipherJob(QtCore.QRunnable):
+    """Run ``task`` on a pool thread and report ``(generation, result)``.
+
+    ``task`` returns ``None`` when it noticed it was cancelled; nothing is
+    emitted in that case. Results are delivered through a queued signal, so
+    receivers run on the GUI thread and can compare ``generation`` against
+    the newest job they started.
+    """
+
+    def __init__(self, generation: int, task: Callable[[], Any], signals: JobSignals) -> None:
+        super().__init__()
+        self.generation = generation
+        self.signals = signals
+        self._task = task
+
+    def run(self) -> None:
+        result = self._task()
+        if result is not None:
+            self.signals.finished.emit(self.generation, result)
+
+
+__all__ = ["CipherJob", "JobSignals"]
@@ -6,6 +6,7 @@ from PyQt6 import QtCore, QtGui, QtWidgets
 
 from caesarcipher.config import defaults
 from caesarcipher.logic.controller import CaesarController, ControllerDependencies
+from caesarcipher.logic.history_store import HistoryStore
 from caesarcipher.ui.widgets.common import FocusAwarePlainTextEdit
 from caesarcipher.ui.widgets.history_panel import HistoryEntry, HistoryPanel
 from caesarcipher.ui.widgets.info_panel import InfoPanel
@@ -15,9 +16,13 @@ from caesarcipher.ui.widgets.mapping_focus_card import MappingFocusCard
 
 
 class CaesarWindow(QtWidgets.QWidget):
-    """Top-level widget hosting the Caesar cipher playground."""
+    """Top-level widget hosting the Caesar cipher playground.
 
-    def __init__(self) -> None:
+    Pass a ``history_store`` to keep the history across sessions and make it
+    searchable; without one the history lives only as long as the window.
+    """
+
+    def __init__(self, history_store: HistoryStore | None = None) -> None:
         super().__init__()
         self.setWindowTitle("Caesar Cipher: Educational")
         self.setMinimumSize(960, 560)
@@ -67,7 +72,7 @@ class CaesarWindow(QtWidgets.QWidget):
         self.mapping_table = MappingTableWidget()
         self.mapping_focus = MappingFocusCard(self)
         self.mapping_focus.hide()
-        self.history_panel = HistoryPanel()
+        self.history_panel = HistoryPanel(store=history_store)
         self.history_panel.setToolTip("Double-click an item to reuse that result as new input.")
         self.info_toggle = QtWidgets.QToolButton()
         self.info_toggle.setText("Show Explanation ▾")
@@ -171,7 +176,17 @@ class CaesarWindow(QtWidgets.QWidget):
 
         splitter = QtWidgets.QSplitter()
         splitter.addWidget(left_panel)
-        splitter.addWidget(self.history_panel)
+        search_box = self.history_panel.search_box
+        if search_box is None:
+            splitter.addWidget(self.history_panel)
+        else:
+            history_section = QtWidgets.QWidget()
+            history_layout = QtWidgets.QVBoxLayout(history_section)
+            history_layout.setContentsMargins(0, 0, 0, 0)
+            history_layout.setSpacing(6)
+            history_layout.addWidget(search_box)
+            history_layout.addWidget(self.history_panel, stretch=1)
+            splitter.addWidget(history_section)
         splitter.setHandleWidth(6)
         splitter.setChildrenCollapsible(False)
         splitter.setSizes([820, 320])
@@ -184,6 +199,11 @@ class CaesarWindow(QtWidgets.QWidget):
         root_layout.addWidget(splitter)
 
     def _wire_signals(self) -> None:
+        # contentsChange fires before textChanged, letting the controller
+        # patch the output in place before run_cipher refreshes the rest.
+        document = self.input_edit.document()
+        if document is not None:
+            document.contentsChange.connect(self.controller.apply_input_edit)
         self.input_edit.textChanged.connect(self.controller.run_cipher)
         self.input_edit.editingFinished.connect(self.controller.force_history_capture)
         self.shift_spin.valueChanged.connect(self.controller.run_cipher)
@@ -218,18 +238,20 @@ class CaesarWindow(QtWidgets.QWidget):
             clipboard.setText(self.output_edit.toPlainText())
 
     def _clear_all(self) -> None:
-        self.input_edit.clear()
-        self.output_edit.clear()
-        self.history_panel.clear()
-        self.controller.run_cipher()
+        with self.controller.batch():
+            self.input_edit.clear()
+            self.output_edit.clear()
+            self.history_panel.clear()
+            self.controller.run_cipher()
 
     def _reuse_history_entry(self, entry: HistoryEntry) -> None:
-        if entry.mode == "ENC":
-            self.decode_btn.setChecked(True)
-        else:
-            self.encode_btn.setChecked(True)
-        self.shift_spin.setValue(entry.shift)
-        self.input_edit.setPlainText(entry.result)
+        with self.controller.batch():
+            if entry.mode == "ENC":
+                self.decode_btn.setChecked(True)
+            else:
+                self.encode_btn.setChecked(True)
+            self.shift_spin.setValue(entry.shift)
+            self.input_edit.setPlainText(entry.result)
         self.input_edit.moveCursor(QtGui.QTextCursor.MoveOperation.End)
         self.input_edit.setFocus()
 
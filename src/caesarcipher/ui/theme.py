@@ -62,7 +62,7 @@ def apply_theme(app: QtWidgets.QApplication) -> None:
             color: #00FFAA;
             font-weight: 600;
         }
-        QTextEdit, QPlainTextEdit, QListWidget, QTableWidget {
+        QTextEdit, QPlainTextEdit, QListWidget, QTableWidget, QTableView#historyList {
             background: #1F1F1F;
             border: 1px solid #2D2D2D;
             border-radius: 10px;
@@ -117,13 +117,13 @@ def apply_theme(app: QtWidgets.QApplication) -> None:
         QToolButton:checked {
             color: #FFD54F;
         }
-        QListWidget::item {
+        QListWidget::item, QTableView#historyList::item {
             padding: 6px 8px;
         }
-        QListWidget::item:hover {
+        QListWidget::item:hover, QTableView#historyList::item:hover {
             background: rgba(0, 255, 170, 0.08);
         }
-        QListWidget::item:selected {
+        QListWidget::item:selected, QTableView#historyList::item:selected {
             background: rgba(0, 255, 170, 0.25);
             color: #00FFAA;
         }
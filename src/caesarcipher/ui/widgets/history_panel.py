@@ -1,45 +1,485 @@
-"""History list widget matching the legacy UI styling."""
+"""History list matching the legacy UI styling."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+import sys
+import zlib
+from typing import TYPE_CHECKING, Any
 
-from PyQt6 import QtCore, QtWidgets
+from PyQt6 import QtCore, QtGui, QtWidgets
 
 from caesarcipher.config.defaults import (
+    HISTORY_BYTES_BUDGET,
+    HISTORY_COMPRESS_THRESHOLD,
     HISTORY_LIMIT,
+    HISTORY_PAGE_SIZE,
     HISTORY_PREVIEW_LENGTH,
+    HISTORY_TOOLTIP_LENGTH,
     MONOSPACE_FALLBACK,
 )
+from caesarcipher.core.crypto import translation_table
+from caesarcipher.core.fingerprint import Fingerprint, text_fingerprint
+
+if TYPE_CHECKING:
+    from caesarcipher.logic.history_store import HistoryStore, StoredEntry
+
+_WORD = re.compile(r"\w+")
 
 
-@dataclass(frozen=True)
 class HistoryEntry:
-    mode: str  # "ENC" or "DEC"
-    shift: int
-    letters: int
-    words: int
-    source: str
-    result: str
+    """One transformation kept in the history.
+
+    Only the source text is stored: the result is recomputed from ``source``,
+    ``shift`` and ``mode`` when asked for. Once the entry is stored by a
+    ``HistoryModel`` (see ``compact``), sources of at least
+    ``HISTORY_COMPRESS_THRESHOLD`` characters are zlib-compressed and the
+    label and tooltip are cached, so painting never touches the full text.
+
+    Entries compare by mode, shift and the source's ``fingerprint``, which
+    is computed once here (or passed in by a caller that already has it), so
+    duplicate checks cost the same for any text size.
+    """
+
+    __slots__ = ("mode", "shift", "letters", "words", "fingerprint", "_payload", "_label", "_tooltip", "_detail")
+
+    def __init__(
+        self,
+        mode: str,
+        shift: int,
+        letters: int,
+        words: int,
+        source: str,
+        fingerprint: Fingerprint | None = None,
+    ) -> None:
+        self.mode = mode  # "ENC" or "DEC"
+        self.shift = shift
+        self.letters = letters
+        self.words = words
+        self.fingerprint = fingerprint if fingerprint is not None else text_fingerprint(source)
+        self._payload: str | bytes = source
+        self._label: str | None = None
+        self._tooltip: str | None = None
+        self._detail: str | None = None
+
+    @classmethod
+    def from_compressed(
+        cls,
+        mode: str,
+        shift: int,
+        letters: int,
+        words: int,
+        payload: bytes,
+        fingerprint: Fingerprint,
+        *,
+        label: str | None = None,
+        tooltip: str | None = None,
+    ) -> HistoryEntry:
+        """Rebuild an entry from ``compressed_source()`` output, e.g. read back from disk."""
+        entry = cls(mode, shift, letters, words, "", fingerprint)
+        entry._payload = payload
+        entry._label, entry._tooltip = label, tooltip
+        return entry
+
+    @property
+    def source(self) -> str:
+        payload = self._payload
+        if isinstance(payload, bytes):
+            return zlib.decompress(payload).decode("utf-8", "surrogatepass")
+        return payload
+
+    @property
+    def result(self) -> str:
+        return self.source.translate(translation_table(self.shift, encode=self.mode == "ENC"))
+
+    @property
+    def size(self) -> int:
+        """Bytes held by the stored source."""
+        return sys.getsizeof(self._payload)
+
+    def compact(self) -> None:
+        """Cache the previews and compress a large source; safe to call repeatedly."""
+        payload = self._payload
+        if isinstance(payload, bytes):
+            return
+        self._previews(payload)
+        if len(payload) >= HISTORY_COMPRESS_THRESHOLD:
+            self._payload = self.compressed_source()
+
+    def compressed_source(self) -> bytes:
+        """The source as zlib-compressed UTF-8, without changing the entry."""
+        payload = self._payload
+        if isinstance(payload, bytes):
+            return payload
+        return zlib.compress(payload.encode("utf-8", "surrogatepass"), 1)
 
     def label(self) -> str:
-        preview_source = _preview(self.source, HISTORY_PREVIEW_LENGTH)
-        preview_result = _preview(self.result, HISTORY_PREVIEW_LENGTH)
+        if self._label is None:
+            self._previews(self.source)
+        return self._label  # type: ignore[return-value]
+
+    def tooltip(self) -> str:
+        if self._tooltip is None:
+            self._previews(self.source)
+        return self._tooltip  # type: ignore[return-value]
+
+    def preview_texts(self) -> tuple[str, str]:
+        """Tooltip-length previews of the source and of the result."""
+        if self._detail is None:
+            self._previews(self.source)
+        detail = self._detail or ""
+        return detail, detail.translate(translation_table(self.shift, encode=self.mode == "ENC"))
+
+    def _previews(self, source: str) -> None:
+        # Letters rotate in place and whitespace is untouched, so the
+        # result's preview is the translated preview of the source.
+        table = translation_table(self.shift, encode=self.mode == "ENC")
         arrow = "→" if self.mode == "ENC" else "←"
-        return f"{preview_source} {arrow} {preview_result}"
+        short = _preview(source, HISTORY_PREVIEW_LENGTH)
+        self._label = f"{short} {arrow} {short.translate(table)}"
+        detail = self._detail = _preview(source, HISTORY_TOOLTIP_LENGTH)
+        self._tooltip = (
+            f"{self.mode} shift={self.shift}\nLetters={self.letters} Words={self.words}\n"
+            f"{detail} → {detail.translate(table)}"
+        )
+
+    def _key(self) -> tuple[str, int, Fingerprint]:
+        return self.mode, self.shift, self.fingerprint
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HistoryEntry):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f"HistoryEntry(mode={self.mode!r}, shift={self.shift}, letters={self.letters}, "
+            f"words={self.words}, size={self.size})"
+        )
 
 
 def _preview(text: str, limit: int) -> str:
+    """Whitespace-collapsed start of ``text``, ellipsised past ``limit`` characters.
+
+    Only a prefix of ``text`` is split, doubling it until the preview is
+    known, so the cost does not grow with the length of the text.
+    """
     if limit <= 0:
         return ""
-    flattened = " ".join(text.split())
-    if len(flattened) <= limit:
-        return flattened
-    return flattened[: max(1, limit - 1)].rstrip() + "…"
+    size = 2 * limit + 16
+    while True:
+        flattened = " ".join(text[:size].split())
+        if len(flattened) > limit:
+            return flattened[: max(1, limit - 1)].rstrip() + "…"
+        if size >= len(text):
+            return flattened
+        size *= 2
+
+
+class HistoryModel(QtCore.QAbstractListModel):
+    """Newest-first list model over a fixed-size ring buffer.
+
+    Adding an entry writes one slot and evicts only as many of the oldest
+    entries as needed to stay within ``capacity`` entries and ``max_bytes``
+    of stored sources (the newest entry is always kept), so the cost does
+    not depend on how many entries are kept. Labels and tooltips are served
+    from each entry's cache in ``data()``, only for the rows a view asks for.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        parent: QtCore.QObject | None = None,
+        *,
+        max_bytes: int = HISTORY_BYTES_BUDGET,
+    ) -> None:
+        super().__init__(parent)
+        self._capacity = max(1, capacity)
+        self._max_bytes = max_bytes
+        self._slots: list[HistoryEntry | None] = [None] * self._capacity
+        self._head = -1  # slot of the newest entry
+        self._count = 0
+        self._bytes = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes held by the stored sources of all entries."""
+        return self._bytes
+
+    def rowCount(self, parent: QtCore.QModelIndex | None = None) -> int:
+        return 0 if parent is not None and parent.isValid() else self._count
+
+    def entry(self, row: int) -> HistoryEntry | None:
+        """Entry at ``row`` (0 is the newest) or ``None`` when out of range."""
+        if not 0 <= row < self._count:
+            return None
+        return self._slots[(self._head - row) % self._capacity]
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        entry = self.entry(index.row()) if index.isValid() else None
+        if entry is None:
+            return None
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return entry.label()
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return entry.tooltip()
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return entry
+        return None
+
+    def prepend(self, entry: HistoryEntry) -> None:
+        """Insert ``entry`` as row 0, dropping the oldest rows over the limits."""
+        entry.compact()
+        size = entry.size
+        keep = min(self._count, self._capacity - 1)
+        total = self._bytes - sum(self._size_of(row) for row in range(keep, self._count))
+        while keep and total + size > self._max_bytes:
+            keep -= 1
+            total -= self._size_of(keep)
+        if keep < self._count:
+            self.beginRemoveRows(QtCore.QModelIndex(), keep, self._count - 1)
+            for row in range(keep, self._count):
+                self._slots[(self._head - row) % self._capacity] = None
+            self._count, self._bytes = keep, total
+            self.endRemoveRows()
+        self.beginInsertRows(QtCore.QModelIndex(), 0, 0)
+        self._head = (self._head + 1) % self._capacity
+        self._slots[self._head] = entry
+        self._count += 1
+        self._bytes += size
+        self.endInsertRows()
+
+    def latest_entry(self) -> HistoryEntry | None:
+        return self.entry(0)
+
+    def is_latest(self, entry: HistoryEntry) -> bool:
+        return self.entry(0) == entry
 
+    def _size_of(self, row: int) -> int:
+        entry = self.entry(row)
+        return entry.size if entry is not None else 0
 
-class HistoryPanel(QtWidgets.QListWidget):
-    """Simple QListWidget helper storing the most recent transformations."""
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._slots = [None] * self._capacity
+        self._head, self._count, self._bytes = -1, 0, 0
+        self.endResetModel()
+
+
+class StoredHistoryModel(QtCore.QAbstractListModel):
+    """Newest-first rows of a ``HistoryStore``, read a page at a time.
+
+    Only the first page is loaded up front; views call ``fetchMore`` as they
+    scroll towards the end. Rows from the store carry their label and
+    tooltip but not the source, which is loaded when the entry is asked
+    for. New entries are shown at once and handed to the store's writer,
+    which compresses them off the GUI thread; once it reports them committed
+    they are swapped for rows without a source. Until then their
+    uncompressed sources count against ``max_bytes``,
+    and the oldest are dropped from view (until the rows are next reloaded
+    from the store) rather than exceed it.
+
+    ``set_filter`` replaces the rows with a full-text search of the
+    committed rows plus a match over the entries still waiting for the
+    writer, so searching never waits for it.
+    """
+
+    _committed = QtCore.pyqtSignal(object, bool)  # relays HistoryStore.on_commit to the GUI thread
+
+    def __init__(
+        self,
+        store: HistoryStore,
+        parent: QtCore.QObject | None = None,
+        *,
+        capacity: int = HISTORY_LIMIT,
+        page_size: int = HISTORY_PAGE_SIZE,
+        max_bytes: int = HISTORY_BYTES_BUDGET,
+    ) -> None:
+        super().__init__(parent)
+        self._store = store
+        self._capacity = max(1, capacity)
+        self._page_size = page_size
+        self._max_bytes = max_bytes
+        self._rows: list[HistoryEntry | StoredEntry] = []
+        self._query = ""
+        self._oldest_id: int | None = None
+        self._exhausted = False
+        self._pending: list[HistoryEntry] = []  # newest first, not committed yet
+        self._pending_bytes = 0
+        self._pending_clears = 0
+        self._newest_id: int | None = None  # committed rows above this id are not shown yet
+        self._load_page()
+        self._latest: HistoryEntry | StoredEntry | None = self._rows[0] if self._rows else None
+        self._newest_id = self._rows[0].id if self._rows else 0  # type: ignore[union-attr]
+        self._committed.connect(self._apply_commit)
+        store.on_commit = self._committed.emit
+
+    @property
+    def query(self) -> str:
+        return self._query
+
+    def rowCount(self, parent: QtCore.QModelIndex | None = None) -> int:
+        return 0 if parent is not None and parent.isValid() else len(self._rows)
+
+    def entry(self, row: int) -> HistoryEntry | None:
+        """Entry at ``row`` (0 is the newest shown), loading its source if needed."""
+        if not 0 <= row < len(self._rows):
+            return None
+        return self._resolve(self._rows[row])
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        item = self._rows[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return item.label()
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return item.tooltip()
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return item
+        return None
+
+    def canFetchMore(self, parent: QtCore.QModelIndex | None = None) -> bool:
+        return (parent is None or not parent.isValid()) and not self._exhausted
+
+    def fetchMore(self, parent: QtCore.QModelIndex | None = None) -> None:
+        if parent is None or not parent.isValid():
+            self._load_page(notify=True)
+
+    def latest_entry(self) -> HistoryEntry | None:
+        """The newest entry overall, whatever the filter shows."""
+        return self._resolve(self._latest) if self._latest is not None else None
+
+    def is_latest(self, entry: HistoryEntry) -> bool:
+        latest = self._latest
+        return latest is not None and (latest.mode, latest.shift, latest.fingerprint) == (
+            entry.mode,
+            entry.shift,
+            entry.fingerprint,
+        )
+
+    def prepend(self, entry: HistoryEntry) -> None:
+        """Queue ``entry`` for the store and show it on top (unless filtered)."""
+        entry.label()  # cache the previews now; the writer thread compresses the source
+        self._store.add(entry)
+        self._latest = entry
+        self._pending.insert(0, entry)
+        self._pending_bytes += entry.size
+        while self._pending_bytes > self._max_bytes and len(self._pending) > 1:
+            self._forget(self._pending[-1], None)
+        if self._query and not _matches(self._query, entry):
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), 0, 0)
+        self._rows.insert(0, entry)
+        self.endInsertRows()
+        if len(self._rows) > self._capacity:  # the store keeps no more than this either
+            self.beginRemoveRows(QtCore.QModelIndex(), self._capacity, len(self._rows) - 1)
+            del self._rows[self._capacity :]
+            self._exhausted = True
+            self.endRemoveRows()
+
+    def set_filter(self, query: str) -> None:
+        """Show only entries whose previews match every word of ``query``."""
+        query = query.strip()
+        if query == self._query:
+            return
+        self.beginResetModel()
+        self._query = query
+        self._rows = [entry for entry in self._pending if not query or _matches(query, entry)]
+        self._oldest_id, self._exhausted = None, False
+        self._load_page()
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self._store.clear()
+        self._pending_clears += 1
+        self.beginResetModel()
+        self._rows, self._oldest_id, self._exhausted = [], None, True
+        self._pending, self._pending_bytes = [], 0
+        self._latest = None
+        self.endResetModel()
+
+    def _apply_commit(self, written: list[tuple[HistoryEntry, StoredEntry]], cleared: bool) -> None:
+        """Swap committed entries for their source-less rows (GUI thread)."""
+        if cleared:
+            self._pending_clears -= 1
+        for entry, stored in written:
+            self._newest_id = max(self._newest_id or 0, stored.id)
+            if any(item is entry for item in self._pending):
+                self._forget(entry, stored)
+            if self._latest is entry:
+                self._latest = stored
+
+    def _forget(self, entry: HistoryEntry, stored: StoredEntry | None) -> None:
+        """Stop holding ``entry``'s source: show ``stored`` in its place, or drop the row."""
+        self._pending = [item for item in self._pending if item is not entry]
+        self._pending_bytes -= entry.size
+        for row, item in enumerate(self._rows):
+            if item is entry:
+                if stored is not None:
+                    self._rows[row] = stored
+                else:
+                    self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+                    del self._rows[row]
+                    self.endRemoveRows()
+                break
+
+    def _load_page(self, *, notify: bool = False) -> None:
+        if self._exhausted:
+            return
+        if self._pending_clears:  # the store may still hold rows from before the clear
+            self._exhausted = True
+            return
+        before = self._oldest_id
+        if before is None and self._newest_id is not None:
+            before = self._newest_id + 1  # newer rows are shown as pending entries
+        rows = self._store.page(before, self._page_size, self._query)
+        room = self._capacity - len(self._rows)
+        if len(rows) < self._page_size or len(rows) >= room:
+            self._exhausted = True
+        rows = rows[:room]
+        if not rows:
+            return
+        first = len(self._rows)
+        if notify:
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._oldest_id = rows[-1].id
+        if notify:
+            self.endInsertRows()
+
+    def _resolve(self, item: HistoryEntry | StoredEntry) -> HistoryEntry | None:
+        if isinstance(item, HistoryEntry):
+            return item
+        return self._store.load(item.id)
+
+
+def _matches(query: str, entry: HistoryEntry) -> bool:
+    """``HistoryStore.page``'s search for an entry not stored yet: every word is a prefix."""
+    terms = _WORD.findall(query.casefold())
+    words = set(_WORD.findall(" ".join(entry.preview_texts()).casefold()))
+    return bool(terms) and all(any(word.startswith(term) for word in words) for term in terms)
+
+
+class HistoryPanel(QtWidgets.QTableView):
+    """Single-column view of the most recent transformations.
+
+    A ``QTableView`` with fixed row heights is used rather than a
+    ``QListView``: the list view lays out every row again after each insert,
+    while the table only paints the visible rows.
+
+    Without a ``store`` the history lives in memory (``HistoryModel``). With
+    one it is read from and written to the store (``StoredHistoryModel``)
+    and ``search_box`` holds a line edit that filters it; the owner decides
+    where to place that box.
+    """
 
     entryActivated = QtCore.pyqtSignal(HistoryEntry)
 
@@ -48,62 +488,80 @@ class HistoryPanel(QtWidgets.QListWidget):
         parent: QtWidgets.QWidget | None = None,
         *,
         max_entries: int = HISTORY_LIMIT,
+        max_bytes: int = HISTORY_BYTES_BUDGET,
+        store: HistoryStore | None = None,
     ) -> None:
         super().__init__(parent)
-        self._max_entries = max_entries
-        self._entries: list[HistoryEntry] = []
+        self._model: HistoryModel | StoredHistoryModel
+        if store is None:
+            self._model = HistoryModel(max_entries, self, max_bytes=max_bytes)
+        else:
+            self._model = StoredHistoryModel(store, self, capacity=max_entries, max_bytes=max_bytes)
+        self.setModel(self._model)
+        self.search_box: QtWidgets.QLineEdit | None = None
+        if store is not None:
+            self.search_box = QtWidgets.QLineEdit()
+            self.search_box.setPlaceholderText("Search history…")
+            self.search_box.setClearButtonEnabled(True)
+            self.search_box.setFixedWidth(320)
+            self.search_box.textChanged.connect(self.set_filter)
         self.setObjectName("historyList")
         self.list_widget = self  # compatibility with legacy tests
-        self.setUniformItemSizes(True)
+        self.horizontalHeader().hide()  # type: ignore[union-attr]
+        self.horizontalHeader().setStretchLastSection(True)  # type: ignore[union-attr]
+        rows = self.verticalHeader()
+        rows.hide()  # type: ignore[union-attr]
+        rows.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)  # type: ignore[union-attr]
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.setTextElideMode(QtCore.Qt.TextElideMode.ElideRight)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         font = self.font()
         font.setPointSize(10)
         self.setFont(font)
+        rows.setDefaultSectionSize(QtGui.QFontMetrics(font).height() + 12)  # type: ignore[union-attr]
         self.setFixedWidth(320)
         self.setStyleSheet(
             f"""
-            QListWidget#historyList {{
+            QTableView#historyList {{
                 font-family: {MONOSPACE_FALLBACK};
                 font-size: 10px;
             }}
             """
         )
-        self.itemActivated.connect(self._emit_entry)
+        self.activated.connect(self._emit_entry)
+
+    def history_model(self) -> HistoryModel | StoredHistoryModel:
+        return self._model
+
+    def count(self) -> int:
+        """Number of entries shown (``QListWidget.count`` compatible)."""
+        return self._model.rowCount()
 
     def add_entry(self, entry: HistoryEntry) -> None:
         """Insert the new entry at the top and enforce the limit."""
-        if self._entries and self._entries[0] == entry:
+        if self._model.is_latest(entry):
             return
-        self._entries.insert(0, entry)
-        if len(self._entries) > self._max_entries:
-            self._entries = self._entries[: self._max_entries]
-        self._refresh()
+        self._model.prepend(entry)
 
     def latest_entry(self) -> HistoryEntry | None:
-        return self._entries[0] if self._entries else None
-
-    def clear(self) -> None:  # type: ignore[override]
-        self._entries.clear()
-        super().clear()
-
-    def _refresh(self) -> None:
-        self.blockSignals(True)
-        super().clear()
-        for entry in self._entries:
-            item = QtWidgets.QListWidgetItem(entry.label())
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, entry)
-            item.setToolTip(
-                f"{entry.mode} shift={entry.shift}\nLetters={entry.letters} Words={entry.words}\n{entry.source} → {entry.result}"
-            )
-            self.addItem(item)
-        self.clearSelection()
-        self.blockSignals(False)
-
-    def _emit_entry(self, item: QtWidgets.QListWidgetItem) -> None:
-        entry = item.data(QtCore.Qt.ItemDataRole.UserRole)
-        if isinstance(entry, HistoryEntry):
+        return self._model.latest_entry()
+
+    def clear(self) -> None:
+        self._model.clear()
+
+    def set_filter(self, query: str) -> None:
+        """Show only entries matching ``query``; needs a store, ignored otherwise."""
+        if isinstance(self._model, StoredHistoryModel):
+            self._model.set_filter(query)
+
+    def _emit_entry(self, index: QtCore.QModelIndex) -> None:
+        entry = self._model.entry(index.row())
+        if entry is not None:
             self.entryActivated.emit(entry)
 
 
-__all__ = ["HistoryPanel", "HistoryEntry"]
+__all__ = ["HistoryEntry", "HistoryModel", "HistoryPanel", "StoredHistoryModel"]
@@ -44,6 +44,11 @@ class MappingTableWidget(QtWidgets.QTableWidget):
             }
             """
         )
+        self._plain_label = ("Plain", QtGui.QBrush(QtGui.QColor("#00FFAA")))
+        self._cipher_label = ("Cipher", QtGui.QBrush(QtGui.QColor("#ffa94d")))
+        for row in range(2):
+            self.setVerticalHeaderItem(row, QtWidgets.QTableWidgetItem())
+        self._header_mode: bool | None = None
         self._apply_header_labels(encode_mode=True)
         self.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
@@ -70,61 +75,87 @@ class MappingTableWidget(QtWidgets.QTableWidget):
             """
         )
 
+        # Brushes and the 52 cells are created once; updates only touch the
+        # cells whose letter or highlight actually changed.
+        self._brush_plain = QtGui.QBrush(self._highlight_plain)
+        self._brush_cipher = QtGui.QBrush(self._highlight_cipher)
+        self._brush_muted = (QtGui.QBrush(self._muted_top), QtGui.QBrush(self._muted_bottom))
+        text_brush = QtGui.QBrush(self._text)
+        for row in range(2):
+            for column in range(len(LOWER)):
+                item = QtWidgets.QTableWidgetItem("")
+                item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+                item.setForeground(text_brush)
+                item.setBackground(self._brush_muted[row])
+                item.setSizeHint(QtCore.QSize(item.sizeHint().width(), 52))
+                self.setItem(row, column, item)
+
         self._highlight_indices: set[int] = set()
+        self._rows = ("", "")
+        self._encode_mode = True
+        self._painted: set[int] = set()
 
     def set_highlights(self, indices: set[int]) -> None:
-        """Store the indices to highlight on next update."""
-        self._highlight_indices = indices
+        """Highlight ``indices``, repainting only the columns that changed."""
+        self._highlight_indices = set(indices)
+        if self._rows[0]:
+            self._refresh(self._rows[0], self._rows[1], self._encode_mode)
 
     def update_mapping(self, shifted: str, *, encode_mode: bool) -> None:
         """Render the alphabet rows with optional highlights."""
         top_row = LOWER if encode_mode else shifted
         bottom_row = shifted if encode_mode else LOWER
         self._apply_header_labels(encode_mode)
-
-        highlight_plain = QtGui.QBrush(self._highlight_plain)
-        highlight_cipher = QtGui.QBrush(self._highlight_cipher)
-        muted_brush_top = QtGui.QBrush(self._muted_top)
-        muted_brush_bottom = QtGui.QBrush(self._muted_bottom)
-        text_brush = QtGui.QBrush(self._text)
-
-        for index, (top_char, bottom_char) in enumerate(zip(top_row, bottom_row)):
-            top_item = QtWidgets.QTableWidgetItem(top_char)
-            top_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            top_item.setForeground(text_brush)
-            top_highlight = highlight_plain if encode_mode else highlight_cipher
-            top_item.setBackground(
-                top_highlight if index in self._highlight_indices else muted_brush_top
-            )
-            top_item.setSizeHint(QtCore.QSize(top_item.sizeHint().width(), 52))
-
-            bottom_item = QtWidgets.QTableWidgetItem(bottom_char)
-            bottom_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            bottom_item.setForeground(text_brush)
-            bottom_highlight = highlight_cipher if encode_mode else highlight_plain
-            bottom_item.setBackground(
-                bottom_highlight if index in self._highlight_indices else muted_brush_bottom
-            )
-            bottom_item.setSizeHint(QtCore.QSize(bottom_item.sizeHint().width(), 52))
-
-            self.setItem(0, index, top_item)
-            self.setItem(1, index, bottom_item)
-
-        # no-op; height fixed via minimum height to mirror legacy UI
+        self._refresh(top_row, bottom_row, encode_mode)
+
+    def _refresh(self, top_row: str, bottom_row: str, encode_mode: bool) -> None:
+        old_top, old_bottom = self._rows
+        mode_changed = encode_mode != self._encode_mode
+        highlights = self._highlight_indices
+        changed: list[int] = []
+        for index in range(len(LOWER)):
+            lit = index in highlights
+            was_lit = index in self._painted
+            if (
+                old_top[index : index + 1] != top_row[index]
+                or old_bottom[index : index + 1] != bottom_row[index]
+                or lit != was_lit
+                or (lit and mode_changed)
+            ):
+                changed.append(index)
+        self._rows = (top_row, bottom_row)
+        self._encode_mode = encode_mode
+        self._painted = set(highlights)
+        if not changed:
+            return
+
+        top_highlight = self._brush_plain if encode_mode else self._brush_cipher
+        bottom_highlight = self._brush_cipher if encode_mode else self._brush_plain
+        model = cast(QtCore.QAbstractItemModel, self.model())
+        blocked = model.blockSignals(True)  # one dataChanged below instead of one per setter
+        try:
+            for index in changed:
+                lit = index in highlights
+                top_item = cast(QtWidgets.QTableWidgetItem, self.item(0, index))
+                bottom_item = cast(QtWidgets.QTableWidgetItem, self.item(1, index))
+                top_item.setText(top_row[index])
+                top_item.setBackground(top_highlight if lit else self._brush_muted[0])
+                bottom_item.setText(bottom_row[index])
+                bottom_item.setBackground(bottom_highlight if lit else self._brush_muted[1])
+        finally:
+            model.blockSignals(blocked)
+        model.dataChanged.emit(model.index(0, changed[0]), model.index(1, changed[-1]))
 
     def _apply_header_labels(self, encode_mode: bool) -> None:
-        """Tint header labels to match accent colours for each row."""
-        plain_item = QtWidgets.QTableWidgetItem("Plain")
-        plain_item.setForeground(QtGui.QBrush(QtGui.QColor("#00FFAA")))
-        cipher_item = QtWidgets.QTableWidgetItem("Cipher")
-        cipher_item.setForeground(QtGui.QBrush(QtGui.QColor("#ffa94d")))
-
-        if encode_mode:
-            self.setVerticalHeaderItem(0, plain_item)
-            self.setVerticalHeaderItem(1, cipher_item)
-        else:
-            self.setVerticalHeaderItem(0, cipher_item)
-            self.setVerticalHeaderItem(1, plain_item)
+        """Swap the Plain/Cipher row labels when the mode changes."""
+        if encode_mode == self._header_mode:
+            return
+        self._header_mode = encode_mode
+        labels = (self._plain_label, self._cipher_label)
+        for row, (text, brush) in enumerate(labels if encode_mode else labels[::-1]):
+            item = cast(QtWidgets.QTableWidgetItem, self.verticalHeaderItem(row))
+            item.setText(text)
+            item.setForeground(brush)
 
 
 __all__ = ["MappingTableWidget"]
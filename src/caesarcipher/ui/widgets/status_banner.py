@@ -15,6 +15,8 @@ class StatusBanner(QtWidgets.QLabel):
         self.setWordWrap(True)
         self.setMargin(0)
         self.setMinimumHeight(40)
+        self._mode_text = ""
+        self._busy = False
 
     def set_mode(
         self,
@@ -35,7 +37,19 @@ class StatusBanner(QtWidgets.QLabel):
             f"{mode} mode: {source_label} '{source_char}' → {target_label} '{target_char}' "
             f"(shift {sign}{shift}, mod 26)"
         )
-        self.setText(text)
+        self._mode_text = text
+        self._render()
+
+    def set_busy(self, busy: bool) -> None:
+        """Show or clear the "computing…" state used while a background job runs."""
+        self._busy = busy
+        self._render()
+
+    def is_busy(self) -> bool:
+        return self._busy
+
+    def _render(self) -> None:
+        self.setText(f"{self._mode_text} · computing…" if self._busy else self._mode_text)
 
 
 __all__ = ["StatusBanner"]
@@ -1,6 +1,7 @@
 import pytest
 
 from caesarcipher.core.crypto import caesar
+from caesarcipher.core.view import CipherView
 
 
 def test_caesar_encode_decode_roundtrip():
@@ -21,3 +22,32 @@ def test_caesar_rejects_out_of_range_shift():
         caesar("abc", 0)
     with pytest.raises(ValueError):
         caesar("abc", 40)
+
+
+def test_cipher_view_matches_eager_transform():
+    text = "Attack at dawn! " * 500
+    view = CipherView(text, 7, block_size=64, cached_blocks=4)
+    expected = caesar(text, 7)
+
+    assert len(view) == len(expected)
+    assert str(view) == expected
+    assert view == expected
+    assert view[0] == expected[0]
+    assert view[-1] == expected[-1]
+    assert view[100:400] == expected[100:400]
+    assert view[5000:] == expected[5000:]
+    assert view[::3] == expected[::3]
+    assert "".join(view) == expected
+    with pytest.raises(IndexError):
+        view[len(text)]
+
+
+def test_cipher_view_only_translates_requested_blocks():
+    text = "abc" * 10_000
+    view = CipherView(text, 1, encode=False, block_size=100, cached_blocks=2)
+    assert view[150:160] == caesar(text[150:160], 1, encode=False)
+    assert view._blocks.keys() == {1}
+    view[10]
+    view[999]
+    view[20_000]
+    assert len(view._blocks) == 2
@@ -0,0 +1,130 @@
+import threading
+import zlib
+
+import pytest
+from PyQt6 import QtCore
+
+from caesarcipher.config.defaults import HISTORY_COMPRESS_THRESHOLD, HISTORY_PAGE_SIZE
+from caesarcipher.logic.history_store import HistoryStore, StoredEntry
+from caesarcipher.ui.main_window import CaesarWindow
+from caesarcipher.ui.widgets.history_panel import HistoryEntry, StoredHistoryModel
+
+
+def _entry(source: str, shift: int = 3) -> HistoryEntry:
+    return HistoryEntry(mode="ENC", shift=shift, letters=0, words=0, source=source)
+
+
+def test_store_keeps_entries_across_sessions(tmp_path):
+    path = tmp_path / "history.sqlite3"
+    store = HistoryStore(path)
+    for idx in range(3):
+        store.add(_entry(f"hello {idx}"))
+    store.close()
+
+    store = HistoryStore(path)
+    try:
+        assert store._reader.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        rows = store.page()
+        assert [row.label() for row in rows] == [_entry(f"hello {idx}").label() for idx in (2, 1, 0)]
+        assert [row.id for row in store.page(before=rows[0].id, limit=1)] == [rows[1].id]
+
+        entry = store.load(rows[0].id)
+        assert entry == _entry("hello 2")
+        assert (entry.source, entry.result) == ("hello 2", "khoor 2")
+        assert store.load(-1) is None
+    finally:
+        store.close()
+
+
+def test_store_searches_previews_and_keeps_the_newest_entries(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite3", max_entries=50)
+    try:
+        for idx in range(60):
+            store.add(_entry(f"entry {idx} {'zebra' if idx % 10 == 0 else 'lion'}", shift=1))
+        store.flush()
+        assert store.count() == 50
+
+        def numbers(query: str) -> list[str]:
+            return [row.label().split()[1] for row in store.page(query=query)]
+
+        assert numbers("zeb") == ["50", "40", "30", "20", "10"]  # entry 0 was trimmed
+        assert numbers("afcsb") == numbers("zebra")  # results are indexed too
+        assert numbers("lion 15") == ["15"]
+        assert numbers('" ;') == []
+        assert store.last_error is None
+
+        store.clear()
+        store.flush()
+        assert store.page() == []
+    finally:
+        store.close()
+
+
+def test_window_pages_and_searches_the_stored_history(qapp, tmp_path):
+    path = tmp_path / "history.sqlite3"
+    store = HistoryStore(path)
+    for idx in range(450):
+        store.add(_entry(f"archived message {idx}"))
+    store.flush()
+
+    window = CaesarWindow(history_store=store)
+    panel = window.history_panel
+    model = panel.history_model()
+    assert panel.count() == HISTORY_PAGE_SIZE
+    while model.canFetchMore(QtCore.QModelIndex()):
+        model.fetchMore(QtCore.QModelIndex())
+    assert panel.count() == 450
+
+    window.input_edit.setPlainText("meet me at the usual place")
+    window.controller.force_history_capture()
+    assert panel.count() == 451
+    assert panel.latest_entry().source == "meet me at the usual place"
+
+    assert panel.search_box is not None
+    panel.search_box.setText("usual")
+    assert panel.count() == 1
+    panel.activated.emit(model.index(0))
+    assert window.input_edit.toPlainText() == "phhw ph dw wkh xvxdo sodfh"
+    assert window.decode_btn.isChecked()
+
+    panel.search_box.setText("message 44")
+    assert panel.count() == 11  # 44 and 440-449
+    panel.search_box.clear()
+    assert panel.count() == HISTORY_PAGE_SIZE + 1  # the new entry is shown on top of a page
+    window.close()
+    store.close()
+
+    reopened = HistoryStore(path)
+    try:
+        assert reopened.count() == 451
+        assert reopened.load(reopened.page(limit=1)[0].id).source == "meet me at the usual place"
+    finally:
+        reopened.close()
+
+
+def test_stored_model_swaps_committed_entries_and_bounds_pending_sources(qapp, tmp_path, monkeypatch):
+    store = HistoryStore(tmp_path / "history.sqlite3")
+    monkeypatch.setattr(store, "flush", lambda: pytest.fail("the GUI thread waited for the writer"))
+    compressing = []
+    compress = zlib.compress
+    monkeypatch.setattr(zlib, "compress", lambda *args: (compressing.append(threading.current_thread()), compress(*args))[1])
+    size = HISTORY_COMPRESS_THRESHOLD
+    model = StoredHistoryModel(store, max_bytes=3 * size)
+    try:
+        entries = [_entry(f"note {idx} " + "x" * size) for idx in range(4)]
+        for entry in entries:
+            model.prepend(entry)
+        assert model.rowCount() == 2  # the two oldest sources no longer fit the budget
+        model.set_filter("note 3")
+        assert model.entry(0) is entries[3]  # found before the writer commits it
+
+        store._queue.join()
+        qapp.processEvents()
+        assert compressing and threading.main_thread() not in compressing
+        assert model._pending == []
+        assert isinstance(model._rows[0], StoredEntry)
+        assert model.entry(0) == entries[3]
+        model.set_filter("")
+        assert model.rowCount() == 4
+    finally:
+        store.close()
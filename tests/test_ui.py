@@ -1,3 +1,6 @@
+import pytest
+
+from caesarcipher.core.view import CipherView
 from caesarcipher.ui.main_window import CaesarWindow
 from caesarcipher.ui.widgets.history_panel import HistoryEntry, HistoryPanel
 from caesarcipher.ui.widgets.mapping_table import MappingTableWidget
@@ -12,7 +15,6 @@ def test_history_panel_adds_and_limits_entries(qapp):
             letters=idx + 1,
             words=1,
             source=f"text {idx}",
-            result=f"cipher {idx}",
         )
         panel.add_entry(entry)
 
@@ -22,6 +24,73 @@ def test_history_panel_adds_and_limits_entries(qapp):
     assert latest.source == "text 4"
 
 
+def test_history_model_keeps_newest_entries_in_a_ring(qapp):
+    from PyQt6 import QtCore
+
+    panel = HistoryPanel(max_entries=4)
+    activated = []
+    panel.entryActivated.connect(activated.append)
+    entries = [
+        HistoryEntry(mode="ENC", shift=3, letters=idx, words=1, source=f"text {idx}")
+        for idx in range(10)
+    ]
+    for entry in entries:
+        panel.add_entry(entry)
+    panel.add_entry(entries[-1])  # repeats of the newest entry are ignored
+
+    model = panel.history_model()
+    assert [model.entry(row) for row in range(panel.count())] == entries[:5:-1]
+    assert model.data(model.index(0)) == entries[9].label()
+    assert "Letters=9 Words=1" in model.data(model.index(0), QtCore.Qt.ItemDataRole.ToolTipRole)
+    panel.activated.emit(model.index(2))
+    assert activated == [entries[7]]
+
+    panel.clear()
+    assert panel.count() == 0 and panel.latest_entry() is None
+
+
+def test_history_entries_store_compressed_sources_within_a_budget(qapp):
+    from caesarcipher.config.defaults import HISTORY_COMPRESS_THRESHOLD
+    from caesarcipher.core.crypto import caesar
+
+    text = "attack   at\ndawn " * (HISTORY_COMPRESS_THRESHOLD // 8)
+    entry = HistoryEntry(mode="ENC", shift=3, letters=0, words=0, source=text)
+    assert entry.label() == "attack at dawn attack at dawn attack at dawn… → dwwdfn dw gdzq dwwdfn dw gdzq dwwdfn dw gdzq…"
+    assert not hasattr(entry, "__dict__")
+
+    entry.compact()  # what the model does when the entry is stored
+    assert entry.size < len(text) // 100
+    panel = HistoryPanel(max_bytes=3 * entry.size)
+    panel.add_entry(entry)
+    assert entry.source == text
+    assert entry.result == caesar(text, 3)
+
+    for idx in range(5):
+        panel.add_entry(HistoryEntry(mode="DEC", shift=idx + 1, letters=0, words=0, source=text))
+    model = panel.history_model()
+    assert panel.count() == 3
+    assert [model.entry(row).shift for row in range(3)] == [5, 4, 3]
+    assert model.total_bytes <= 3 * entry.size
+
+
+def test_history_dedupe_compares_fingerprints(qapp, monkeypatch):
+    from caesarcipher.config.defaults import HISTORY_COMPRESS_THRESHOLD
+    from caesarcipher.ui.widgets import history_panel
+
+    text = "veni vidi vici " * (HISTORY_COMPRESS_THRESHOLD // 10)
+    panel = HistoryPanel()
+    stored = HistoryEntry(mode="ENC", shift=3, letters=0, words=0, source=text)
+    panel.add_entry(stored)
+    monkeypatch.setattr(history_panel.zlib, "decompress", lambda *args: pytest.fail("source was decompressed"))
+
+    pending = HistoryEntry(mode="ENC", shift=3, letters=0, words=0, source="".join(reversed(text))[::-1])
+    assert pending == stored and hash(pending) == hash(stored)
+    panel.add_entry(pending)
+    assert panel.count() == 1
+    assert HistoryEntry(mode="DEC", shift=3, letters=0, words=0, source=text) != stored
+    assert HistoryEntry(mode="ENC", shift=3, letters=0, words=0, source=text + " ") != stored
+
+
 def test_mapping_table_updates_rows(qapp):
     table = MappingTableWidget()
     table.update_mapping("defghijklmnopqrstuvwxyzabc", encode_mode=True)
@@ -54,3 +123,284 @@ def test_window_controller_updates_output_and_history(qapp):
     assert latest.result == "xyz"
 
     window.close()
+
+
+def test_controller_exposes_lazy_result_view(qapp, monkeypatch):
+    window = CaesarWindow()
+    window.input_edit.setPlainText("hello")
+    view = window.controller.result_view
+    assert isinstance(view, CipherView)
+    assert view[:3] == "kho"
+    assert str(view) == window.output_edit.toPlainText()
+
+    applied = []
+    original = window.controller._apply_snapshot
+    monkeypatch.setattr(
+        window.controller,
+        "_apply_snapshot",
+        lambda snapshot, *args, **kwargs: (applied.append(snapshot), original(snapshot, *args, **kwargs)),
+    )
+    reads = []
+    read = window.input_edit.toPlainText
+    monkeypatch.setattr(window.input_edit, "toPlainText", lambda: (reads.append(1), read())[1])
+    window.input_edit.textCursor().insertText("big ")  # patched in place: the input is not even read
+    assert [(snapshot.text, snapshot.result) for snapshot in applied] == [(None, None)]
+    assert reads == []
+    view = window.controller.result_view
+    assert isinstance(view, CipherView)
+    assert window.controller.result_view is view
+    assert view[:4] == "elj "
+    assert window.output_edit.toPlainText() == "elj khoor"
+
+    window.input_edit.clear()
+    assert window.controller.result_view is None
+    window.close()
+
+
+def test_controller_patches_output_for_edits(qapp, monkeypatch):
+    from PyQt6 import QtGui
+
+    from caesarcipher.core.crypto import caesar
+
+    window = CaesarWindow()
+    window.input_edit.setPlainText("hello world\nsecond line")
+    renders = []
+    original = window.output_edit.setPlainText
+    monkeypatch.setattr(window.output_edit, "setPlainText", lambda text: (renders.append(text), original(text)))
+
+    cursor = window.input_edit.textCursor()
+    cursor.setPosition(5)
+    cursor.insertText(", Brave\nnew")
+    cursor.setPosition(0)
+    cursor.setPosition(3, QtGui.QTextCursor.MoveMode.KeepAnchor)
+    cursor.removeSelectedText()
+
+    text = window.input_edit.toPlainText()
+    assert text == "lo, Brave\nnew world\nsecond line"
+    assert window.output_edit.toPlainText() == caesar(text, 3)
+    assert renders == []
+    assert not window.output_edit.document().isUndoRedoEnabled()
+
+    window.shift_spin.setValue(5)
+    assert renders == [caesar(text, 5)]
+    window.close()
+
+
+def test_controller_batches_bursts_into_one_recompute(qapp, monkeypatch):
+    window = CaesarWindow()
+    window.input_edit.setPlainText("attack at dawn")
+    recomputes = []
+    original = window.status_banner.set_mode  # runs once per recompute
+    monkeypatch.setattr(
+        window.status_banner, "set_mode", lambda **kwargs: (recomputes.append(kwargs), original(**kwargs))[1]
+    )
+
+    window.decode_btn.setChecked(True)
+    recomputes.clear()
+    window.controller.apply_rot13()
+    assert len(recomputes) == 1
+    assert window.output_edit.toPlainText() == "nggnpx ng qnja"
+
+    recomputes.clear()
+    with window.controller.batch():
+        window.shift_spin.setValue(1)
+        with window.controller.batch():
+            window.input_edit.setPlainText("abc")
+        assert recomputes == []
+    assert len(recomputes) == 1
+    assert window.output_edit.toPlainText() == "bcd"
+
+    recomputes.clear()
+    window.controller.reset()
+    assert len(recomputes) == 1
+    assert window.input_edit.toPlainText() == window.output_edit.toPlainText() == ""
+    assert window.shift_spin.value() == 3
+    window.close()
+
+
+def test_large_inputs_run_in_background_and_stale_jobs_are_dropped(qapp, monkeypatch):
+    from caesarcipher.config import defaults
+    from caesarcipher.core.crypto import caesar
+
+    monkeypatch.setattr(defaults, "BACKGROUND_THRESHOLD", 16)
+    monkeypatch.setattr(defaults, "BACKGROUND_CHUNK", 8)
+    window = CaesarWindow()
+    applied = []
+    original = window.controller._apply_snapshot
+    monkeypatch.setattr(
+        window.controller, "_apply_snapshot", lambda snapshot, *args: (applied.append(snapshot), original(snapshot, *args))
+    )
+
+    text = "the quick brown fox jumps over the lazy dog\n" * 50
+    window.input_edit.setPlainText(text)
+    assert window.status_banner.is_busy()
+    window.shift_spin.setValue(7)  # supersedes the job started by the paste
+    assert window.controller.wait_for_background(5000)
+
+    assert [snapshot.shift for snapshot in applied] == [7]
+    assert window.output_edit.toPlainText() == caesar(text, 7)
+    assert not window.status_banner.is_busy()
+    window.controller.force_history_capture()
+    latest = window.history_panel.latest_entry()
+    assert latest is not None
+    assert (latest.letters, latest.words) == (35 * 50, 9 * 50)
+    window.close()
+
+
+def test_shift_scrubbing_uses_precomputed_outputs(qapp, monkeypatch):
+    from PyQt6 import QtCore
+
+    from caesarcipher.config import defaults
+    from caesarcipher.core.crypto import caesar
+    from caesarcipher.logic import controller as controller_module
+
+    monkeypatch.setattr(defaults, "BACKGROUND_THRESHOLD", 64)
+    monkeypatch.setattr(defaults, "PRECOMPUTE_THRESHOLD", 64)
+    monkeypatch.setattr(defaults, "PRECOMPUTE_DELAY_MS", 0)
+    window = CaesarWindow()
+    text = "Sphinx of black quartz, judge my vow.\n" * 20
+    window.input_edit.setPlainText(text)
+    assert window.controller.wait_for_background(5000)
+    for _ in range(5):  # let the zero-delay precompute timer fire
+        QtCore.QCoreApplication.processEvents()
+    assert window.controller.wait_for_background(5000)
+    assert len(window.controller.shift_cache) == 25
+
+    work = []
+    for name in ("translation_table", "_index_text"):
+        original = getattr(controller_module, name)
+        monkeypatch.setattr(
+            controller_module, name, lambda *args, _o=original, _n=name, **kw: (work.append(_n), _o(*args, **kw))[1]
+        )
+
+    for shift in (4, 5, 11, 25):
+        window.shift_spin.setValue(shift)
+        assert not window.status_banner.is_busy()
+        assert window.output_edit.toPlainText() == caesar(text, shift)
+    window.decode_btn.setChecked(True)
+    assert window.output_edit.toPlainText() == caesar(text, 25, encode=False)
+    assert work == []
+    window.close()
+
+
+def test_shift_cache_evicts_by_total_size():
+    from caesarcipher.logic.shift_cache import ShiftCache, rotation, text_fingerprint
+
+    cache = ShiftCache(budget=10)
+    first, second = text_fingerprint("abcd"), text_fingerprint("wxyz")
+    assert cache.put(first, 1, "bcde") and cache.put(first, 2, "cdef")
+    assert cache.get(first, 1) == "bcde"  # now most recently used
+    assert cache.put(second, 1, "xyza")
+    assert (cache.get(first, 2), cache.get(first, 1), cache.size) == (None, "bcde", 8)
+    assert not cache.put(second, 2, "x" * 11)
+    assert rotation(3, True) == rotation(23, False) == 3
+
+
+def test_mapping_table_updates_only_changed_cells(qapp):
+    table = MappingTableWidget()
+    shifted = "defghijklmnopqrstuvwxyzabc"
+    table.update_mapping(shifted, encode_mode=True)
+    items = [table.item(0, 0), table.item(1, 25)]
+    ranges = []
+    table.model().dataChanged.connect(lambda top, bottom: ranges.append((top.column(), bottom.column())))
+
+    table.set_highlights({2, 7})
+    table.update_mapping(shifted, encode_mode=True)
+    assert ranges == [(2, 7)]
+    assert table.item(0, 2).background().color().name() == "#00ffaa"
+    assert table.item(0, 3).background().color().name() == "#1a1f24"
+
+    ranges.clear()
+    table.set_highlights({2})
+    table.update_mapping(shifted, encode_mode=True)
+    assert ranges == [(7, 7)]
+    assert [table.item(0, 0), table.item(1, 25)] == items  # cells are reused, not rebuilt
+
+    table.update_mapping(shifted, encode_mode=False)
+    assert [table.verticalHeaderItem(row).text() for row in range(2)] == ["Cipher", "Plain"]
+    assert table.item(0, 2).background().color().name() == "#ffa94d"
+
+
+def test_window_highlights_letters_of_input(qapp):
+    window = CaesarWindow()
+    window.input_edit.setPlainText("b")
+    assert window.mapping_table.item(0, 1).background().color().name() == "#00ffaa"
+    assert window.mapping_table.item(0, 0).background().color().name() == "#1a1f24"
+    window.close()
+
+
+def test_background_results_repaint_highlights(qapp, monkeypatch):
+    from caesarcipher.config import defaults
+
+    monkeypatch.setattr(defaults, "BACKGROUND_THRESHOLD", 16)
+    window = CaesarWindow()
+    table = window.mapping_table
+
+    def painted() -> set[int]:
+        return {column for column in range(26) if table.item(0, column).background().color().name() == "#00ffaa"}
+
+    window.input_edit.setPlainText("abc " * 10)
+    assert window.controller.wait_for_background(5000)
+    assert painted() == {0, 1, 2}
+    window.input_edit.setPlainText("xyz " * 10)
+    assert window.controller.wait_for_background(5000)
+    assert painted() == {23, 24, 25}
+    window.close()
+
+
+def test_text_index_matches_full_scans_under_random_edits():
+    import random
+
+    from caesarcipher.core.crypto import LOWER
+    from caesarcipher.logic.controller import _collect_indices, _resolve_focus_index
+    from caesarcipher.logic.text_index import TextIndex
+
+    rng = random.Random(46)
+    alphabet = "abcXYZ  \n\t.,-é\u212a"
+    text = "Hello, world"
+    index = TextIndex.from_text(text)
+    for _ in range(500):
+        position = rng.randint(0, len(text))
+        removed = text[position : position + rng.randint(0, 4)]
+        added = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 4)))
+        text = text[:position] + added + text[position + len(removed) :]
+        index.apply_edit(position, removed, added, lambda start, end, text=text: text[start:end])
+
+        present = _collect_indices(text, LOWER, True)
+        assert index.present() == present
+        expected_last = _resolve_focus_index(text, True, LOWER, present) if present else None
+        assert index.last_letter == expected_last
+        assert (index.letters, index.words) == (sum(ch.isalpha() for ch in text), len(text.split()))
+
+
+def test_typing_updates_highlights_without_rescanning(qapp, monkeypatch):
+    from PyQt6 import QtGui
+
+    from caesarcipher.core.crypto import LOWER
+    from caesarcipher.logic import controller as controller_module
+
+    window = CaesarWindow()
+    window.decode_btn.setChecked(True)
+    window.input_edit.setPlainText("Zebra crossing")
+    scans = []
+    original = controller_module._index_text
+    monkeypatch.setattr(controller_module, "_index_text", lambda *args: (scans.append(args), original(*args))[1])
+
+    cursor = window.input_edit.textCursor()
+    cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+    cursor.insertText(" at night!")
+    cursor.setPosition(0)
+    cursor.setPosition(6, QtGui.QTextCursor.MoveMode.KeepAnchor)
+    cursor.removeSelectedText()
+    cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+    cursor.deletePreviousChar()
+    cursor.deletePreviousChar()  # drops the last letter, so focus moves back to "h"
+
+    text = window.input_edit.toPlainText()
+    assert text == "crossing at nigh"
+    card = window.controller.deps.focus_card
+    shifted = LOWER[3:] + LOWER[:3]
+    assert window.controller._highlight_indices == controller_module._collect_indices(text, shifted, False)
+    assert (card.left_label.text(), card.right_label.text()) == ("H", "E")
+    assert scans == []
+    window.close()